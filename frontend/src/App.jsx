@@ -7,11 +7,22 @@
  * - Option 3: deck.gl (GlobeView for 3D rotating globe)
  */
 
-import { useState } from 'react';
+import { lazy, Suspense, useState } from 'react';
 import { MantineProvider } from '@mantine/core';
-import OpenLayersUnifiedMap from './components/OpenLayersUnifiedMap';
-import LeafletUnifiedMap from './components/LeafletUnifiedMap';
-import CesiumGlobeMap from './components/CesiumGlobeMap';
+
+// Each rendering solution pulls in a large map library (Cesium, OpenLayers,
+// Leaflet), so they are split into separate chunks and only the chosen one
+// is downloaded. Hovering a card starts fetching its chunk early.
+const MAP_LOADERS = {
+  openlayers: () => import('./components/OpenLayersUnifiedMap'),
+  leaflet: () => import('./components/LeafletUnifiedMap'),
+  globe: () => import('./components/CesiumGlobeMap'),
+};
+const OpenLayersUnifiedMap = lazy(MAP_LOADERS.openlayers);
+const LeafletUnifiedMap = lazy(MAP_LOADERS.leaflet);
+const CesiumGlobeMap = lazy(MAP_LOADERS.globe);
+
+const MAP_FALLBACK = <div style={{ width: '100vw', height: '100vh', background: '#1a1a2e' }} />;
 
 function App() {
   const [showWelcome, setShowWelcome] = useState(true);
@@ -31,12 +42,16 @@ function App() {
     <MantineProvider defaultColorScheme="dark">
       {showWelcome ? (
         <WelcomeScreen onEnter={handleEnter} />
-      ) : selectedSolution === 'openlayers' ? (
-        <OpenLayersUnifiedMap onShowWelcome={handleShowWelcome} />
-      ) : selectedSolution === 'globe' ? (
-        <CesiumGlobeMap onShowWelcome={handleShowWelcome} />
       ) : (
-        <LeafletUnifiedMap onShowWelcome={handleShowWelcome} />
+        <Suspense fallback={MAP_FALLBACK}>
+          {selectedSolution === 'openlayers' ? (
+            <OpenLayersUnifiedMap onShowWelcome={handleShowWelcome} />
+          ) : selectedSolution === 'globe' ? (
+            <CesiumGlobeMap onShowWelcome={handleShowWelcome} />
+          ) : (
+            <LeafletUnifiedMap onShowWelcome={handleShowWelcome} />
+          )}
+        </Suspense>
       )}
     </MantineProvider>
   );
@@ -104,7 +119,7 @@ function WelcomeScreen({ onEnter }) {
           features={['3D Globe + 2D Map toggle', 'Polar data reprojected', 'All datasets supported']}
           color="#b794f4"
           isHovered={hoveredSolution === 'globe'}
-          onMouseEnter={() => setHoveredSolution('globe')}
+          onMouseEnter={() => { setHoveredSolution('globe'); MAP_LOADERS.globe(); }}
           onMouseLeave={() => setHoveredSolution(null)}
           onClick={() => onEnter('globe')}
         />
@@ -116,7 +131,7 @@ function WelcomeScreen({ onEnter }) {
           features={['EPSG:3857 + EPSG:3413', 'ImageStatic layers', 'Smooth pan/zoom']}
           color="#ed8936"
           isHovered={hoveredSolution === 'openlayers'}
-          onMouseEnter={() => setHoveredSolution('openlayers')}
+          onMouseEnter={() => { setHoveredSolution('openlayers'); MAP_LOADERS.openlayers(); }}
           onMouseLeave={() => setHoveredSolution(null)}
           onClick={() => onEnter('openlayers')}
         />
@@ -128,7 +143,7 @@ function WelcomeScreen({ onEnter }) {
           features={['EPSG:3857 + EPSG:3413', 'Canvas rendering', 'Wide ecosystem']}
           color="#4fd1c5"
           isHovered={hoveredSolution === 'leaflet'}
-          onMouseEnter={() => setHoveredSolution('leaflet')}
+          onMouseEnter={() => { setHoveredSolution('leaflet'); MAP_LOADERS.leaflet(); }}
           onMouseLeave={() => setHoveredSolution(null)}
           onClick={() => onEnter('leaflet')}
         />
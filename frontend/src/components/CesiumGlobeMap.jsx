@@ -7,10 +7,12 @@
  * - Click-to-timeseries support
  */
 
-import { useState, useEffect, useRef, useCallback } from 'react';
+import { useState, useEffect, useRef, useCallback, useMemo } from 'react';
 import * as Cesium from 'cesium';
 import 'cesium/Build/Cesium/Widgets/widgets.css';
 import * as zarr from 'zarrita';
+import { packColors, verticalGradient } from '../config/colourPalettes';
+import { canvasToObjectURL, findNearestIndex, loadCoordinate, timeseriesCache } from '../utils/dataOptimizations';
 import proj4 from 'proj4';
 import {
   Paper,
@@ -27,6 +29,7 @@ import {
   Divider,
   CloseButton,
 } from '@mantine/core';
+import { useDebouncedValue } from '@mantine/hooks';
 import {
   LineChart,
   Line,
@@ -37,12 +40,16 @@ import {
   ResponsiveContainer,
   ReferenceLine,
 } from 'recharts';
+import { CHECK_ICON, COPY_ICON } from './MapIcons';
 
 // Set Cesium Ion token (using default assets, no token needed for basic imagery)
 Cesium.Ion.defaultAccessToken = '';
 
 const API_URL = import.meta.env.VITE_API_URL || 'http://localhost:8000';
 
+// Delay before a slider drag triggers a data load
+const SLIDER_DEBOUNCE_MS = 150;
+
 // ============================================================================
 // DATASET CONFIGURATIONS (Globe-compatible only)
 // ============================================================================
@@ -116,6 +123,18 @@ const DATASETS = {
   },
 };
 
+// Dataset picker options, built once rather than on every render
+const DATASET_OPTIONS = Object.entries(DATASETS).map(([key, cfg]) => ({
+  value: key,
+  label: cfg.name,
+}));
+
+// Year slider end marks per dataset, derived once from the catalogue
+const YEAR_MARKS = Object.fromEntries(Object.entries(DATASETS).map(([key, cfg]) => [key, cfg.yearRange ? [
+  { value: cfg.yearRange.start, label: String(cfg.yearRange.start) },
+  { value: cfg.yearRange.end, label: String(cfg.yearRange.end) },
+] : []]));
+
 // ============================================================================
 // COLORMAPS
 // ============================================================================
@@ -143,54 +162,52 @@ const COLORMAPS = {
   ],
 };
 
+// Vertical legend gradients (vmax at the top), built once per colormap
+const LEGEND_GRADIENTS = Object.fromEntries(
+  Object.entries(COLORMAPS).map(([name, colors]) => [name, verticalGradient(colors)])
+);
+
+// Colormaps as packed RGBA pixels at the overlay alpha
+const PACKED_COLORMAPS = Object.fromEntries(
+  Object.entries(COLORMAPS).map(([name, colors]) => [name, packColors(colors, 200)])
+);
+
 // ============================================================================
 // UTILITY FUNCTIONS
 // ============================================================================
 
 const MONTHS = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'];
 
-function applyColormap(data, width, height, colormap, vmin, vmax) {
-  const colors = COLORMAPS[colormap] || COLORMAPS.soil;
-  const range = vmax - vmin;
-  const numColors = colors.length;
-  const rgba = new Uint8ClampedArray(width * height * 4);
-
-  for (let i = 0; i < width * height; i++) {
-    const idx = i * 4;
-    const value = data[i];
-
-    if (isNaN(value) || value === null || value === undefined || value <= vmin * 0.1) {
-      rgba[idx] = 0;
-      rgba[idx + 1] = 0;
-      rgba[idx + 2] = 0;
-      rgba[idx + 3] = 0;
-      continue;
-    }
-
-    const normalized = Math.max(0, Math.min(1, (value - vmin) / range));
-    const colorIdx = Math.min(numColors - 1, Math.floor(normalized * (numColors - 1)));
-    const color = colors[colorIdx];
+// Month slider marks, shared across renders
+const MONTH_MARKS = [
+  { value: 0, label: 'Jan' },
+  { value: 6, label: 'Jul' },
+  { value: 11, label: 'Dec' },
+];
 
-    rgba[idx] = color[0];
-    rgba[idx + 1] = color[1];
-    rgba[idx + 2] = color[2];
-    rgba[idx + 3] = 200;
-  }
-
-  return rgba;
+// Colormap parameters for one dataset, shared by every pixel of a frame
+function getColorStyle(colormap, vmin, vmax) {
+  const colors = PACKED_COLORMAPS[colormap] || PACKED_COLORMAPS.soil;
+  return {
+    colors,
+    lastColor: colors.length - 1,
+    vmin,
+    // Normalise and scale to a colour index in one multiply-add
+    scale: (colors.length - 1) / (vmax - vmin),
+    cutoff: vmin * 0.1,
+  };
 }
 
-function findNearestIndex(arr, value) {
-  let minDiff = Infinity;
-  let nearestIdx = 0;
-  for (let i = 0; i < arr.length; i++) {
-    const diff = Math.abs(arr[i] - value);
-    if (diff < minDiff) {
-      minDiff = diff;
-      nearestIdx = i;
-    }
+// Packed RGBA pixel for one data value, or 0 (transparent) when masked.
+// The reprojections colour values as they sample them, so no intermediate
+// full-size RGBA image is built and then copied pixel by pixel.
+function colorForValue(value, style) {
+  // Fails for NaN as well as values at or below the cutoff
+  if (!(value > style.cutoff)) {
+    return 0;
   }
-  return nearestIdx;
+  const pos = (value - style.vmin) * style.scale;
+  return style.colors[pos <= 0 ? 0 : pos >= style.lastColor ? style.lastColor : Math.floor(pos)];
 }
 
 // Convert Web Mercator to WGS84
@@ -216,16 +233,8 @@ function lonLatToPolar(lon, lat) {
   return [x, y];
 }
 
-// Reproject image from Web Mercator to WGS84 (plate carrée)
-function reprojectMercatorToGeographic(sourceCanvas, srcXCoords, srcYCoords) {
-  const srcWidth = sourceCanvas.width;
-  const srcHeight = sourceCanvas.height;
-
-  // Get source image data
-  const srcCtx = sourceCanvas.getContext('2d');
-  const srcImageData = srcCtx.getImageData(0, 0, srcWidth, srcHeight);
-  const srcData = srcImageData.data;
-
+// Colour and reproject a data grid from Web Mercator to WGS84 (plate carrée)
+function reprojectMercatorToGeographic(srcData, style, srcWidth, srcHeight, srcXCoords, srcYCoords) {
   // Calculate geographic bounds
   const [west, south] = mercatorToLonLat(
     Math.min(srcXCoords[0], srcXCoords[srcXCoords.length - 1]),
@@ -258,7 +267,27 @@ function reprojectMercatorToGeographic(sourceCanvas, srcXCoords, srcYCoords) {
   const srcYMin = Math.min(srcYCoords[0], srcYCoords[srcYCoords.length - 1]);
   const srcYMax = Math.max(srcYCoords[0], srcYCoords[srcYCoords.length - 1]);
 
-  // For each destination pixel (in geographic space)
+  // Write whole RGBA pixels as 32-bit words rather than four byte writes;
+  // the destination starts zeroed, so unsampled pixels stay transparent
+  const dstPixels = new Uint32Array(dstData.buffer);
+
+  // Longitude maps linearly to Mercator X, so every row samples the same
+  // source columns: resolve them once (-1 = outside the source image)
+  const srcColumns = new Int32Array(dstWidth);
+  for (let dstX = 0; dstX < dstWidth; dstX++) {
+    // Geographic longitude for this column
+    const lng = geoWest + (dstX / dstWidth) * (geoEast - geoWest);
+
+    // Convert to Web Mercator X (linear, same as geographic for X)
+    const mercX = lng * 20037508.34 / 180;
+
+    // Find source X pixel
+    const srcXNorm = (mercX - srcXMin) / (srcXMax - srcXMin);
+    const srcXPx = Math.floor(srcXNorm * srcWidth);
+    srcColumns[dstX] = srcXPx >= 0 && srcXPx < srcWidth ? srcXPx : -1;
+  }
+
+  // For each destination row (in geographic space)
   for (let dstY = 0; dstY < dstHeight; dstY++) {
     // Geographic latitude for this row (top = north)
     const lat = geoNorth - (dstY / dstHeight) * (geoNorth - geoSouth);
@@ -270,33 +299,14 @@ function reprojectMercatorToGeographic(sourceCanvas, srcXCoords, srcYCoords) {
     // Find source Y pixel
     const srcYNorm = (mercY - srcYMin) / (srcYMax - srcYMin);
     const srcYPx = Math.floor((1 - srcYNorm) * srcHeight); // Flip Y
+    if (srcYPx < 0 || srcYPx >= srcHeight) continue;
 
+    const srcRow = srcYPx * srcWidth;
+    const dstRow = dstY * dstWidth;
     for (let dstX = 0; dstX < dstWidth; dstX++) {
-      // Geographic longitude for this column
-      const lng = geoWest + (dstX / dstWidth) * (geoEast - geoWest);
-
-      // Convert to Web Mercator X (linear, same as geographic for X)
-      const mercX = lng * 20037508.34 / 180;
-
-      // Find source X pixel
-      const srcXNorm = (mercX - srcXMin) / (srcXMax - srcXMin);
-      const srcXPx = Math.floor(srcXNorm * srcWidth);
-
-      // Sample from source if in bounds
-      const dstIdx = (dstY * dstWidth + dstX) * 4;
-
-      if (srcXPx >= 0 && srcXPx < srcWidth && srcYPx >= 0 && srcYPx < srcHeight) {
-        const srcIdx = (srcYPx * srcWidth + srcXPx) * 4;
-        dstData[dstIdx] = srcData[srcIdx];
-        dstData[dstIdx + 1] = srcData[srcIdx + 1];
-        dstData[dstIdx + 2] = srcData[srcIdx + 2];
-        dstData[dstIdx + 3] = srcData[srcIdx + 3];
-      } else {
-        // Transparent
-        dstData[dstIdx] = 0;
-        dstData[dstIdx + 1] = 0;
-        dstData[dstIdx + 2] = 0;
-        dstData[dstIdx + 3] = 0;
+      const srcXPx = srcColumns[dstX];
+      if (srcXPx >= 0) {
+        dstPixels[dstRow + dstX] = colorForValue(srcData[srcRow + srcXPx], style);
       }
     }
   }
@@ -309,21 +319,21 @@ function reprojectMercatorToGeographic(sourceCanvas, srcXCoords, srcYCoords) {
   };
 }
 
-// Reproject image from Polar Stereographic (EPSG:3413) to WGS84 (plate carrée)
-function reprojectPolarToGeographic(sourceCanvas, srcXCoords, srcYCoords) {
-  const srcWidth = sourceCanvas.width;
-  const srcHeight = sourceCanvas.height;
-
-  const srcCtx = sourceCanvas.getContext('2d');
-  const srcImageData = srcCtx.getImageData(0, 0, srcWidth, srcHeight);
-  const srcData = srcImageData.data;
+// Destination->source pixel mapping for each polar grid. It depends only on
+// the grid (size and extent), not on the frame, so the per-pixel proj4
+// transforms run once per grid instead of on every render.
+const polarSampleMaps = new Map();
 
+function getPolarSampleMap(srcWidth, srcHeight, srcXCoords, srcYCoords) {
   // Source polar bounds
   const srcXMin = Math.min(srcXCoords[0], srcXCoords[srcXCoords.length - 1]);
   const srcXMax = Math.max(srcXCoords[0], srcXCoords[srcXCoords.length - 1]);
   const srcYMin = Math.min(srcYCoords[0], srcYCoords[srcYCoords.length - 1]);
   const srcYMax = Math.max(srcYCoords[0], srcYCoords[srcYCoords.length - 1]);
 
+  const key = `${srcWidth}x${srcHeight}|${srcXCoords.length}x${srcYCoords.length}|${srcXMin},${srcXMax},${srcYMin},${srcYMax}`;
+  const cached = polarSampleMaps.get(key);
+  if (cached) return cached;
 
   // Sample multiple points around the data extent to find geographic bounds
   const samplePoints = [];
@@ -352,15 +362,11 @@ function reprojectPolarToGeographic(sourceCanvas, srcXCoords, srcYCoords) {
   const geoSouth = Math.max(40, minLat - 5); // Add some padding
   const geoNorth = 90;
 
-  // Create destination canvas
+  // Destination is the same size as the source
   const dstWidth = srcWidth;
   const dstHeight = srcHeight;
-  const dstCanvas = document.createElement('canvas');
-  dstCanvas.width = dstWidth;
-  dstCanvas.height = dstHeight;
-  const dstCtx = dstCanvas.getContext('2d');
-  const dstImageData = dstCtx.createImageData(dstWidth, dstHeight);
-  const dstData = dstImageData.data;
+  // Source pixel index for each destination pixel (-1 = transparent)
+  const sourceIndex = new Int32Array(dstWidth * dstHeight);
 
   // For each destination pixel (in geographic space)
   for (let dstY = 0; dstY < dstHeight; dstY++) {
@@ -378,29 +384,73 @@ function reprojectPolarToGeographic(sourceCanvas, srcXCoords, srcYCoords) {
       const srcXPx = Math.floor(srcXNorm * srcWidth);
       const srcYPx = Math.floor((1 - srcYNorm) * srcHeight); // Flip Y
 
-      const dstIdx = (dstY * dstWidth + dstX) * 4;
+      sourceIndex[dstY * dstWidth + dstX] =
+        srcXPx >= 0 && srcXPx < srcWidth && srcYPx >= 0 && srcYPx < srcHeight
+          ? srcYPx * srcWidth + srcXPx
+          : -1;
+    }
+  }
 
-      if (srcXPx >= 0 && srcXPx < srcWidth && srcYPx >= 0 && srcYPx < srcHeight) {
-        const srcIdx = (srcYPx * srcWidth + srcXPx) * 4;
-        dstData[dstIdx] = srcData[srcIdx];
-        dstData[dstIdx + 1] = srcData[srcIdx + 1];
-        dstData[dstIdx + 2] = srcData[srcIdx + 2];
-        dstData[dstIdx + 3] = srcData[srcIdx + 3];
-      } else {
-        dstData[dstIdx] = 0;
-        dstData[dstIdx + 1] = 0;
-        dstData[dstIdx + 2] = 0;
-        dstData[dstIdx + 3] = 0;
-      }
+  const sampleMap = {
+    sourceIndex,
+    bounds: { west: geoWest, south: geoSouth, east: geoEast, north: geoNorth },
+  };
+  polarSampleMaps.set(key, sampleMap);
+  return sampleMap;
+}
+
+// Colour and reproject a data grid from Polar Stereographic (EPSG:3413) to WGS84 (plate carrée)
+function reprojectPolarToGeographic(srcData, style, srcWidth, srcHeight, srcXCoords, srcYCoords) {
+  const { sourceIndex, bounds } = getPolarSampleMap(srcWidth, srcHeight, srcXCoords, srcYCoords);
+
+  // Create destination canvas
+  const dstCanvas = document.createElement('canvas');
+  dstCanvas.width = srcWidth;
+  dstCanvas.height = srcHeight;
+  const dstCtx = dstCanvas.getContext('2d');
+  const dstImageData = dstCtx.createImageData(srcWidth, srcHeight);
+
+  // Write whole RGBA pixels as 32-bit words; the destination starts
+  // zeroed, so unmapped pixels stay transparent
+  const dstPixels = new Uint32Array(dstImageData.data.buffer);
+  for (let i = 0; i < sourceIndex.length; i++) {
+    const srcIdx = sourceIndex[i];
+    if (srcIdx >= 0) {
+      dstPixels[i] = colorForValue(srcData[srcIdx], style);
     }
   }
 
   dstCtx.putImageData(dstImageData, 0, 0);
 
-  return {
-    canvas: dstCanvas,
-    bounds: { west: geoWest, south: geoSouth, east: geoEast, north: geoNorth }
-  };
+  return { canvas: dstCanvas, bounds };
+}
+
+// ============================================================================
+// REPROJECTED IMAGE CACHE
+// ============================================================================
+
+// Reprojected PNG object URLs keyed by dataset/level/year/month, so scrubbing
+// back to a frame skips the fetch, colormap, reprojection and PNG encode.
+const GLOBE_IMAGE_CACHE_SIZE = 64;
+const globeImageCache = new Map();
+
+function getCachedGlobeImage(key) {
+  const entry = globeImageCache.get(key);
+  if (entry) {
+    // Refresh recency
+    globeImageCache.delete(key);
+    globeImageCache.set(key, entry);
+  }
+  return entry;
+}
+
+function setCachedGlobeImage(key, entry) {
+  globeImageCache.set(key, entry);
+  if (globeImageCache.size > GLOBE_IMAGE_CACHE_SIZE) {
+    const oldestKey = globeImageCache.keys().next().value;
+    URL.revokeObjectURL(globeImageCache.get(oldestKey).dataUrl);
+    globeImageCache.delete(oldestKey);
+  }
 }
 
 // ============================================================================
@@ -413,6 +463,7 @@ export default function CesiumGlobeMap({ onShowWelcome }) {
   const viewerRef = useRef(null);
   const dataLayerRef = useRef(null);
   const lastLoadedRef = useRef(null);
+  const opacityRef = useRef(0.85);
 
   // State
   const [selectedDataset, setSelectedDataset] = useState(null);
@@ -433,6 +484,11 @@ export default function CesiumGlobeMap({ onShowWelcome }) {
   const [timeseries, setTimeseries] = useState(null);
   const [timeseriesLoading, setTimeseriesLoading] = useState(false);
 
+  // Sliders update timeIndex/selectedYear immediately for the UI; data loads
+  // follow the settled value so a drag doesn't fetch every intermediate step
+  const [loadTimeIndex] = useDebouncedValue(timeIndex, SLIDER_DEBOUNCE_MS, { leading: true });
+  const [loadYear] = useDebouncedValue(selectedYear, SLIDER_DEBOUNCE_MS, { leading: true });
+
   // Get current dataset config
   const datasetConfig = selectedDataset ? DATASETS[selectedDataset] : null;
 
@@ -604,12 +660,75 @@ export default function CesiumGlobeMap({ onShowWelcome }) {
   // DATA LOADING
   // ============================================================================
 
+  // Fetch one slice and reproject it to a plate carrée PNG object URL
+  const renderGlobeImage = useCallback(async (level) => {
+    const storePath = `${API_URL}${datasetConfig.path}/${level}`;
+    console.log(`[CESIUM] Loading ${selectedDataset} level ${level}/${datasetConfig.maxLevel || 3}`);
+    const store = new zarr.FetchStore(storePath);
+    const root = zarr.root(store);
+    const arr = await zarr.open(root.resolve(datasetConfig.variable), { kind: 'array' });
+
+    const shape = arr.shape;
+    let slice, width, height;
+
+    if (datasetConfig.isMultiYear && shape.length === 4) {
+      const years = await loadCoordinate(storePath, 'year');
+      let yearIndex = years.indexOf(loadYear);
+
+      // If exact year not found, use nearest available year
+      if (yearIndex === -1) {
+        console.warn(`[CESIUM] Year ${loadYear} not found, finding nearest...`);
+        let minDiff = Infinity;
+        for (let i = 0; i < years.length; i++) {
+          const diff = Math.abs(years[i] - loadYear);
+          if (diff < minDiff) {
+            minDiff = diff;
+            yearIndex = i;
+          }
+        }
+        console.log(`[CESIUM] Using year ${years[yearIndex]} instead`);
+      }
+
+      height = shape[2];
+      width = shape[3];
+      slice = await zarr.get(arr, [yearIndex, loadTimeIndex, null, null]);
+    } else if (shape.length === 3) {
+      height = shape[1];
+      width = shape[2];
+      slice = await zarr.get(arr, [loadTimeIndex, null, null]);
+    } else {
+      console.error('Unexpected data shape:', shape);
+      return null;
+    }
+
+    const rawData = slice.data;
+    const style = getColorStyle(datasetConfig.colormap, datasetConfig.vmin, datasetConfig.vmax);
+
+    // Get coordinate arrays first (needed for reprojection)
+    const xCoords = await loadCoordinate(storePath, 'x');
+    const yCoords = await loadCoordinate(storePath, 'y');
+
+    // Reproject to Geographic (plate carrée) for Cesium
+    // Use polar reprojection for polar datasets, Mercator for others
+    let geoCanvas, bounds;
+    if (datasetConfig.projection === 'polar') {
+      const result = reprojectPolarToGeographic(rawData, style, width, height, xCoords, yCoords);
+      geoCanvas = result.canvas;
+      bounds = result.bounds;
+    } else {
+      const result = reprojectMercatorToGeographic(rawData, style, width, height, xCoords, yCoords);
+      geoCanvas = result.canvas;
+      bounds = result.bounds;
+    }
+    return { dataUrl: await canvasToObjectURL(geoCanvas), bounds, width, height };
+  }, [selectedDataset, datasetConfig, loadTimeIndex, loadYear]);
+
   const loadData = useCallback(async () => {
     if (!selectedDataset || !datasetConfig || !viewerRef.current) return;
 
     const maxLevel = datasetConfig.maxLevel || 3;
     const level = Math.min(currentLevel, maxLevel);
-    const loadKey = `${selectedDataset}-${level}-${selectedYear}-${timeIndex}`;
+    const loadKey = `${selectedDataset}-${level}-${loadYear}-${loadTimeIndex}`;
 
     if (lastLoadedRef.current === loadKey) {
       return;
@@ -619,87 +738,18 @@ export default function CesiumGlobeMap({ onShowWelcome }) {
     const startTime = performance.now();
 
     try {
-      const storePath = `${API_URL}${datasetConfig.path}/${level}`;
-      console.log(`[CESIUM] Loading ${selectedDataset} level ${level}/${maxLevel}`);
-      const store = new zarr.FetchStore(storePath);
-      const root = zarr.root(store);
-      const arr = await zarr.open(root.resolve(datasetConfig.variable), { kind: 'array' });
-
-      const shape = arr.shape;
-      let slice, width, height;
-
-      if (datasetConfig.isMultiYear && shape.length === 4) {
-        const yearArr = await zarr.open(root.resolve('year'), { kind: 'array' });
-        const yearResult = await zarr.get(yearArr, [null]);
-        const years = Array.from(yearResult.data).map(y => Number(y));
-        let yearIndex = years.indexOf(selectedYear);
-
-        // If exact year not found, use nearest available year
-        if (yearIndex === -1) {
-          console.warn(`[CESIUM] Year ${selectedYear} not found, finding nearest...`);
-          let minDiff = Infinity;
-          for (let i = 0; i < years.length; i++) {
-            const diff = Math.abs(years[i] - selectedYear);
-            if (diff < minDiff) {
-              minDiff = diff;
-              yearIndex = i;
-            }
-          }
-          console.log(`[CESIUM] Using year ${years[yearIndex]} instead`);
-        }
-
-        height = shape[2];
-        width = shape[3];
-        slice = await zarr.get(arr, [yearIndex, timeIndex, null, null]);
-      } else if (shape.length === 3) {
-        height = shape[1];
-        width = shape[2];
-        slice = await zarr.get(arr, [timeIndex, null, null]);
-      } else {
-        console.error('Unexpected data shape:', shape);
-        setLoading(false);
-        return;
+      let cached = getCachedGlobeImage(loadKey);
+      if (!cached) {
+        cached = await renderGlobeImage(level);
+        if (!cached) return;
+        setCachedGlobeImage(loadKey, cached);
       }
-
-      setDataShape({ width, height });
-
-      const rawData = slice.data;
-      const rgba = applyColormap(
-        rawData, width, height,
-        datasetConfig.colormap,
-        datasetConfig.vmin,
-        datasetConfig.vmax
-      );
-
-      // Get coordinate arrays first (needed for reprojection)
-      const xArr = await zarr.open(root.resolve('x'), { kind: 'array' });
-      const yArr = await zarr.open(root.resolve('y'), { kind: 'array' });
-      const xResult = await zarr.get(xArr);
-      const yResult = await zarr.get(yArr);
-      const xCoords = Array.from(xResult.data);
-      const yCoords = Array.from(yResult.data);
-
-      // Create source image canvas
-      const srcCanvas = document.createElement('canvas');
-      srcCanvas.width = width;
-      srcCanvas.height = height;
-      const srcCtx = srcCanvas.getContext('2d');
-      const imgData = new ImageData(rgba, width, height);
-      srcCtx.putImageData(imgData, 0, 0);
-
-      // Reproject to Geographic (plate carrée) for Cesium
-      // Use polar reprojection for polar datasets, Mercator for others
-      let geoCanvas, bounds;
-      if (datasetConfig.projection === 'polar') {
-        const result = reprojectPolarToGeographic(srcCanvas, xCoords, yCoords);
-        geoCanvas = result.canvas;
-        bounds = result.bounds;
-      } else {
-        const result = reprojectMercatorToGeographic(srcCanvas, xCoords, yCoords);
-        geoCanvas = result.canvas;
-        bounds = result.bounds;
-      }
-      const dataUrl = geoCanvas.toDataURL('image/png');
+      const { dataUrl, bounds, width, height } = cached;
+      // Keep the previous object when the shape is unchanged so time steps
+      // within a level don't re-render the info panel
+      setDataShape((prev) => (
+        prev && prev.width === width && prev.height === height ? prev : { width, height }
+      ));
 
       // Remove previous data layer
       if (dataLayerRef.current && viewerRef.current) {
@@ -722,7 +772,7 @@ export default function CesiumGlobeMap({ onShowWelcome }) {
         if (!viewerRef.current || viewerRef.current.isDestroyed()) return;
 
         const layer = viewerRef.current.imageryLayers.addImageryProvider(imageryProvider);
-        layer.alpha = opacity;
+        layer.alpha = opacityRef.current;
         dataLayerRef.current = layer;
       }).catch((err) => {
         console.error('[CESIUM] Failed to create imagery provider:', err);
@@ -738,7 +788,7 @@ export default function CesiumGlobeMap({ onShowWelcome }) {
     } finally {
       setLoading(false);
     }
-  }, [selectedDataset, datasetConfig, currentLevel, timeIndex, selectedYear, opacity]);
+  }, [selectedDataset, datasetConfig, currentLevel, loadTimeIndex, loadYear, renderGlobeImage]);
 
   // ============================================================================
   // TIMESERIES LOADING
@@ -753,17 +803,10 @@ export default function CesiumGlobeMap({ onShowWelcome }) {
     try {
       const level = 2;
       const storePath = `${API_URL}${datasetConfig.path}/${level}`;
-      const store = new zarr.FetchStore(storePath);
-      const root = zarr.root(store);
-      const arr = await zarr.open(root.resolve(datasetConfig.variable), { kind: 'array' });
 
       // Get coordinate arrays (in Web Mercator)
-      const xArr = await zarr.open(root.resolve('x'), { kind: 'array' });
-      const yArr = await zarr.open(root.resolve('y'), { kind: 'array' });
-      const xResult = await zarr.get(xArr);
-      const yResult = await zarr.get(yArr);
-      const xCoords = Array.from(xResult.data);
-      const yCoords = Array.from(yResult.data);
+      const xCoords = await loadCoordinate(storePath, 'x');
+      const yCoords = await loadCoordinate(storePath, 'y');
 
       // Convert click coords (WGS84) to Web Mercator
       const dataX = lng * 20037508.34 / 180;
@@ -775,13 +818,24 @@ export default function CesiumGlobeMap({ onShowWelcome }) {
 
       console.log(`[TIMESERIES] Click (${lat.toFixed(2)}, ${lng.toFixed(2)}) -> pixel (${xIdx}, ${yIdx})`);
 
+      // Clicks are snapped to their data pixel, so repeat clicks anywhere
+      // within the same pixel reuse the cached series
+      const cacheKey = `${storePath}/${datasetConfig.variable}|${selectedYear}|${yIdx}|${xIdx}`;
+      const cached = timeseriesCache.get(cacheKey);
+      if (cached !== undefined) {
+        setTimeseries(cached);
+        return;
+      }
+
+      const store = new zarr.FetchStore(storePath);
+      const root = zarr.root(store);
+      const arr = await zarr.open(root.resolve(datasetConfig.variable), { kind: 'array' });
+
       const shape = arr.shape;
       let timeseriesData = [];
 
       if (datasetConfig.isMultiYear && shape.length === 4) {
-        const yearArr = await zarr.open(root.resolve('year'), { kind: 'array' });
-        const yearResult = await zarr.get(yearArr);
-        const years = Array.from(yearResult.data).map(y => Number(y));
+        const years = await loadCoordinate(storePath, 'year');
         const yearIndex = years.indexOf(selectedYear);
 
         if (yearIndex !== -1) {
@@ -810,7 +864,9 @@ export default function CesiumGlobeMap({ onShowWelcome }) {
       }
 
       const hasValidData = timeseriesData.some(d => d.value !== null);
-      setTimeseries(hasValidData ? timeseriesData : null);
+      const series = hasValidData ? timeseriesData : null;
+      timeseriesCache.set(cacheKey, series);
+      setTimeseries(series);
 
     } catch (error) {
       console.error('[TIMESERIES] Error:', error);
@@ -833,10 +889,12 @@ export default function CesiumGlobeMap({ onShowWelcome }) {
     if (selectedDataset) {
       loadData();
     }
-  }, [selectedDataset, currentLevel, timeIndex, selectedYear, loadData]);
+  }, [selectedDataset, currentLevel, loadTimeIndex, loadYear, loadData]);
 
-  // Update opacity when changed
+  // Update opacity when changed - a pure display change, so it only touches
+  // the existing layer and never re-triggers data loading
   useEffect(() => {
+    opacityRef.current = opacity;
     if (dataLayerRef.current) {
       dataLayerRef.current.alpha = opacity;
     }
@@ -894,6 +952,34 @@ Selected: ${selectedYear}, ${MONTHS[timeIndex]}` : ''}`;
     });
   };
 
+  // The chart only depends on the series, dataset and month marker, so
+  // memoise it to skip rebuilding recharts' tree on unrelated re-renders
+  const timeseriesChart = useMemo(() => timeseries && (
+    <ResponsiveContainer width="100%" height={180}>
+      <LineChart data={timeseries} margin={{ top: 10, right: 20, left: 0, bottom: 5 }}>
+        <CartesianGrid strokeDasharray="3 3" stroke="#333" />
+        <XAxis dataKey="month" tick={{ fill: '#888', fontSize: 10 }} />
+        <YAxis
+          domain={[datasetConfig?.vmin || 0, datasetConfig?.vmax || 100]}
+          tick={{ fill: '#888', fontSize: 10 }}
+        />
+        <Tooltip
+          contentStyle={{ background: 'rgba(0,0,0,0.9)', border: '1px solid #b794f4' }}
+          formatter={(value) => [value?.toFixed(3) || 'N/A', datasetConfig?.unit || '']}
+        />
+        <ReferenceLine x={MONTHS[timeIndex]} stroke="#b794f4" strokeDasharray="5 5" />
+        <Line
+          type="monotone"
+          dataKey="value"
+          stroke="#63b3ed"
+          strokeWidth={2}
+          dot={{ fill: '#63b3ed', r: 3 }}
+          connectNulls={false}
+        />
+      </LineChart>
+    </ResponsiveContainer>
+  ), [timeseries, datasetConfig, timeIndex]);
+
   // ============================================================================
   // RENDER
   // ============================================================================
@@ -947,10 +1033,7 @@ Selected: ${selectedYear}, ${MONTHS[timeIndex]}` : ''}`;
             placeholder="Select dataset..."
             value={selectedDataset}
             onChange={handleDatasetChange}
-            data={Object.entries(DATASETS).map(([key, cfg]) => ({
-              value: key,
-              label: cfg.name,
-            }))}
+            data={DATASET_OPTIONS}
             styles={{
               input: { background: 'rgba(255,255,255,0.05)' },
               dropdown: { zIndex: 10000 }
@@ -969,10 +1052,7 @@ Selected: ${selectedYear}, ${MONTHS[timeIndex]}` : ''}`;
                 min={datasetConfig.yearRange.start}
                 max={datasetConfig.yearRange.end}
                 step={1}
-                marks={[
-                  { value: datasetConfig.yearRange.start, label: String(datasetConfig.yearRange.start) },
-                  { value: datasetConfig.yearRange.end, label: String(datasetConfig.yearRange.end) },
-                ]}
+                marks={YEAR_MARKS[selectedDataset]}
                 size="xs"
                 color="violet"
               />
@@ -991,11 +1071,7 @@ Selected: ${selectedYear}, ${MONTHS[timeIndex]}` : ''}`;
                 min={0}
                 max={11}
                 step={1}
-                marks={[
-                  { value: 0, label: 'Jan' },
-                  { value: 6, label: 'Jul' },
-                  { value: 11, label: 'Dec' },
-                ]}
+                marks={MONTH_MARKS}
                 size="xs"
                 color="violet"
               />
@@ -1122,14 +1198,9 @@ Selected: ${selectedYear}, ${MONTHS[timeIndex]}` : ''}`;
               title="Copy tech info"
             >
               {copied ? (
-                <svg width="12" height="12" viewBox="0 0 24 24" fill="none" stroke="currentColor" strokeWidth="2">
-                  <polyline points="20 6 9 17 4 12" />
-                </svg>
+                {CHECK_ICON}
               ) : (
-                <svg width="12" height="12" viewBox="0 0 24 24" fill="none" stroke="currentColor" strokeWidth="2">
-                  <rect x="9" y="9" width="13" height="13" rx="2" ry="2" />
-                  <path d="M5 15H4a2 2 0 0 1-2-2V4a2 2 0 0 1 2-2h9a2 2 0 0 1 2 2v1" />
-                </svg>
+                {COPY_ICON}
               )}
             </ActionIcon>
           </Group>
@@ -1194,11 +1265,7 @@ Selected: ${selectedYear}, ${MONTHS[timeIndex]}` : ''}`;
               <div style={{
                 width: 16,
                 height: 100,
-                background: `linear-gradient(to bottom, ${
-                  [...COLORMAPS[datasetConfig.colormap]].reverse()
-                    .map((c, i, arr) => `rgb(${c[0]},${c[1]},${c[2]}) ${i/(arr.length-1)*100}%`)
-                    .join(', ')
-                })`,
+                background: LEGEND_GRADIENTS[datasetConfig.colormap],
                 borderRadius: 4,
                 margin: '4px 0',
               }} />
@@ -1252,31 +1319,7 @@ Selected: ${selectedYear}, ${MONTHS[timeIndex]}` : ''}`;
               <div style={{ display: 'flex', justifyContent: 'center', alignItems: 'center', height: 180 }}>
                 <Text size="xs" c="dimmed">Loading...</Text>
               </div>
-            ) : timeseries ? (
-              <ResponsiveContainer width="100%" height={180}>
-                <LineChart data={timeseries} margin={{ top: 10, right: 20, left: 0, bottom: 5 }}>
-                  <CartesianGrid strokeDasharray="3 3" stroke="#333" />
-                  <XAxis dataKey="month" tick={{ fill: '#888', fontSize: 10 }} />
-                  <YAxis
-                    domain={[datasetConfig?.vmin || 0, datasetConfig?.vmax || 100]}
-                    tick={{ fill: '#888', fontSize: 10 }}
-                  />
-                  <Tooltip
-                    contentStyle={{ background: 'rgba(0,0,0,0.9)', border: '1px solid #b794f4' }}
-                    formatter={(value) => [value?.toFixed(3) || 'N/A', datasetConfig?.unit || '']}
-                  />
-                  <ReferenceLine x={MONTHS[timeIndex]} stroke="#b794f4" strokeDasharray="5 5" />
-                  <Line
-                    type="monotone"
-                    dataKey="value"
-                    stroke="#63b3ed"
-                    strokeWidth={2}
-                    dot={{ fill: '#63b3ed', r: 3 }}
-                    connectNulls={false}
-                  />
-                </LineChart>
-              </ResponsiveContainer>
-            ) : (
+            ) : timeseriesChart || (
               <Text size="sm" c="dimmed" ta="center" mt="xl">
                 No data at this location
               </Text>
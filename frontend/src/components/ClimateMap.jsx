@@ -17,6 +17,14 @@ const VARIABLES = [
   { value: 'skin_temperature', label: 'Skin Temperature' },
 ];
 
+const VIEW_MODES = [
+  { value: 'map', label: 'Map' },
+  { value: 'globe', label: 'Globe' },
+];
+
+// Month slider marks, derived from MONTHS once rather than on every render
+const MONTH_MARKS = MONTHS.map((m, i) => ({ value: i, label: m.slice(5) }));
+
 const INITIAL_VIEW_STATE = {
   longitude: 10,
   latitude: 50,
@@ -243,10 +251,7 @@ export function ClimateMap() {
               size="xs"
               value={viewMode}
               onChange={handleViewModeChange}
-              data={[
-                { value: 'map', label: 'Map' },
-                { value: 'globe', label: 'Globe' },
-              ]}
+              data={VIEW_MODES}
               fullWidth
               styles={{ root: { background: 'rgba(255,255,255,0.05)' } }}
             />
@@ -407,7 +412,7 @@ export function ClimateMap() {
             style={{ flex: 1 }}
             color="cyan"
             size="sm"
-            marks={MONTHS.map((m, i) => ({ value: i, label: m.slice(5) }))}
+            marks={MONTH_MARKS}
           />
         </Group>
       </Paper>
@@ -15,6 +15,8 @@ import 'proj4';
 import 'proj4leaflet';
 import proj4 from 'proj4';
 import * as zarr from 'zarrita';
+import { applyColormap, DATASET_OPTIONS, DATASETS, LEGEND_GRADIENTS, MONTH_MARKS, MONTHS, YEAR_MARKS } from '../config/unifiedMapConfig';
+import { canvasToCachedFrameBlob, findNearestIndex, imageCache, loadCoordinate, retainObjectURL, timeseriesCache } from '../utils/dataOptimizations';
 import {
   Paper,
   Text,
@@ -31,6 +33,7 @@ import {
   Anchor,
   CloseButton,
 } from '@mantine/core';
+import { useDebouncedValue } from '@mantine/hooks';
 import {
   LineChart,
   Line,
@@ -41,9 +44,13 @@ import {
   ResponsiveContainer,
   ReferenceLine,
 } from 'recharts';
+import { CHECK_ICON, COPY_ICON, ZOOM_IN_ICON, ZOOM_OUT_ICON } from './MapIcons';
 
 const API_URL = import.meta.env.VITE_API_URL || 'http://localhost:8000';
 
+// Delay before a slider drag triggers a data load
+const SLIDER_DEBOUNCE_MS = 150;
+
 // ============================================================================
 // PROJECTION DEFINITIONS
 // ============================================================================
@@ -103,110 +110,6 @@ const SEA_ICE_DATA_BOUNDS = {
   ymax: 5850000,
 };
 
-// ============================================================================
-// DATASET CONFIGURATIONS
-// ============================================================================
-
-const DATASETS = {
-  soil_moisture_multiyear: {
-    name: 'Soil Moisture ERA5',
-    path: '/zarr/soil_moisture_multiyear',
-    variable: 'soil_moisture',
-    projection: 'EPSG:3857',
-    isMultiYear: true,
-    yearRange: { start: 1988, end: 2023 },
-    maxLevel: 4,
-    colormap: 'soil',
-    vmin: 0.05,
-    vmax: 0.5,
-    unit: 'm³/m³',
-    description: 'ERA5 Volumetric Soil Water Layer 1',
-  },
-  radiation_budget: {
-    name: 'Solar Radiation ERA5',
-    path: '/zarr/radiation_multiyear',
-    variable: 'solar_radiation',
-    projection: 'EPSG:3857',
-    isMultiYear: true,
-    yearRange: { start: 1988, end: 2023 },
-    maxLevel: 3,
-    colormap: 'radiation',
-    vmin: 0,
-    vmax: 25000000,
-    unit: 'J/m²',
-    description: 'Surface Solar Radiation Downwards',
-  },
-  fire_burned_area: {
-    name: 'Fire Burned Area',
-    path: '/zarr/fire_multiyear',
-    variable: 'burned_area',
-    projection: 'EPSG:3857',
-    isMultiYear: true,
-    yearRange: { start: 1988, end: 2023 },
-    maxLevel: 4,
-    colormap: 'fire',
-    vmin: 0,
-    vmax: 100,
-    unit: '%',
-    description: 'MODIS Burned Area',
-  },
-  satellite_radiation: {
-    name: 'Solar Radiation Satellite',
-    path: '/zarr/satellite_radiation',
-    variable: 'solar_radiation',
-    projection: 'EPSG:3857',
-    isMultiYear: true,
-    yearRange: { start: 2001, end: 2024 },
-    maxLevel: 2,
-    colormap: 'radiation',
-    vmin: 0,
-    vmax: 350,
-    unit: 'W/m²',
-    description: 'Surface Incoming Shortwave Radiation',
-  },
-  sea_ice: {
-    name: 'Sea Ice (Polar View)',
-    path: '/zarr/sea_ice_polar_multiyear',
-    variable: 'ice_concentration',
-    projection: 'EPSG:3413',
-    isMultiYear: true,
-    yearRange: { start: 1988, end: 2023 },
-    maxLevel: 3,
-    colormap: 'ice',
-    vmin: 0,
-    vmax: 100,
-    unit: '%',
-    description: 'Sea Ice Concentration',
-  },
-};
-
-// ============================================================================
-// COLORMAPS
-// ============================================================================
-
-const COLORMAPS = {
-  soil: [
-    [139, 90, 43], [160, 120, 70], [180, 150, 100], [160, 180, 120],
-    [120, 180, 140], [80, 170, 160], [40, 150, 170], [20, 120, 180],
-    [10, 80, 160], [5, 40, 130]
-  ],
-  radiation: [
-    [20, 20, 60], [40, 40, 100], [60, 60, 140], [100, 80, 160],
-    [140, 100, 160], [180, 120, 140], [220, 140, 100], [250, 180, 60],
-    [255, 220, 40], [255, 255, 200]
-  ],
-  fire: [
-    [80, 30, 10], [140, 45, 5], [180, 60, 0], [210, 80, 0],
-    [235, 110, 0], [250, 140, 10], [255, 170, 30], [255, 200, 60],
-    [255, 230, 100], [255, 255, 180]
-  ],
-  ice: [
-    [10, 20, 40], [20, 40, 80], [40, 80, 140], [60, 120, 180],
-    [100, 160, 210], [140, 190, 230], [180, 215, 245], [210, 235, 255],
-    [240, 250, 255], [255, 255, 255]
-  ],
-};
-
 // ============================================================================
 // BASEMAP CONFIGURATIONS
 // ============================================================================
@@ -224,56 +127,6 @@ const BASEMAPS = {
   },
 };
 
-// ============================================================================
-// UTILITY FUNCTIONS
-// ============================================================================
-
-const MONTHS = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'];
-
-function applyColormap(data, width, height, colormap, vmin, vmax) {
-  const colors = COLORMAPS[colormap] || COLORMAPS.soil;
-  const range = vmax - vmin;
-  const numColors = colors.length;
-  const rgba = new Uint8ClampedArray(width * height * 4);
-
-  for (let i = 0; i < width * height; i++) {
-    const idx = i * 4;
-    const value = data[i];
-
-    if (isNaN(value) || value === null || value === undefined || value <= vmin * 0.1) {
-      rgba[idx] = 0;
-      rgba[idx + 1] = 0;
-      rgba[idx + 2] = 0;
-      rgba[idx + 3] = 0;
-      continue;
-    }
-
-    const normalized = Math.max(0, Math.min(1, (value - vmin) / range));
-    const colorIdx = Math.min(numColors - 1, Math.floor(normalized * (numColors - 1)));
-    const color = colors[colorIdx];
-
-    rgba[idx] = color[0];
-    rgba[idx + 1] = color[1];
-    rgba[idx + 2] = color[2];
-    rgba[idx + 3] = 200;
-  }
-
-  return rgba;
-}
-
-function findNearestIndex(arr, value) {
-  let minDiff = Infinity;
-  let nearestIdx = 0;
-  for (let i = 0; i < arr.length; i++) {
-    const diff = Math.abs(arr[i] - value);
-    if (diff < minDiff) {
-      minDiff = diff;
-      nearestIdx = i;
-    }
-  }
-  return nearestIdx;
-}
-
 // ============================================================================
 // MAIN COMPONENT
 // ============================================================================
@@ -283,10 +136,12 @@ export default function LeafletUnifiedMap({ onShowWelcome }) {
   const mapContainerRef = useRef(null);
   const mapInstanceRef = useRef(null);
   const imageOverlayRef = useRef(null);
+  const overlayUrlsRef = useRef([]);
   const pendingOverlayRef = useRef(null);
   const basemapLayerRef = useRef(null);
   const zoomTimeoutRef = useRef(null);
   const lastLoadKeyRef = useRef(null);
+  const opacityRef = useRef(0.85);
 
   // State
   const [selectedDataset, setSelectedDataset] = useState(null);
@@ -308,6 +163,11 @@ export default function LeafletUnifiedMap({ onShowWelcome }) {
   const [timeseriesLoading, setTimeseriesLoading] = useState(false);
   const loadTimeseriesRef = useRef(null);
 
+  // Sliders update timeIndex/selectedYear immediately for the UI; data loads
+  // follow the settled value so a drag doesn't fetch every intermediate step
+  const [loadTimeIndex] = useDebouncedValue(timeIndex, SLIDER_DEBOUNCE_MS, { leading: true });
+  const [loadYear] = useDebouncedValue(selectedYear, SLIDER_DEBOUNCE_MS, { leading: true });
+
   // Get current dataset config
   const datasetConfig = selectedDataset ? DATASETS[selectedDataset] : null;
   const isPolar = datasetConfig?.projection === 'EPSG:3413';
@@ -388,17 +248,22 @@ export default function LeafletUnifiedMap({ onShowWelcome }) {
 
     // Add graticule for polar view
     if (projection === 'EPSG:3413') {
-      const graticuleStyle = { color: 'rgba(79, 209, 197, 0.25)', weight: 1 };
-      [60, 70, 80].forEach(lat => {
+      // All parallels and meridians go into one multi-polyline layer
+      const graticuleLines = [60, 70, 80].map(lat => {
         const points = [];
         for (let lon = -180; lon <= 180; lon += 3) {
           points.push([lat, lon]);
         }
-        L.polyline(points, graticuleStyle).addTo(map);
+        return points;
       });
       for (let lon = -180; lon < 180; lon += 45) {
-        L.polyline([[50, lon], [90, lon]], graticuleStyle).addTo(map);
+        graticuleLines.push([[50, lon], [90, lon]]);
       }
+      L.polyline(graticuleLines, {
+        color: 'rgba(79, 209, 197, 0.25)',
+        weight: 1,
+        interactive: false,
+      }).addTo(map);
     }
 
     // Event handlers - optimized for smooth zoom
@@ -444,7 +309,7 @@ export default function LeafletUnifiedMap({ onShowWelcome }) {
     const level = Math.min(currentLevel, maxLevel);
 
     // Skip if same data is already loaded (prevents flicker)
-    const loadKey = `${selectedDataset}-${level}-${timeIndex}-${selectedYear}`;
+    const loadKey = `${selectedDataset}-${level}-${loadTimeIndex}-${loadYear}`;
     if (loadKey === lastLoadKeyRef.current) {
       console.log(`[LEAFLET] Skipping reload, same data: ${loadKey}`);
       return;
@@ -457,63 +322,76 @@ export default function LeafletUnifiedMap({ onShowWelcome }) {
       const storePath = `${API_URL}${datasetConfig.path}/${level}`;
       console.log(`[LEAFLET] Loading ${selectedDataset} level ${level} (max: ${maxLevel})`);
 
-      const store = new zarr.FetchStore(storePath);
-      const root = zarr.root(store);
-      const arr = await zarr.open(root.resolve(datasetConfig.variable), { kind: 'array' });
-
-      const shape = arr.shape;
-      let slice, height, width;
-
-      if (datasetConfig.isMultiYear && shape.length === 4) {
-        // Multi-year: [year, month, y, x]
-        const yearArr = await zarr.open(root.resolve('year'), { kind: 'array' });
-        const yearResult = await zarr.get(yearArr, [null]);
-        const years = Array.from(yearResult.data).map(y => Number(y));
-        const yearIndex = years.indexOf(selectedYear);
-
-        if (yearIndex === -1) {
-          console.error(`Year ${selectedYear} not found. Available years:`, years.slice(0, 5), '...', years.slice(-5));
+      // Revisiting a frame (scrubbing back, toggling datasets) reuses the
+      // encoded image instead of refetching, recolouring and re-encoding it
+      const frameKey = `${storePath}/${datasetConfig.variable}|${loadYear}|${loadTimeIndex}`;
+      let frame = imageCache.get(frameKey);
+      if (!frame) {
+        const store = new zarr.FetchStore(storePath);
+        const root = zarr.root(store);
+        const arr = await zarr.open(root.resolve(datasetConfig.variable), { kind: 'array' });
+
+        const shape = arr.shape;
+        let slice, height, width;
+
+        if (datasetConfig.isMultiYear && shape.length === 4) {
+          // Multi-year: [year, month, y, x]
+          const years = await loadCoordinate(storePath, 'year');
+          const yearIndex = years.indexOf(loadYear);
+
+          if (yearIndex === -1) {
+            console.error(`Year ${loadYear} not found. Available years:`, years.slice(0, 5), '...', years.slice(-5));
+            setLoading(false);
+            return;
+          }
+          console.log(`[LEAFLET] Found year ${loadYear} at index ${yearIndex}`);
+
+          height = shape[2];
+          width = shape[3];
+          slice = await zarr.get(arr, [yearIndex, loadTimeIndex, null, null]);
+        } else if (shape.length === 3) {
+          // Single year: [time, y, x]
+          height = shape[1];
+          width = shape[2];
+          slice = await zarr.get(arr, [loadTimeIndex, null, null]);
+        } else {
+          console.error('Unexpected data shape:', shape);
           setLoading(false);
           return;
         }
-        console.log(`[LEAFLET] Found year ${selectedYear} at index ${yearIndex}`);
-
-        height = shape[2];
-        width = shape[3];
-        slice = await zarr.get(arr, [yearIndex, timeIndex, null, null]);
-      } else if (shape.length === 3) {
-        // Single year: [time, y, x]
-        height = shape[1];
-        width = shape[2];
-        slice = await zarr.get(arr, [timeIndex, null, null]);
-      } else {
-        console.error('Unexpected data shape:', shape);
-        setLoading(false);
-        return;
+
+        const rawData = slice.data;
+        const rgba = applyColormap(
+          rawData, width, height,
+          datasetConfig.colormap,
+          datasetConfig.vmin,
+          datasetConfig.vmax
+        );
+
+        // Create image with optimized canvas
+        const canvas = document.createElement('canvas');
+        canvas.width = width;
+        canvas.height = height;
+        // Use willReadFrequently for better GPU path selection
+        const ctx = canvas.getContext('2d', { willReadFrequently: false, alpha: true });
+        ctx.imageSmoothingEnabled = true;
+        ctx.imageSmoothingQuality = 'high';
+        const imageData = new ImageData(rgba, width, height);
+        ctx.putImageData(imageData, 0, 0);
+        // Lossless either way (WebP only where exact, else PNG): lossy
+        // formats smear colormap bins and alpha edges
+        frame = { blob: await canvasToCachedFrameBlob(canvas), width, height };
+        imageCache.set(frameKey, frame);
       }
 
+      const { width, height } = frame;
       console.log(`[LEAFLET] Data shape: ${width}x${height}`);
-      setDataShape({ width, height });
-      const rawData = slice.data;
-      const rgba = applyColormap(
-        rawData, width, height,
-        datasetConfig.colormap,
-        datasetConfig.vmin,
-        datasetConfig.vmax
-      );
-
-      // Create image with optimized canvas
-      const canvas = document.createElement('canvas');
-      canvas.width = width;
-      canvas.height = height;
-      // Use willReadFrequently for better GPU path selection
-      const ctx = canvas.getContext('2d', { willReadFrequently: false, alpha: true });
-      ctx.imageSmoothingEnabled = true;
-      ctx.imageSmoothingQuality = 'high';
-      const imageData = new ImageData(rgba, width, height);
-      ctx.putImageData(imageData, 0, 0);
-      // Use PNG for better quality (JPEG has artifacts at edges)
-      const dataUrl = canvas.toDataURL('image/png');
+      // Keep the previous object when the shape is unchanged so time steps
+      // within a level don't re-render the info panel
+      setDataShape((prev) => (
+        prev && prev.width === width && prev.height === height ? prev : { width, height }
+      ));
+      const imageUrl = URL.createObjectURL(frame.blob);
 
       // Get data bounds
       let latLngBounds;
@@ -527,12 +405,8 @@ export default function LeafletUnifiedMap({ onShowWelcome }) {
         latLngBounds = L.latLngBounds(sw, ne);
       } else {
         // Web Mercator - get bounds from Zarr coordinates
-        const xArr = await zarr.open(root.resolve('x'), { kind: 'array' });
-        const yArr = await zarr.open(root.resolve('y'), { kind: 'array' });
-        const xResult = await zarr.get(xArr);
-        const yResult = await zarr.get(yArr);
-        const xCoords = Array.from(xResult.data);
-        const yCoords = Array.from(yResult.data);
+        const xCoords = await loadCoordinate(storePath, 'x');
+        const yCoords = await loadCoordinate(storePath, 'y');
 
         // Convert Web Mercator to lat/lng
         const west = xCoords[0] * 180 / 20037508.34;
@@ -548,7 +422,7 @@ export default function LeafletUnifiedMap({ onShowWelcome }) {
       const oldOverlay = imageOverlayRef.current;
 
       // Create new overlay (initially transparent)
-      const newOverlay = L.imageOverlay(dataUrl, latLngBounds, {
+      const newOverlay = L.imageOverlay(imageUrl, latLngBounds, {
         opacity: 0,
         interactive: false,
         className: 'data-overlay-smooth',
@@ -557,7 +431,7 @@ export default function LeafletUnifiedMap({ onShowWelcome }) {
 
       // Fade in new layer
       requestAnimationFrame(() => {
-        newOverlay.setOpacity(opacity);
+        newOverlay.setOpacity(opacityRef.current);
 
         // Remove old layer after brief delay (allows smooth crossfade)
         setTimeout(() => {
@@ -568,6 +442,7 @@ export default function LeafletUnifiedMap({ onShowWelcome }) {
       });
 
       imageOverlayRef.current = newOverlay;
+      retainObjectURL(overlayUrlsRef.current, imageUrl);
       lastLoadKeyRef.current = loadKey;
 
       const duration = performance.now() - startTime;
@@ -579,7 +454,7 @@ export default function LeafletUnifiedMap({ onShowWelcome }) {
     } finally {
       setLoading(false);
     }
-  }, [selectedDataset, datasetConfig, currentLevel, timeIndex, selectedYear, isPolar]);
+  }, [selectedDataset, datasetConfig, currentLevel, loadTimeIndex, loadYear, isPolar]);
 
   // ============================================================================
   // TIMESERIES LOADING
@@ -594,17 +469,10 @@ export default function LeafletUnifiedMap({ onShowWelcome }) {
     try {
       const level = 2;
       const storePath = `${API_URL}${datasetConfig.path}/${level}`;
-      const store = new zarr.FetchStore(storePath);
-      const root = zarr.root(store);
-      const arr = await zarr.open(root.resolve(datasetConfig.variable), { kind: 'array' });
 
       // Get coordinate arrays
-      const xArr = await zarr.open(root.resolve('x'), { kind: 'array' });
-      const yArr = await zarr.open(root.resolve('y'), { kind: 'array' });
-      const xResult = await zarr.get(xArr);
-      const yResult = await zarr.get(yArr);
-      const xCoords = Array.from(xResult.data);
-      const yCoords = Array.from(yResult.data);
+      const xCoords = await loadCoordinate(storePath, 'x');
+      const yCoords = await loadCoordinate(storePath, 'y');
 
       // Convert click coordinates to data coordinates
       let dataX, dataY;
@@ -622,14 +490,25 @@ export default function LeafletUnifiedMap({ onShowWelcome }) {
 
       console.log(`[TIMESERIES] Click (${lat.toFixed(2)}, ${lng.toFixed(2)}) -> pixel (${xIdx}, ${yIdx})`);
 
+      // Clicks are snapped to their data pixel, so repeat clicks anywhere
+      // within the same pixel reuse the cached series
+      const cacheKey = `${storePath}/${datasetConfig.variable}|${selectedYear}|${yIdx}|${xIdx}`;
+      const cached = timeseriesCache.get(cacheKey);
+      if (cached !== undefined) {
+        setTimeseries(cached);
+        return;
+      }
+
+      const store = new zarr.FetchStore(storePath);
+      const root = zarr.root(store);
+      const arr = await zarr.open(root.resolve(datasetConfig.variable), { kind: 'array' });
+
       // Load all months
       const shape = arr.shape;
       let timeseriesData = [];
 
       if (datasetConfig.isMultiYear && shape.length === 4) {
-        const yearArr = await zarr.open(root.resolve('year'), { kind: 'array' });
-        const yearResult = await zarr.get(yearArr);
-        const years = Array.from(yearResult.data).map(y => Number(y));
+        const years = await loadCoordinate(storePath, 'year');
         const yearIndex = years.indexOf(selectedYear);
 
         if (yearIndex !== -1) {
@@ -658,7 +537,9 @@ export default function LeafletUnifiedMap({ onShowWelcome }) {
       }
 
       const hasValidData = timeseriesData.some(d => d.value !== null);
-      setTimeseries(hasValidData ? timeseriesData : null);
+      const series = hasValidData ? timeseriesData : null;
+      timeseriesCache.set(cacheKey, series);
+      setTimeseries(series);
 
     } catch (error) {
       console.error('[TIMESERIES] Error:', error);
@@ -690,10 +571,11 @@ export default function LeafletUnifiedMap({ onShowWelcome }) {
     if (selectedDataset && mapInstanceRef.current) {
       loadData();
     }
-  }, [selectedDataset, currentLevel, timeIndex, selectedYear, loadData]);
+  }, [selectedDataset, currentLevel, loadTimeIndex, loadYear, loadData]);
 
-  // Update opacity when it changes
+  // Update opacity when it changes - display only, no data reload
   useEffect(() => {
+    opacityRef.current = opacity;
     if (imageOverlayRef.current) {
       imageOverlayRef.current.setOpacity(opacity);
     }
@@ -757,6 +639,34 @@ Loader: zarrita.js`;
     });
   };
 
+  // The chart only depends on the series, dataset and month marker, so
+  // memoise it to skip rebuilding recharts' tree on unrelated re-renders
+  const timeseriesChart = useMemo(() => timeseries && (
+    <ResponsiveContainer width="100%" height={180}>
+      <LineChart data={timeseries} margin={{ top: 10, right: 20, left: 0, bottom: 5 }}>
+        <CartesianGrid strokeDasharray="3 3" stroke="#333" />
+        <XAxis dataKey="month" tick={{ fill: '#888', fontSize: 10 }} />
+        <YAxis
+          domain={[datasetConfig?.vmin || 0, datasetConfig?.vmax || 100]}
+          tick={{ fill: '#888', fontSize: 10 }}
+        />
+        <Tooltip
+          contentStyle={{ background: 'rgba(0,0,0,0.9)', border: '1px solid #4fd1c5' }}
+          formatter={(value) => [value?.toFixed(3) || 'N/A', datasetConfig?.unit || '']}
+        />
+        <ReferenceLine x={MONTHS[timeIndex]} stroke="#4fd1c5" strokeDasharray="5 5" />
+        <Line
+          type="monotone"
+          dataKey="value"
+          stroke="#63b3ed"
+          strokeWidth={2}
+          dot={{ fill: '#63b3ed', r: 3 }}
+          connectNulls={false}
+        />
+      </LineChart>
+    </ResponsiveContainer>
+  ), [timeseries, datasetConfig, timeIndex]);
+
   // ============================================================================
   // RENDER
   // ============================================================================
@@ -810,10 +720,7 @@ Loader: zarrita.js`;
             placeholder="Select dataset..."
             value={selectedDataset}
             onChange={handleDatasetChange}
-            data={Object.entries(DATASETS).map(([key, cfg]) => ({
-              value: key,
-              label: cfg.name,
-            }))}
+            data={DATASET_OPTIONS}
             styles={{
               input: { background: 'rgba(255,255,255,0.05)' },
               dropdown: { zIndex: 10000 }
@@ -832,10 +739,7 @@ Loader: zarrita.js`;
                 min={datasetConfig.yearRange.start}
                 max={datasetConfig.yearRange.end}
                 step={1}
-                marks={[
-                  { value: datasetConfig.yearRange.start, label: String(datasetConfig.yearRange.start) },
-                  { value: datasetConfig.yearRange.end, label: String(datasetConfig.yearRange.end) },
-                ]}
+                marks={YEAR_MARKS[selectedDataset]}
                 size="xs"
                 color="cyan"
               />
@@ -854,11 +758,7 @@ Loader: zarrita.js`;
                 min={0}
                 max={11}
                 step={1}
-                marks={[
-                  { value: 0, label: 'Jan' },
-                  { value: 6, label: 'Jul' },
-                  { value: 11, label: 'Dec' },
-                ]}
+                marks={MONTH_MARKS}
                 size="xs"
                 color="cyan"
               />
@@ -921,14 +821,9 @@ Loader: zarrita.js`;
               title="Copy tech info"
             >
               {copied ? (
-                <svg width="12" height="12" viewBox="0 0 24 24" fill="none" stroke="currentColor" strokeWidth="2">
-                  <polyline points="20,6 9,17 4,12" />
-                </svg>
+                {CHECK_ICON}
               ) : (
-                <svg width="12" height="12" viewBox="0 0 24 24" fill="none" stroke="currentColor" strokeWidth="2">
-                  <rect x="9" y="9" width="13" height="13" rx="2" />
-                  <path d="M5 15H4a2 2 0 01-2-2V4a2 2 0 012-2h9a2 2 0 012 2v1" />
-                </svg>
+                {COPY_ICON}
               )}
             </ActionIcon>
           </Group>
@@ -1066,15 +961,10 @@ Loader: zarrita.js`;
       >
         <Stack gap={4}>
           <ActionIcon variant="subtle" color="cyan" onClick={handleZoomIn}>
-            <svg width="18" height="18" viewBox="0 0 24 24" fill="none" stroke="currentColor" strokeWidth="2">
-              <line x1="12" y1="5" x2="12" y2="19" />
-              <line x1="5" y1="12" x2="19" y2="12" />
-            </svg>
+            {ZOOM_IN_ICON}
           </ActionIcon>
           <ActionIcon variant="subtle" color="cyan" onClick={handleZoomOut}>
-            <svg width="18" height="18" viewBox="0 0 24 24" fill="none" stroke="currentColor" strokeWidth="2">
-              <line x1="5" y1="12" x2="19" y2="12" />
-            </svg>
+            {ZOOM_OUT_ICON}
           </ActionIcon>
         </Stack>
       </Paper>
@@ -1101,11 +991,7 @@ Loader: zarrita.js`;
               <div style={{
                 width: 16,
                 height: 100,
-                background: `linear-gradient(to bottom, ${
-                  [...COLORMAPS[datasetConfig.colormap]].reverse()
-                    .map((c, i, arr) => `rgb(${c[0]},${c[1]},${c[2]}) ${i/(arr.length-1)*100}%`)
-                    .join(', ')
-                })`,
+                background: LEGEND_GRADIENTS[datasetConfig.colormap],
                 borderRadius: 4,
                 margin: '4px 0',
               }} />
@@ -1159,31 +1045,7 @@ Loader: zarrita.js`;
               <div style={{ display: 'flex', justifyContent: 'center', alignItems: 'center', height: 180 }}>
                 <Text size="xs" c="dimmed">Loading...</Text>
               </div>
-            ) : timeseries ? (
-              <ResponsiveContainer width="100%" height={180}>
-                <LineChart data={timeseries} margin={{ top: 10, right: 20, left: 0, bottom: 5 }}>
-                  <CartesianGrid strokeDasharray="3 3" stroke="#333" />
-                  <XAxis dataKey="month" tick={{ fill: '#888', fontSize: 10 }} />
-                  <YAxis
-                    domain={[datasetConfig?.vmin || 0, datasetConfig?.vmax || 100]}
-                    tick={{ fill: '#888', fontSize: 10 }}
-                  />
-                  <Tooltip
-                    contentStyle={{ background: 'rgba(0,0,0,0.9)', border: '1px solid #4fd1c5' }}
-                    formatter={(value) => [value?.toFixed(3) || 'N/A', datasetConfig?.unit || '']}
-                  />
-                  <ReferenceLine x={MONTHS[timeIndex]} stroke="#4fd1c5" strokeDasharray="5 5" />
-                  <Line
-                    type="monotone"
-                    dataKey="value"
-                    stroke="#63b3ed"
-                    strokeWidth={2}
-                    dot={{ fill: '#63b3ed', r: 3 }}
-                    connectNulls={false}
-                  />
-                </LineChart>
-              </ResponsiveContainer>
-            ) : (
+            ) : timeseriesChart || (
               <Text size="sm" c="dimmed" ta="center" mt="xl">
                 No data at this location
               </Text>
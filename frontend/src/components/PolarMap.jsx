@@ -9,6 +9,8 @@ import 'leaflet/dist/leaflet.css';
 import 'proj4';
 import 'proj4leaflet';
 import * as zarr from 'zarrita';
+import { packColors, verticalGradient } from '../config/colourPalettes';
+import { canvasToObjectURL, fetchDataDeduplicated, findNearestIndex, loadCoordinate, retainObjectURL, timeseriesCache } from '../utils/dataOptimizations';
 import {
   Paper,
   Text,
@@ -38,6 +40,7 @@ import {
   ReferenceLine,
 } from 'recharts';
 import proj4 from 'proj4';
+import { ZOOM_IN_ICON, ZOOM_OUT_ICON } from './MapIcons';
 
 const API_URL = import.meta.env.VITE_API_URL || 'http://localhost:8000';
 
@@ -103,6 +106,21 @@ const PYRAMID_LEVELS = {
 
 const MONTHS = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'];
 
+// Month slider marks, shared across renders
+const MONTH_MARKS = [
+  { value: 0, label: 'Jan' },
+  { value: 6, label: 'Jul' },
+  { value: 11, label: 'Dec' },
+];
+
+// Year marks on the combined month/year timeline slider (1988-2023)
+const TIMELINE_MARKS = [
+  { value: 0, label: '1988' },
+  { value: 12 * 12, label: '2000' },
+  { value: 24 * 12, label: '2012' },
+  { value: 35 * 12, label: '2023' },
+];
+
 // Ice colormap - dark blue to white
 const ICE_COLORMAP = [
   [10, 20, 40], [20, 40, 80], [40, 80, 140], [60, 120, 180],
@@ -110,6 +128,13 @@ const ICE_COLORMAP = [
   [240, 250, 255], [255, 255, 255]
 ];
 
+// Vertical legend gradient (100% at the top), built once
+const ICE_LEGEND_GRADIENT = verticalGradient(ICE_COLORMAP);
+// Ice colormap as packed RGBA pixels at the overlay alpha
+const ICE_PACKED_COLORMAP = packColors(ICE_COLORMAP, 200);
+// Uncertainty overlay bands (5-15, 15-25, 25+) as packed RGB; alpha is per pixel
+const UNCERTAINTY_PACKED_COLORS = packColors([[255, 180, 0], [255, 120, 0], [255, 60, 0]], 0);
+
 // Dataset configurations - matching ZarrMap structure
 const DATASETS = {
   soil_moisture: { name: 'Soil Moisture' },
@@ -120,6 +145,12 @@ const DATASETS = {
   sea_ice_with_quality: { name: 'Sea Ice with Quality Data' },
 };
 
+// Dataset picker options, built once rather than on every render
+const DATASET_OPTIONS = Object.entries(DATASETS).map(([key, cfg]) => ({
+  value: key,
+  label: cfg.name,
+}));
+
 // Polar dataset configurations (all EPSG:3413)
 const POLAR_DATASETS = {
   sea_ice: {
@@ -189,41 +220,80 @@ const TECH_STACK = {
 };
 
 function applyColormap(data, width, height, vmin = 0, vmax = 100) {
-  const colormap = ICE_COLORMAP;
-  const range = vmax - vmin;
-  const numColors = colormap.length;
+  const colors = ICE_PACKED_COLORMAP;
+  const lastColor = colors.length - 1;
+  // Normalise and scale to a colour index in one multiply-add
+  const scale = lastColor / (vmax - vmin);
   const rgba = new Uint8ClampedArray(width * height * 4);
+  // Masked pixels stay transparent (zeroed buffer); others take one store
+  const pixels = new Uint32Array(rgba.buffer);
 
   for (let i = 0; i < width * height; i++) {
-    const idx = i * 4;
     const value = data[i];
 
-    if (isNaN(value) || value <= 0) {
-      rgba[idx] = 0;
-      rgba[idx + 1] = 0;
-      rgba[idx + 2] = 0;
-      rgba[idx + 3] = 0;
+    // Fails for NaN as well as non-positive values
+    if (!(value > 0)) {
       continue;
     }
 
-    const normalized = Math.max(0, Math.min(1, (value - vmin) / range));
-    const colorIdx = Math.min(numColors - 1, Math.floor(normalized * (numColors - 1)));
-    const color = colormap[colorIdx];
-
-    rgba[idx] = color[0];
-    rgba[idx + 1] = color[1];
-    rgba[idx + 2] = color[2];
-    rgba[idx + 3] = 200;
+    const pos = (value - vmin) * scale;
+    pixels[i] = colors[pos <= 0 ? 0 : pos >= lastColor ? lastColor : Math.floor(pos)];
   }
 
   return rgba;
 }
 
+// Month/year shown after the given one during autoplay
+function nextFrame(year, month, multiYear) {
+  if (multiYear && month >= 11) {
+    const { start, end } = SEA_ICE_MULTIYEAR.yearRange;
+    return { year: year >= end ? start : year + 1, month: 0 };
+  }
+  return { year, month: (month + 1) % 12 };
+}
+
+// Fetch one sea ice slice, shared between display and autoplay prefetch.
+// Resolves to null when the requested year is outside the store.
+function fetchPolarSlice(datasetKey, level, time, year, multiYear) {
+  const dsConfig = POLAR_DATASETS[datasetKey] || POLAR_DATASETS.sea_ice_multiyear;
+  const effectiveLevel = dsConfig.maxLevel !== undefined ? Math.min(level, dsConfig.maxLevel) : level;
+  const cacheKey = multiYear
+    ? `polar-${datasetKey}-${effectiveLevel}-${year}-${time}`
+    : `polar-${datasetKey}-${effectiveLevel}-${time}`;
+
+  return fetchDataDeduplicated(cacheKey, async () => {
+    const storePath = `${API_URL}${dsConfig.path}/${effectiveLevel}`;
+    const store = new zarr.FetchStore(storePath);
+    const root = zarr.root(store);
+    const arr = await zarr.open(root.resolve(dsConfig.variable), { kind: 'array' });
+    const shape = arr.shape;
+
+    if (multiYear && shape.length === 4) {
+      // Multi-year: [year, month, y, x]
+      const years = await loadCoordinate(storePath, 'year');
+      const yearIndex = years.indexOf(year);
+      if (yearIndex === -1) {
+        console.error(`[POLAR] Year ${year} not found in dataset. Available: ${years[0]}-${years[years.length-1]}`);
+        return null;
+      }
+      const slice = await zarr.get(arr, [yearIndex, time, null, null]);
+      return { data: slice.data, size: shape[2] };
+    }
+
+    // Single year: [time, y, x]
+    const slice = await zarr.get(arr, [time, null, null]);
+    return { data: slice.data, size: shape[1] };
+  });
+}
+
 export default function PolarMap({ onBack, initialDataset = 'sea_ice_multiyear' }) {
   const mapRef = useRef(null);
   const mapInstanceRef = useRef(null);
   const imageOverlayRef = useRef(null);
   const uncertaintyOverlayRef = useRef(null);
+  // Object URLs behind each overlay, revoked once no longer displayed
+  const overlayUrlsRef = useRef([]);
+  const uncertaintyUrlsRef = useRef([]);
   const basemapLayerRef = useRef(null);
   const [loading, setLoading] = useState(true);
   const [timeIndex, setTimeIndex] = useState(0);
@@ -240,7 +310,6 @@ export default function PolarMap({ onBack, initialDataset = 'sea_ice_multiyear'
   const [isPlaying, setIsPlaying] = useState(false);
   const [techInfoOpen, setTechInfoOpen] = useState(true); // Default to open
   const [selectedBasemap, setSelectedBasemap] = useState('satellite');
-  const playIntervalRef = useRef(null);
 
   // Uncertainty visualization state
   const [showUncertainty, setShowUncertainty] = useState(false);
@@ -257,20 +326,6 @@ export default function PolarMap({ onBack, initialDataset = 'sea_ice_multiyear'
   const [loadStartTime, setLoadStartTime] = useState(null);
   const [loadDuration, setLoadDuration] = useState(null);
 
-  // Helper: find nearest index in array
-  const findNearestIndex = (arr, value) => {
-    let minDiff = Infinity;
-    let nearestIdx = 0;
-    for (let i = 0; i < arr.length; i++) {
-      const diff = Math.abs(arr[i] - value);
-      if (diff < minDiff) {
-        minDiff = diff;
-        nearestIdx = i;
-      }
-    }
-    return nearestIdx;
-  };
-
   // Initialize the polar stereographic map
   useEffect(() => {
     if (!mapRef.current || mapInstanceRef.current) return;
@@ -310,6 +365,11 @@ export default function PolarMap({ onBack, initialDataset = 'sea_ice_multiyear'
       attribution: '© NASA GIBS',
       noWrap: true,
       bounds: [[-90, -180], [90, 180]],
+      // Fetch tiles once the view settles and keep a wider ring of loaded
+      // tiles, so pans and zoom animations reuse tiles instead of refetching
+      updateWhenZooming: false,
+      updateWhenIdle: true,
+      keepBuffer: 4,
     }).addTo(map);
 
     // Add graticule (lat/lon lines) - these provide geographic reference
@@ -410,43 +470,11 @@ export default function PolarMap({ onBack, initialDataset = 'sea_ice_multiyear'
     setLoadStartTime(startTime);
     setLoadDuration(null);
     try {
-      // Get dataset config
-      const dsConfig = POLAR_DATASETS[datasetKey] || POLAR_DATASETS.sea_ice_multiyear;
-      const effectiveLevel = dsConfig.maxLevel !== undefined ? Math.min(level, dsConfig.maxLevel) : level;
-      const storePath = `${API_URL}${dsConfig.path}/${effectiveLevel}`;
-      console.log(`[POLAR] Loading ${datasetKey} level ${effectiveLevel}, ${multiYear ? `year ${year}, ` : ''}time ${time}`);
+      console.log(`[POLAR] Loading ${datasetKey} level ${level}, ${multiYear ? `year ${year}, ` : ''}time ${time}`);
+      const slice = await fetchPolarSlice(datasetKey, level, time, year, multiYear);
+      if (!slice) return;
 
-      const store = new zarr.FetchStore(storePath);
-      const root = zarr.root(store);
-      const arr = await zarr.open(root.resolve(dsConfig.variable), { kind: 'array' });
-
-      const shape = arr.shape;
-      let size, slice;
-
-      if (multiYear && shape.length === 4) {
-        // Multi-year: [year, month, y, x]
-        // Find year index
-        const yearArr = await zarr.open(root.resolve('year'), { kind: 'array' });
-        const yearResult = await zarr.get(yearArr, [null]);
-        const years = Array.from(yearResult.data).map(y => Number(y));
-        const yearIndex = years.indexOf(year);
-
-        if (yearIndex === -1) {
-          console.error(`[POLAR] Year ${year} not found in dataset. Available: ${years[0]}-${years[years.length-1]}`);
-          setLoading(false);
-          return;
-        }
-
-        size = shape[2]; // y dimension
-        slice = await zarr.get(arr, [yearIndex, time, null, null]);
-        console.log(`[POLAR] Loaded year ${year} (index ${yearIndex}), month ${time}`);
-      } else {
-        // Single year: [time, y, x]
-        size = shape[1];
-        slice = await zarr.get(arr, [time, null, null]);
-      }
-
-      const rawData = slice.data;
+      const { data: rawData, size } = slice;
 
       const rgba = applyColormap(rawData, size, size);
 
@@ -457,7 +485,8 @@ export default function PolarMap({ onBack, initialDataset = 'sea_ice_multiyear'
       const imageData = new ImageData(rgba, size, size);
       ctx.putImageData(imageData, 0, 0);
 
-      const dataUrl = canvas.toDataURL();
+      const dataUrl = await canvasToObjectURL(canvas);
+      retainObjectURL(overlayUrlsRef.current, dataUrl);
 
       if (mapInstanceRef.current) {
         // Use sea ice data bounds (different from GIBS map bounds)
@@ -497,17 +526,10 @@ export default function PolarMap({ onBack, initialDataset = 'sea_ice_multiyear'
     try {
       const level = 2; // Use a middle resolution for timeseries
       const storePath = `${API_URL}/zarr/sea_ice_polar_multiyear/${level}`;
-      const store = new zarr.FetchStore(storePath);
-      const root = zarr.root(store);
-      const arr = await zarr.open(root.resolve('ice_concentration'), { kind: 'array' });
 
       // Get x/y coordinate arrays
-      const xArr = await zarr.open(root.resolve('x'), { kind: 'array' });
-      const yArr = await zarr.open(root.resolve('y'), { kind: 'array' });
-      const xResult = await zarr.get(xArr);
-      const yResult = await zarr.get(yArr);
-      const xCoords = Array.from(xResult.data);
-      const yCoords = Array.from(yResult.data);
+      const xCoords = await loadCoordinate(storePath, 'x');
+      const yCoords = await loadCoordinate(storePath, 'y');
 
       // Convert lat/lon to EPSG:3413 polar stereographic
       const wgs84 = 'EPSG:4326';
@@ -520,10 +542,16 @@ export default function PolarMap({ onBack, initialDataset = 'sea_ice_multiyear'
 
       console.log(`[POLAR Timeseries] (${lat.toFixed(2)}°N, ${lng.toFixed(2)}°E) -> polar (${polarX.toFixed(0)}, ${polarY.toFixed(0)}) -> pixel (${xIdx}, ${yIdx})`);
 
+      // Repeat clicks within the same pixel reuse the cached series
+      const cacheKey = `${storePath}/ice_concentration|${selectedYear}|${yIdx}|${xIdx}`;
+      const cached = timeseriesCache.get(cacheKey);
+      if (cached !== undefined) {
+        setTimeseries(cached);
+        return;
+      }
+
       // Get year array
-      const yearArr = await zarr.open(root.resolve('year'), { kind: 'array' });
-      const yearResult = await zarr.get(yearArr);
-      const years = Array.from(yearResult.data).map(y => Number(y));
+      const years = await loadCoordinate(storePath, 'year');
       const yearIndex = years.indexOf(selectedYear);
 
       if (yearIndex === -1) {
@@ -531,6 +559,8 @@ export default function PolarMap({ onBack, initialDataset = 'sea_ice_multiyear'
       }
 
       // Load all 12 months for this year at this location
+      const store = new zarr.FetchStore(storePath);
+      const arr = await zarr.open(zarr.root(store).resolve('ice_concentration'), { kind: 'array' });
       const result = await zarr.get(arr, [yearIndex, null, yIdx, xIdx]);
       const monthValues = result.data;
 
@@ -547,11 +577,9 @@ export default function PolarMap({ onBack, initialDataset = 'sea_ice_multiyear'
       console.log(`[POLAR Timeseries] Year ${selectedYear}:`, timeseriesData.map(d => d.value?.toFixed(1)));
 
       const hasValidData = timeseriesData.some(d => d.value !== null);
-      if (hasValidData) {
-        setTimeseries(timeseriesData);
-      } else {
-        setTimeseries(null);
-      }
+      const series = hasValidData ? timeseriesData : null;
+      timeseriesCache.set(cacheKey, series);
+      setTimeseries(series);
     } catch (err) {
       console.error('[POLAR Timeseries] Error:', err);
       setTimeseries(null);
@@ -611,33 +639,30 @@ export default function PolarMap({ onBack, initialDataset = 'sea_ice_multiyear'
         const slice = await zarr.get(arr, [timeIndex, null, null]);
         const uncertaintyData = slice.data;
 
-        // Create orange overlay for high uncertainty areas
+        // Create orange overlay for high uncertainty areas in a single pass:
+        // one packed colour write plus the alpha byte per visible pixel
         const rgba = new Uint8ClampedArray(size * size * 4);
+        const pixels = new Uint32Array(rgba.buffer);
         for (let i = 0; i < size * size; i++) {
-          const idx = i * 4;
           const uncertainty = uncertaintyData[i];
 
-          if (isNaN(uncertainty) || uncertainty < 5) {
-            rgba[idx] = 0;
-            rgba[idx + 1] = 0;
-            rgba[idx + 2] = 0;
-            rgba[idx + 3] = 0;
-          } else if (uncertainty < 15) {
-            rgba[idx] = 255;
-            rgba[idx + 1] = 180;
-            rgba[idx + 2] = 0;
-            rgba[idx + 3] = Math.min(80, (uncertainty - 5) * 8);
+          // NaN or low uncertainty stays transparent (the buffer starts zeroed)
+          if (!(uncertainty >= 5)) continue;
+
+          let band;
+          let alpha;
+          if (uncertainty < 15) {
+            band = 0;
+            alpha = Math.min(80, (uncertainty - 5) * 8);
           } else if (uncertainty < 25) {
-            rgba[idx] = 255;
-            rgba[idx + 1] = 120;
-            rgba[idx + 2] = 0;
-            rgba[idx + 3] = Math.min(140, 80 + (uncertainty - 15) * 6);
+            band = 1;
+            alpha = Math.min(140, 80 + (uncertainty - 15) * 6);
           } else {
-            rgba[idx] = 255;
-            rgba[idx + 1] = 60;
-            rgba[idx + 2] = 0;
-            rgba[idx + 3] = Math.min(200, 140 + (uncertainty - 25) * 3);
+            band = 2;
+            alpha = Math.min(200, 140 + (uncertainty - 25) * 3);
           }
+          pixels[i] = UNCERTAINTY_PACKED_COLORS[band];
+          rgba[i * 4 + 3] = alpha;
         }
 
         const canvas = document.createElement('canvas');
@@ -646,7 +671,8 @@ export default function PolarMap({ onBack, initialDataset = 'sea_ice_multiyear'
         const ctx = canvas.getContext('2d');
         const imageData = new ImageData(rgba, size, size);
         ctx.putImageData(imageData, 0, 0);
-        const dataUrl = canvas.toDataURL();
+        const dataUrl = await canvasToObjectURL(canvas);
+        retainObjectURL(uncertaintyUrlsRef.current, dataUrl);
 
         const sw = mapInstanceRef.current.options.crs.unproject(L.point(SEA_ICE_BOUNDS.xmin, SEA_ICE_BOUNDS.ymin));
         const ne = mapInstanceRef.current.options.crs.unproject(L.point(SEA_ICE_BOUNDS.xmax, SEA_ICE_BOUNDS.ymax));
@@ -669,40 +695,25 @@ export default function PolarMap({ onBack, initialDataset = 'sea_ice_multiyear'
     loadUncertaintyOverlay();
   }, [showUncertainty, selectedPolarDataset, timeIndex, currentLevel]);
 
-  // Handle autoplay - cycles through months and years for multi-year mode
+  // Handle autoplay - cycles through months and years for multi-year mode.
+  // Each step is scheduled only once the current frame has finished loading,
+  // so a slow connection never stacks up overlapping slice requests.
   useEffect(() => {
-    if (isPlaying) {
-      playIntervalRef.current = setInterval(() => {
-        if (isMultiYear) {
-          // Multi-year: cycle through months, then advance year
-          setTimeIndex((prevMonth) => {
-            if (prevMonth >= 11) {
-              // Move to next year
-              setSelectedYear((prevYear) => {
-                const maxYear = SEA_ICE_MULTIYEAR.yearRange.end;
-                const minYear = SEA_ICE_MULTIYEAR.yearRange.start;
-                return prevYear >= maxYear ? minYear : prevYear + 1;
-              });
-              return 0;
-            }
-            return prevMonth + 1;
-          });
-        } else {
-          // Single year: just cycle months
-          setTimeIndex((prev) => (prev + 1) % 12);
-        }
-      }, 800); // Slightly faster for multi-year
-    } else {
-      if (playIntervalRef.current) {
-        clearInterval(playIntervalRef.current);
-      }
+    if (!isPlaying || loading) return undefined;
+    // Warm the next two frames while this one is on screen
+    let upcoming = { year: selectedYear, month: timeIndex };
+    for (let i = 0; i < 2; i++) {
+      upcoming = nextFrame(upcoming.year, upcoming.month, isMultiYear);
+      fetchPolarSlice(selectedPolarDataset, currentLevel, upcoming.month, upcoming.year, isMultiYear).catch(() => {});
     }
-    return () => {
-      if (playIntervalRef.current) {
-        clearInterval(playIntervalRef.current);
-      }
-    };
-  }, [isPlaying, isMultiYear]);
+
+    const timer = setTimeout(() => {
+      const next = nextFrame(selectedYear, timeIndex, isMultiYear);
+      setSelectedYear(next.year);
+      setTimeIndex(next.month);
+    }, 800);
+    return () => clearTimeout(timer);
+  }, [isPlaying, isMultiYear, loading, timeIndex, selectedYear, selectedPolarDataset, currentLevel]);
 
   // Zoom handlers
   const handleZoomIn = () => mapInstanceRef.current?.zoomIn();
@@ -918,10 +929,7 @@ export default function PolarMap({ onBack, initialDataset = 'sea_ice_multiyear'
                 onBack();
               }
             }}
-            data={Object.entries(DATASETS).map(([key, cfg]) => ({
-              value: key,
-              label: cfg.name,
-            }))}
+            data={DATASET_OPTIONS}
             styles={{
               input: { background: 'rgba(255,255,255,0.05)' },
               dropdown: { zIndex: 10000 }
@@ -973,12 +981,7 @@ export default function PolarMap({ onBack, initialDataset = 'sea_ice_multiyear'
                 min={0}
                 max={(SEA_ICE_MULTIYEAR.totalYears) * 12 - 1}
                 step={1}
-                marks={[
-                  { value: 0, label: '1988' },
-                  { value: 12 * 12, label: '2000' },
-                  { value: 24 * 12, label: '2012' },
-                  { value: 35 * 12, label: '2023' },
-                ]}
+                marks={TIMELINE_MARKS}
                 size="xs"
                 color="cyan"
               />
@@ -989,11 +992,7 @@ export default function PolarMap({ onBack, initialDataset = 'sea_ice_multiyear'
                 min={0}
                 max={11}
                 step={1}
-                marks={[
-                  { value: 0, label: 'Jan' },
-                  { value: 6, label: 'Jul' },
-                  { value: 11, label: 'Dec' },
-                ]}
+                marks={MONTH_MARKS}
                 size="xs"
                 color="cyan"
               />
@@ -1058,15 +1057,10 @@ export default function PolarMap({ onBack, initialDataset = 'sea_ice_multiyear'
       >
         <Stack gap={4}>
           <ActionIcon variant="subtle" color="cyan" onClick={handleZoomIn} title="Zoom in">
-            <svg width="18" height="18" viewBox="0 0 24 24" fill="none" stroke="currentColor" strokeWidth="2">
-              <line x1="12" y1="5" x2="12" y2="19" />
-              <line x1="5" y1="12" x2="19" y2="12" />
-            </svg>
+            {ZOOM_IN_ICON}
           </ActionIcon>
           <ActionIcon variant="subtle" color="cyan" onClick={handleZoomOut} title="Zoom out">
-            <svg width="18" height="18" viewBox="0 0 24 24" fill="none" stroke="currentColor" strokeWidth="2">
-              <line x1="5" y1="12" x2="19" y2="12" />
-            </svg>
+            {ZOOM_OUT_ICON}
           </ActionIcon>
         </Stack>
       </Paper>
@@ -1092,11 +1086,7 @@ export default function PolarMap({ onBack, initialDataset = 'sea_ice_multiyear'
             <div style={{
               width: 16,
               height: 100,
-              background: `linear-gradient(to bottom, ${
-                [...ICE_COLORMAP].reverse()
-                  .map((c, i, arr) => `rgb(${c[0]},${c[1]},${c[2]}) ${i/(arr.length-1)*100}%`)
-                  .join(', ')
-              })`,
+              background: ICE_LEGEND_GRADIENT,
               borderRadius: 4,
               boxShadow: '0 2px 8px rgba(0,0,0,0.3)',
               margin: '4px 0',
@@ -1280,13 +1270,16 @@ export default function PolarMap({ onBack, initialDataset = 'sea_ice_multiyear'
         }
       `}</style>
 
-      {/* Uncertainty Modal - shown when switching to sea_ice_with_quality */}
+      {/* Uncertainty Modal - shown when switching to sea_ice_with_quality.
+          No backdrop blur or transition, so the map underneath is not
+          re-composited while it is open */}
       <Modal
         opened={uncertaintyModalOpen}
         onClose={() => setUncertaintyModalOpen(false)}
         title="Dataset with Quality Data"
         centered
-        overlayProps={{ backgroundOpacity: 0.55, blur: 3 }}
+        overlayProps={{ backgroundOpacity: 0.55, blur: 0 }}
+        transitionProps={{ duration: 0 }}
         styles={{
           header: { background: 'rgba(26, 26, 46, 0.98)' },
           content: { background: 'rgba(26, 26, 46, 0.98)' },
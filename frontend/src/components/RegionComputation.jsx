@@ -2,7 +2,7 @@
  * RegionComputation - Draw polygons and compute mean values
  * Shift+Click to start drawing, click to add vertices, Enter or click near start to close
  */
-import { useState, useCallback, useEffect } from 'react';
+import { useState, useCallback, useEffect, useMemo } from 'react';
 import { PolygonLayer, ScatterplotLayer } from '@deck.gl/layers';
 import {
   Paper,
@@ -183,21 +183,56 @@ export function useRegionComputation({ enabled, onComputeMean }) {
     setComputeResult(null);
   }, []);
 
-  // Build layers for rendering
-  const layers = [];
+  // Build layers for rendering. Memoised so host re-renders (hover, slider
+  // moves) hand deck.gl the same layer data instead of rebuilding it.
+  const layers = useMemo(() => {
+    const regionLayers = [];
+
+    // Drawing outline layer (during drawing)
+    if (isDrawing && vertices.length > 0) {
+      // Line connecting vertices
+      if (vertices.length > 1) {
+        regionLayers.push(
+          new PolygonLayer({
+            id: 'region-drawing-outline',
+            data: [{ polygon: vertices }],
+            getPolygon: d => d.polygon,
+            getFillColor: [79, 209, 197, 30],
+            getLineColor: [79, 209, 197, 200],
+            getLineWidth: 2,
+            lineWidthUnits: 'pixels',
+            stroked: true,
+            filled: true,
+            pickable: false,
+          })
+        );
+      }
 
-  // Drawing outline layer (during drawing)
-  if (isDrawing && vertices.length > 0) {
-    // Line connecting vertices
-    if (vertices.length > 1) {
-      layers.push(
+      // Vertex points
+      regionLayers.push(
+        new ScatterplotLayer({
+          id: 'region-drawing-vertices',
+          // Vertices are passed as-is; the start vertex is picked out by index
+          data: vertices,
+          getPosition: d => d,
+          getRadius: (d, { index }) => index === 0 ? 8 : 5,
+          getFillColor: (d, { index }) => index === 0 ? [255, 200, 0, 255] : [79, 209, 197, 255],
+          radiusUnits: 'pixels',
+          pickable: false,
+        })
+      );
+    }
+
+    // Closed polygon layer
+    if (closedPolygon) {
+      regionLayers.push(
         new PolygonLayer({
-          id: 'region-drawing-outline',
-          data: [{ polygon: vertices }],
+          id: 'region-closed-polygon',
+          data: [{ polygon: closedPolygon }],
           getPolygon: d => d.polygon,
-          getFillColor: [79, 209, 197, 30],
-          getLineColor: [79, 209, 197, 200],
-          getLineWidth: 2,
+          getFillColor: [79, 209, 197, 50],
+          getLineColor: [79, 209, 197, 255],
+          getLineWidth: 3,
           lineWidthUnits: 'pixels',
           stroked: true,
           filled: true,
@@ -206,37 +241,8 @@ export function useRegionComputation({ enabled, onComputeMean }) {
       );
     }
 
-    // Vertex points
-    layers.push(
-      new ScatterplotLayer({
-        id: 'region-drawing-vertices',
-        data: vertices.map((v, i) => ({ position: v, isStart: i === 0 })),
-        getPosition: d => d.position,
-        getRadius: d => d.isStart ? 8 : 5,
-        getFillColor: d => d.isStart ? [255, 200, 0, 255] : [79, 209, 197, 255],
-        radiusUnits: 'pixels',
-        pickable: false,
-      })
-    );
-  }
-
-  // Closed polygon layer
-  if (closedPolygon) {
-    layers.push(
-      new PolygonLayer({
-        id: 'region-closed-polygon',
-        data: [{ polygon: closedPolygon }],
-        getPolygon: d => d.polygon,
-        getFillColor: [79, 209, 197, 50],
-        getLineColor: [79, 209, 197, 255],
-        getLineWidth: 3,
-        lineWidthUnits: 'pixels',
-        stroked: true,
-        filled: true,
-        pickable: false,
-      })
-    );
-  }
+    return regionLayers;
+  }, [isDrawing, vertices, closedPolygon]);
 
   return {
     handleClick,
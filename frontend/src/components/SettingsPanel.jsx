@@ -18,7 +18,7 @@ import { getFeatureFlags, setFeatureFlag, resetFeatureFlags } from '../config/fe
 import { getPaletteOptions } from '../config/colourPalettes';
 
 export function SettingsPanel({ isOpen, onClose, onPaletteChange, currentPalette }) {
-  const [flags, setFlags] = useState(getFeatureFlags());
+  const [flags, setFlags] = useState(getFeatureFlags);
 
   // Refresh flags when panel opens
   useEffect(() => {
@@ -10,7 +10,7 @@
  * - Beautiful UI with smooth transitions
  */
 
-import { useState, useEffect, useRef, useCallback, useMemo } from 'react';
+import { lazy, Suspense, useState, useEffect, useRef, useCallback, useMemo } from 'react';
 import DeckGL from '@deck.gl/react';
 import { BitmapLayer, ScatterplotLayer } from '@deck.gl/layers';
 import { TileLayer } from '@deck.gl/geo-layers';
@@ -46,14 +46,19 @@ import {
 
 // Zarr loading with zarrita
 import * as zarr from 'zarrita';
+import { packColors, verticalGradient } from '../config/colourPalettes';
 
 // Data loading optimizations (caching, deduplication, preloading)
 import {
+  canvasToObjectURL,
   dataCache,
   imageCache as dataImageCache,
   fetchDataDeduplicated,
+  findNearestIndex,
+  loadCoordinate,
   preloadAdjacentTimeSlices,
   getCacheStats,
+  timeseriesCache,
 } from '../utils/dataOptimizations';
 
 // Viewport utilities for efficient partial loading
@@ -65,8 +70,7 @@ import {
   calculateCoverage,
 } from '../utils/viewportUtils';
 
-// Settings panel and feature flags
-import { SettingsPanel } from './SettingsPanel';
+// Feature flags (the settings panel itself is code-split, see below)
 import { getFeatureFlags } from '../config/featureFlags';
 
 // Region computation
@@ -76,6 +80,9 @@ import {
   DrawingInstructions,
 } from './RegionComputation';
 
+// Most visitors never open settings, so its panel is fetched on first open
+const SettingsPanel = lazy(() => import('./SettingsPanel').then((m) => ({ default: m.SettingsPanel })));
+
 // CSS for animations
 const styleSheet = document.createElement('style');
 styleSheet.textContent = `
@@ -182,6 +189,32 @@ const LOADING_FACTS = {
   ],
 };
 
+// Flattened, category-tagged facts for the welcome screen rotation
+const ALL_LOADING_FACTS = Object.entries(LOADING_FACTS).flatMap(
+  ([category, facts]) => facts.map(text => ({ text, category }))
+);
+
+// Welcome screen dataset card styles per preload state
+const PENDING_LOAD_STATUS = { status: 'pending', loaded: 0, total: 0 };
+
+const datasetCardStyle = (background, border, opacity) => ({
+  card: {
+    background,
+    borderRadius: 6,
+    padding: '8px 4px',
+    textAlign: 'center',
+    border,
+    transition: 'all 0.3s ease',
+  },
+  icon: { fontSize: 20, marginBottom: 4, opacity },
+});
+
+const DATASET_CARD_STYLES = {
+  complete: datasetCardStyle('rgba(79, 209, 197, 0.15)', '1px solid rgba(79, 209, 197, 0.4)', 1),
+  loading: datasetCardStyle('rgba(79, 209, 197, 0.08)', '1px solid rgba(255, 255, 255, 0.1)', 0.8),
+  pending: datasetCardStyle('rgba(255, 255, 255, 0.03)', '1px solid rgba(255, 255, 255, 0.1)', 0.4),
+};
+
 // Welcome screen content - Internal/Technical view
 const WELCOME_CONTENT = {
   title: "RegexFlow ECV Explorer",
@@ -495,6 +528,12 @@ const DATASETS = {
   },
 };
 
+// Dataset picker options, built once rather than on every render
+const DATASET_OPTIONS = Object.entries(DATASETS).map(([key, cfg]) => ({
+  value: key,
+  label: (key === 'sea_ice' || key === 'sea_ice_with_quality') ? `${cfg.name} (Polar View)` : cfg.name,
+}));
+
 // Technology stack information
 const TECH_STACK = {
   browser: {
@@ -518,6 +557,65 @@ const TECH_STACK = {
   },
 };
 
+// Basemap and technology panel sections only read TECH_STACK, so the
+// element tree is created once and reused by every render
+const TECH_STACK_SECTIONS = (
+  <>
+    {/* Basemap Section */}
+    <Box>
+      <Text size="xs" fw={600} c="cyan" mb={4}>Basemap</Text>
+      <Group gap={4}>
+        <Text size="xs" c="dimmed">Provider:</Text>
+        <Text size="xs" c="white">{TECH_STACK.basemap.provider}</Text>
+      </Group>
+      <Group gap={4}>
+        <Text size="xs" c="dimmed">Style:</Text>
+        <Text size="xs" c="white">{TECH_STACK.basemap.style}</Text>
+      </Group>
+      <Text size="xs" c="dimmed" mt={2}>{TECH_STACK.basemap.attribution}</Text>
+    </Box>
+
+    <Divider color="dark.5" />
+
+    {/* Technology Stack Section */}
+    <Box>
+      <Text size="xs" fw={600} c="cyan" mb={4}>Browser Technologies</Text>
+      <Group gap={4}>
+        <Text size="xs" c="dimmed">Visualization:</Text>
+        <Text size="xs" c="white">{TECH_STACK.browser.visualization}</Text>
+      </Group>
+      <Group gap={4}>
+        <Text size="xs" c="dimmed">Zarr Loader:</Text>
+        <Text size="xs" c="white">{TECH_STACK.browser.zarrLoader}</Text>
+      </Group>
+      <Group gap={4}>
+        <Text size="xs" c="dimmed">UI Framework:</Text>
+        <Text size="xs" c="white">{TECH_STACK.browser.ui}</Text>
+      </Group>
+      <Group gap={4}>
+        <Text size="xs" c="dimmed">Colormap:</Text>
+        <Text size="xs" c="white">{TECH_STACK.browser.colorMapping}</Text>
+      </Group>
+    </Box>
+
+    <Box>
+      <Text size="xs" fw={600} c="cyan" mb={4}>Backend Technologies</Text>
+      <Group gap={4}>
+        <Text size="xs" c="dimmed">Framework:</Text>
+        <Text size="xs" c="white">{TECH_STACK.backend.framework}</Text>
+      </Group>
+      <Group gap={4}>
+        <Text size="xs" c="dimmed">Data Serving:</Text>
+        <Text size="xs" c="white">{TECH_STACK.backend.dataServing}</Text>
+      </Group>
+      <Group gap={4}>
+        <Text size="xs" c="dimmed">Processing:</Text>
+        <Text size="xs" c="white">{TECH_STACK.backend.processing}</Text>
+      </Group>
+    </Box>
+  </>
+);
+
 // Default pyramid level (use dataset's maxLevel)
 const MAX_PYRAMID_LEVEL = 5;
 
@@ -571,8 +669,39 @@ const COLORMAPS = {
   ],
 };
 
+// Vertical legend gradients (vmax at the top), built once per colormap
+const LEGEND_GRADIENTS = Object.fromEntries(
+  Object.entries(COLORMAPS).map(([name, colors]) => [name, verticalGradient(colors)])
+);
+
+// Colormaps as packed RGBA pixels at the overlay alpha, built once
+const PACKED_COLORMAPS = Object.fromEntries(
+  Object.entries(COLORMAPS).map(([name, colors]) => [name, packColors(colors, 200)])
+);
+
+// Colormap Select options; COLORMAPS is static so this never changes
+const COLORMAP_OPTIONS = Object.keys(COLORMAPS).map(c => ({
+  value: c,
+  label: c.charAt(0).toUpperCase() + c.slice(1),
+}));
+
 const MONTHS = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'];
 
+// Month slider marks, shared across renders
+const MONTH_MARKS = [
+  { value: 0, label: 'Jan' },
+  { value: 6, label: 'Jul' },
+  { value: 11, label: 'Dec' },
+];
+
+// Year marks on the combined month/year timeline slider (1950-2024)
+const TIMELINE_MARKS = [
+  { value: 0, label: '1950' },
+  { value: 30 * 12, label: '1980' },
+  { value: 50 * 12, label: '2000' },
+  { value: 70 * 12, label: '2020' },
+];
+
 // Format legend values for display
 // Fire data: stored in m², display in km² (divide by 1e6)
 function formatLegendValue(value, datasetKey) {
@@ -603,90 +732,123 @@ function getPyramidLevel(mapZoom) {
 
 // Apply colormap to flat data array (more efficient for large data)
 // Apply 3x3 box blur to smooth grid cell edges
-function applySmoothing(flatData, width, height, fillValue = -9999) {
-  const smoothed = new Float32Array(flatData.length);
+// Weighted [1,2,1] x [1,2,1] kernel, applied separably as a masked average
+// (K * value) / (K * valid) so fill values and NaN neighbours are skipped.
+// Smoothing never changes which pixels are valid, so the validity plane and
+// the kernel weights are computed once and shared by every pass. The plane
+// is binary, so its weights are small integers (at most 16) kept in bytes.
+function applySmoothing(flatData, width, height, fillValue = -9999, passes = 1) {
+  const total = width * height;
+  const values = new Float64Array(total);
+  const valid = new Uint8Array(total);
+  for (let i = 0; i < total; i++) {
+    const v = flatData[i];
+    if (v !== fillValue && !isNaN(v)) {
+      values[i] = v;
+      valid[i] = 1;
+    }
+  }
 
+  // Horizontal pass of the kernel over one plane
+  const rowPass = (src, dst) => {
+    for (let y = 0; y < height; y++) {
+      const row = y * width;
+      for (let x = 0; x < width; x++) {
+        const idx = row + x;
+        let sum = 2 * src[idx];
+        if (x > 0) sum += src[idx - 1];
+        if (x < width - 1) sum += src[idx + 1];
+        dst[idx] = sum;
+      }
+    }
+  };
+
+  // Vertical pass at pixel idx of a row-filtered plane
+  const columnSum = (src, idx, y) => {
+    let sum = 2 * src[idx];
+    if (y > 0) sum += src[idx - width];
+    if (y < height - 1) sum += src[idx + width];
+    return sum;
+  };
+
+  const validRows = new Uint8Array(total);
+  const weight = new Uint8Array(total);
+  rowPass(valid, validRows);
   for (let y = 0; y < height; y++) {
     for (let x = 0; x < width; x++) {
       const idx = y * width + x;
-      const centerVal = flatData[idx];
-
-      // Skip fill values
-      if (centerVal === fillValue || isNaN(centerVal)) {
-        smoothed[idx] = centerVal;
-        continue;
+      if (valid[idx]) {
+        weight[idx] = columnSum(validRows, idx, y);
       }
+    }
+  }
 
-      // 3x3 weighted average (Gaussian-like kernel)
-      let sum = 0;
-      let weight = 0;
-
-      for (let dy = -1; dy <= 1; dy++) {
-        for (let dx = -1; dx <= 1; dx++) {
-          const ny = y + dy;
-          const nx = x + dx;
-
-          if (ny >= 0 && ny < height && nx >= 0 && nx < width) {
-            const nidx = ny * width + nx;
-            const nval = flatData[nidx];
-
-            if (nval !== fillValue && !isNaN(nval)) {
-              // Weight: center=4, edges=2, corners=1
-              const w = (dx === 0 && dy === 0) ? 4 : (dx === 0 || dy === 0) ? 2 : 1;
-              sum += nval * w;
-              weight += w;
-            }
-          }
+  const rowSum = new Float64Array(total);
+
+  for (let pass = 0; pass < passes; pass++) {
+    rowPass(values, rowSum);
+    // Only valid centre pixels are smoothed (invalid ones stay 0 here);
+    // round to float32 as each pass's output is stored at that precision
+    for (let y = 0; y < height; y++) {
+      for (let x = 0; x < width; x++) {
+        const idx = y * width + x;
+        if (valid[idx]) {
+          values[idx] = Math.fround(columnSum(rowSum, idx, y) / weight[idx]);
         }
       }
-
-      smoothed[idx] = weight > 0 ? sum / weight : centerVal;
     }
   }
 
+  const smoothed = new Float32Array(total);
+  for (let i = 0; i < total; i++) {
+    smoothed[i] = valid[i] ? values[i] : flatData[i];
+  }
   return smoothed;
 }
 
+// Smoothed copy of each data slice, keyed by the (cached) raw array, so that
+// recolouring the same slice - a colormap or range change - skips the blur.
+// Only the latest smoothing settings are kept per slice, so this holds at
+// most one extra copy of what the data cache holds, and entries are dropped
+// along with the raw slice when it leaves that cache.
+const smoothedSlices = new WeakMap();
+
+function getSmoothedData(flatData, width, height, fillValue, passes) {
+  const cached = smoothedSlices.get(flatData);
+  if (cached && cached.fillValue === fillValue && cached.passes === passes) {
+    return cached.data;
+  }
+  const data = applySmoothing(flatData, width, height, fillValue, passes);
+  smoothedSlices.set(flatData, { fillValue, passes, data });
+  return data;
+}
+
 function applyColormap(flatData, width, height, colormapName, vmin, vmax, fillValue = -9999, smoothingLevel = 2, minThreshold = 0) {
   // Apply smoothing to reduce blocky appearance
   // smoothingLevel: 0=none, 1=light (1 pass), 2=medium (2 passes), 3=strong (4 passes)
   const passes = smoothingLevel === 3 ? 4 : smoothingLevel; // Level 3 gets extra pass
-  let dataToUse = flatData;
-  for (let i = 0; i < passes; i++) {
-    dataToUse = applySmoothing(dataToUse, width, height, fillValue);
-  }
+  const dataToUse = passes > 0 ? getSmoothedData(flatData, width, height, fillValue, passes) : flatData;
 
-  const colormap = COLORMAPS[colormapName] || COLORMAPS.viridis;
-  const range = vmax - vmin;
-  const numColors = colormap.length;
+  const colormap = PACKED_COLORMAPS[colormapName] || PACKED_COLORMAPS.viridis;
+  const lastColor = colormap.length - 1;
+  // Normalise and scale to a colour index in one multiply-add
+  const scale = lastColor / (vmax - vmin);
 
   const rgba = new Uint8ClampedArray(width * height * 4);
+  const pixels = new Uint32Array(rgba.buffer);
   const totalPixels = width * height;
 
   for (let i = 0; i < totalPixels; i++) {
-    const idx = i * 4;
     const value = dataToUse[i];
 
-    // Handle fill values (ocean/missing data) and values below threshold
+    // Handle fill values (ocean/missing data) and values below threshold;
+    // the buffer starts zeroed, so these pixels are already transparent
     if (value === fillValue || isNaN(value) || value === null || value <= minThreshold) {
-      rgba[idx] = 0;
-      rgba[idx + 1] = 0;
-      rgba[idx + 2] = 0;
-      rgba[idx + 3] = 0; // Transparent
       continue;
     }
 
-    // Normalize value to 0-1
-    const normalized = Math.max(0, Math.min(1, (value - vmin) / range));
-
-    // Map to colormap index
-    const colorIdx = Math.floor(normalized * (numColors - 1));
-    const color = colormap[colorIdx];
-
-    rgba[idx] = color[0];
-    rgba[idx + 1] = color[1];
-    rgba[idx + 2] = color[2];
-    rgba[idx + 3] = 200; // Semi-transparent
+    const pos = (value - vmin) * scale;
+    pixels[i] = colormap[pos <= 0 ? 0 : pos >= lastColor ? lastColor : Math.floor(pos)];
   }
 
   return { data: rgba, width, height };
@@ -710,7 +872,7 @@ function getMinMax(arr, fillValue = -9999) {
   return { min, max, validCount, totalCount: arr.length };
 }
 
-// Create ImageData from RGBA array
+// Encode an RGBA array as a PNG object URL (no base64 data URL)
 function createImageBitmap2(rgba, width, height) {
   const canvas = document.createElement('canvas');
   canvas.width = width;
@@ -718,7 +880,7 @@ function createImageBitmap2(rgba, width, height) {
   const ctx = canvas.getContext('2d');
   const imageData = new ImageData(rgba, width, height);
   ctx.putImageData(imageData, 0, 0);
-  return canvas.toDataURL();
+  return canvasToObjectURL(canvas);
 }
 
 // Convert lon/lat to Web Mercator (EPSG:3857)
@@ -729,21 +891,32 @@ function lonLatToWebMercator(lon, lat) {
   return { x, y };
 }
 
-// Find nearest pixel index in coordinate array
-function findNearestIndex(coords, target) {
-  let minDist = Infinity;
-  let minIdx = 0;
-  for (let i = 0; i < coords.length; i++) {
-    const dist = Math.abs(coords[i] - target);
-    if (dist < minDist) {
-      minDist = dist;
-      minIdx = i;
-    }
-  }
-  return minIdx;
+// Read shared-link state from the URL params. Used as initial state so the
+// first render already shows the linked view instead of correcting it after mount.
+function readUrlState() {
+  const params = new URLSearchParams(window.location.search);
+  const urlDataset = params.get('dataset');
+  const urlYear = params.get('year');
+  const urlMonth = params.get('month');
+  const urlLat = params.get('lat');
+  const urlLon = params.get('lon');
+  const urlZoom = params.get('zoom');
+  const urlColormap = params.get('colormap');
+
+  return {
+    dataset: urlDataset && DATASETS[urlDataset] ? urlDataset : null,
+    year: urlYear ? parseInt(urlYear) : null,
+    month: urlMonth ? parseInt(urlMonth) : null,
+    colormap: urlColormap && COLORMAPS[urlColormap] ? urlColormap : null,
+    view: urlLat && urlLon && urlZoom
+      ? { latitude: parseFloat(urlLat), longitude: parseFloat(urlLon), zoom: parseFloat(urlZoom) }
+      : null,
+  };
 }
 
 export function ZarrMap({ onPolarView, onGlobeView }) {
+  const [urlState] = useState(readUrlState);
+
   // Start centred on Europe (ECMWF is in Reading)
   const [viewState, setViewState] = useState({
     longitude: 5,
@@ -753,12 +926,13 @@ export function ZarrMap({ onPolarView, onGlobeView }) {
     maxZoom: 6,
     pitch: 0,
     bearing: 0,
+    ...urlState.view,
   });
 
-  const [timeIndex, setTimeIndex] = useState(0);
-  const [selectedYear, setSelectedYear] = useState(2020); // For multi-year datasets
-  const [colormapName, setColormapName] = useState('browns');
-  const [selectedDataset, setSelectedDataset] = useState(null);
+  const [timeIndex, setTimeIndex] = useState(urlState.month ?? 0);
+  const [selectedYear, setSelectedYear] = useState(urlState.year ?? 2020); // For multi-year datasets
+  const [colormapName, setColormapName] = useState(urlState.colormap ?? 'browns');
+  const [selectedDataset, setSelectedDataset] = useState(urlState.dataset);
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState(null);
   const [imageUrl, setImageUrl] = useState(null);
@@ -814,6 +988,7 @@ export function ZarrMap({ onPolarView, onGlobeView }) {
 
   // Settings panel state
   const [settingsOpen, setSettingsOpen] = useState(false);
+  const [settingsLoaded, setSettingsLoaded] = useState(false); // Mount the lazy panel once first opened
   const [colourPalette, setColourPalette] = useState('default');
 
   // Region presets for quick navigation
@@ -826,7 +1001,7 @@ export function ZarrMap({ onPolarView, onGlobeView }) {
   };
 
   // Welcome screen state
-  const [showWelcome, setShowWelcome] = useState(true);
+  const [showWelcome, setShowWelcome] = useState(!urlState.dataset); // Skip welcome if coming from shared link
   const [welcomeTab, setWelcomeTab] = useState('evaluator'); // 'evaluator' or 'internal'
   const [currentFact, setCurrentFact] = useState({ text: '', category: 'technical' });
   const [preloadProgress, setPreloadProgress] = useState({ loaded: 0, total: 20 });
@@ -848,6 +1023,17 @@ export function ZarrMap({ onPolarView, onGlobeView }) {
   const imageCacheRef = useRef(new Map());
   const MAX_CACHE_SIZE = 24; // Cache up to 24 images (2 datasets × 12 months)
 
+  // Release the cached images' object URLs when the map unmounts
+  useEffect(() => {
+    const imageCache = imageCacheRef.current;
+    return () => {
+      for (const { url } of imageCache.values()) {
+        URL.revokeObjectURL(url);
+      }
+      imageCache.clear();
+    };
+  }, []);
+
   // Store current raw data for region computation
   const currentDataRef = useRef({
     rawData: null,
@@ -900,30 +1086,39 @@ export function ZarrMap({ onPolarView, onGlobeView }) {
     const dataYMax = Math.max(yCoords[0], yCoords[yCoords.length - 1]);
 
     const pixelValues = [];
+    const n = polygonMercator.length;
+    const crossings = new Float64Array(n);
 
-    // Iterate through pixels and check if they're inside the polygon
+    // Scanline fill: per row, find where the polygon edges cross it once,
+    // then test each pixel against those few crossings instead of every edge.
+    // A pixel is inside when an odd number of crossings lie strictly right of it,
+    // matching the ray-casting rule.
     for (let yi = 0; yi < height; yi++) {
+      const py = yCoords[yi] !== undefined ? yCoords[yi] : (dataYMax - (yi / (height - 1)) * (dataYMax - dataYMin));
+      if (py < minY || py > maxY) continue;
+
+      let numCrossings = 0;
+      for (let i = 0, j = n - 1; i < n; j = i++) {
+        const [xi2, yi2] = polygonMercator[i];
+        const [xj, yj] = polygonMercator[j];
+        if ((yi2 > py) !== (yj > py)) {
+          crossings[numCrossings++] = (xj - xi2) * (py - yi2) / (yj - yi2) + xi2;
+        }
+      }
+      if (numCrossings === 0) continue;
+
+      const rowOffset = yi * width;
       for (let xi = 0; xi < width; xi++) {
-        // Get the Mercator coordinates of this pixel
         const px = xCoords[xi] !== undefined ? xCoords[xi] : (dataXMin + (xi / (width - 1)) * (dataXMax - dataXMin));
-        const py = yCoords[yi] !== undefined ? yCoords[yi] : (dataYMax - (yi / (height - 1)) * (dataYMax - dataYMin));
+        if (px < minX || px > maxX) continue;
 
-        // Quick bounding box check
-        if (px < minX || px > maxX || py < minY || py > maxY) continue;
-
-        // Point in polygon check (ray casting) in Mercator coordinates
         let inside = false;
-        for (let i = 0, j = polygonMercator.length - 1; i < polygonMercator.length; j = i++) {
-          const [xi2, yi2] = polygonMercator[i];
-          const [xj, yj] = polygonMercator[j];
-          if (((yi2 > py) !== (yj > py)) && (px < (xj - xi2) * (py - yi2) / (yj - yi2) + xi2)) {
-            inside = !inside;
-          }
+        for (let k = 0; k < numCrossings; k++) {
+          if (px < crossings[k]) inside = !inside;
         }
 
         if (inside) {
-          const idx = yi * width + xi;
-          const value = rawData[idx];
+          const value = rawData[rowOffset + xi];
           // Skip fill values and NaN
           if (value !== undefined && !isNaN(value) && value !== -9999 && value > 0) {
             pixelValues.push(value);
@@ -965,34 +1160,6 @@ export function ZarrMap({ onPolarView, onGlobeView }) {
     showWelcomeRef.current = showWelcome;
   }, [showWelcome]);
 
-  // URL State: Read initial state from URL params on mount
-  useEffect(() => {
-    const params = new URLSearchParams(window.location.search);
-    const urlDataset = params.get('dataset');
-    const urlYear = params.get('year');
-    const urlMonth = params.get('month');
-    const urlLat = params.get('lat');
-    const urlLon = params.get('lon');
-    const urlZoom = params.get('zoom');
-    const urlColormap = params.get('colormap');
-
-    if (urlDataset && DATASETS[urlDataset]) {
-      setSelectedDataset(urlDataset);
-      setShowWelcome(false); // Skip welcome if coming from shared link
-    }
-    if (urlYear) setSelectedYear(parseInt(urlYear));
-    if (urlMonth) setTimeIndex(parseInt(urlMonth));
-    if (urlColormap && COLORMAPS[urlColormap]) setColormapName(urlColormap);
-    if (urlLat && urlLon && urlZoom) {
-      setViewState(prev => ({
-        ...prev,
-        latitude: parseFloat(urlLat),
-        longitude: parseFloat(urlLon),
-        zoom: parseFloat(urlZoom),
-      }));
-    }
-  }, []); // Only on mount
-
   // URL State: Update URL when state changes (debounced)
   useEffect(() => {
     if (showWelcome) return; // Don't update URL while welcome screen is showing
@@ -1014,18 +1181,12 @@ export function ZarrMap({ onPolarView, onGlobeView }) {
   useEffect(() => {
     if (!showWelcome) return;
 
-    const allFacts = [
-      ...LOADING_FACTS.technical.map(t => ({ text: t, category: 'technical' })),
-      ...LOADING_FACTS.climate.map(t => ({ text: t, category: 'climate' })),
-      ...LOADING_FACTS.data.map(t => ({ text: t, category: 'data' })),
-    ];
-
     // Set initial fact
-    setCurrentFact(allFacts[0]);
+    setCurrentFact(ALL_LOADING_FACTS[0]);
 
     const interval = setInterval(() => {
-      factIndexRef.current = (factIndexRef.current + 1) % allFacts.length;
-      setCurrentFact(allFacts[factIndexRef.current]);
+      factIndexRef.current = (factIndexRef.current + 1) % ALL_LOADING_FACTS.length;
+      setCurrentFact(ALL_LOADING_FACTS[factIndexRef.current]);
     }, 4000); // Rotate every 4 seconds
 
     return () => clearInterval(interval);
@@ -1142,21 +1303,28 @@ export function ZarrMap({ onPolarView, onGlobeView }) {
           const arr = await zarr.open(root.resolve(variableName), { kind: 'array' });
           let dataSize = 0;
 
+          // Flat-map slices go into the main loader's data cache under its
+          // keys, so the first frame after the welcome screen is a memory hit
+          const fetchSlice = (dataKey, selection) => item.polar
+            ? zarr.get(arr, selection).then(result => result.data)
+            : fetchDataDeduplicated(dataKey, async () => (await zarr.get(arr, selection)).data);
+
           if (isMultiYear) {
             // Multi-year: [year, month, y, x]
-            const yearArr = await zarr.open(root.resolve('year'), { kind: 'array' });
-            const yearResult = await zarr.get(yearArr);
-            const years = Array.from(yearResult.data).map(y => Number(y));
+            const years = await loadCoordinate(storeUrl, 'year');
             const yearIndex = years.indexOf(item.year);
             if (yearIndex >= 0) {
-              const rawData = await zarr.get(arr, [yearIndex, item.time, null, null]);
-              dataSize = rawData.data.length;
+              const rawData = await fetchSlice(
+                `${item.dataset}-${item.level}-${item.year}-${item.time}-data`,
+                [yearIndex, item.time, null, null],
+              );
+              dataSize = rawData.length;
               console.log(`[PRELOAD] ✓ ${item.dataset} L${item.level} ${item.year}/${MONTHS[item.time]} (${dataSize.toLocaleString()} values)`);
             }
           } else {
             // Single year: [time, y, x]
-            const rawData = await zarr.get(arr, [item.time, null, null]);
-            dataSize = rawData.data.length;
+            const rawData = await fetchSlice(`${item.dataset}-${item.level}-${item.time}-data`, [item.time, null, null]);
+            dataSize = rawData.length;
             console.log(`[PRELOAD] ✓ ${item.dataset} L${item.level} ${MONTHS[item.time]} (${dataSize.toLocaleString()} values)`);
           }
 
@@ -1389,9 +1557,7 @@ export function ZarrMap({ onPolarView, onGlobeView }) {
       const arr = await zarr.open(root.resolve(datasetConfig.variable), { kind: 'array' });
 
       if (datasetConfig.isMultiYear) {
-        const yearArr = await zarr.open(root.resolve('year'), { kind: 'array' });
-        const yearResult = await zarr.get(yearArr);
-        const years = Array.from(yearResult.data).map(y => Number(y));
+        const years = await loadCoordinate(storeUrl, 'year');
         const yearIndex = years.indexOf(year);
         if (yearIndex >= 0) {
           await zarr.get(arr, [yearIndex, month, null, null]);
@@ -1436,6 +1602,9 @@ export function ZarrMap({ onPolarView, onGlobeView }) {
       if (cached) {
         // console.log(`[CACHE] Hit for ${cacheKey}`);
         const cacheStart = performance.now();
+        // Refresh recency so frames on screen are the last to be evicted
+        imageCacheRef.current.delete(cacheKey);
+        imageCacheRef.current.set(cacheKey, cached);
         if (isPlaying) setPrevImageUrl(imageUrl); // Save previous for double-buffer
         setImageUrl(cached.url);
         setCurrentLOD(targetLOD);
@@ -1492,9 +1661,7 @@ export function ZarrMap({ onPolarView, onGlobeView }) {
 
           let years = null;
           if (isMultiYear) {
-            const yearArr = await zarr.open(root.resolve('year'), { kind: 'array' });
-            const yearResult = await zarr.get(yearArr);
-            years = Array.from(yearResult.data).map(y => Number(y));
+            years = await loadCoordinate(storeUrl, 'year');
           }
 
           // Also get array shape
@@ -1663,15 +1830,6 @@ export function ZarrMap({ onPolarView, onGlobeView }) {
           });
         }
 
-        // Calculate bounds from coordinates (for stats and other uses)
-        // Guard against empty arrays
-        const xMin = xCoords && xCoords.length > 0 ? Math.min(...xCoords) : -20037508.34;
-        const xMax = xCoords && xCoords.length > 0 ? Math.max(...xCoords) : 20037508.34;
-        const yMin = yCoords && yCoords.length > 0 ? Math.min(...yCoords) : -20037508.34;
-        const yMax = yCoords && yCoords.length > 0 ? Math.max(...yCoords) : 20037508.34;
-
-        // console.log(`[ZARR] Bounds: x=[${xMin}, ${xMax}], y=[${yMin}, ${yMax}]`);
-
         // Calculate data stats efficiently (no stack overflow)
         // Use dataset-specific fill value for stats calculation
         const statsFillValue = datasetConfig.fillValue !== undefined
@@ -1711,7 +1869,7 @@ export function ZarrMap({ onPolarView, onGlobeView }) {
         const { data: rgba, width: w, height: h } = applyColormap(rawData, width, height, colormapName, vmin, vmax, fillValue, smoothingLevel, minThreshold);
 
         // Create image URL
-        const url = createImageBitmap2(rgba, w, h);
+        const url = await createImageBitmap2(rgba, w, h);
 
         if (isPlaying) setPrevImageUrl(imageUrl); // Save previous for double-buffer
         setImageUrl(url);
@@ -1741,6 +1899,7 @@ export function ZarrMap({ onPolarView, onGlobeView }) {
         // Limit cache size
         if (imageCacheRef.current.size > MAX_CACHE_SIZE) {
           const firstKey = imageCacheRef.current.keys().next().value;
+          URL.revokeObjectURL(imageCacheRef.current.get(firstKey).url);
           imageCacheRef.current.delete(firstKey);
         }
 
@@ -1812,44 +1971,30 @@ export function ZarrMap({ onPolarView, onGlobeView }) {
       const isMultiYear = config.isMultiYear;
       const level = config.maxLevel;
       const storeUrl = `${API_URL}${config.path}/${level}`;
-      const store = new zarr.FetchStore(storeUrl);
-      const root = zarr.root(store);
 
-      const arr = await zarr.open(root.resolve(config.variable), { kind: 'array' });
+      // Multi-year and single-year stores both use Web Mercator x/y
+      // coordinates; the axes are cached per store
+      const xCoords = await loadCoordinate(storeUrl, 'x');
+      const yCoords = await loadCoordinate(storeUrl, 'y');
 
-      let xCoords, yCoords, xIdx, yIdx;
+      const { x, y } = lonLatToWebMercator(lng, lat);
+      const xIdx = findNearestIndex(xCoords, x);
+      const yIdx = findNearestIndex(yCoords, y);
 
-      if (isMultiYear) {
-        // Multi-year now uses Web Mercator x/y coordinates (same as single-year)
-        const xArr = await zarr.open(root.resolve('x'), { kind: 'array' });
-        const yArr = await zarr.open(root.resolve('y'), { kind: 'array' });
-        const xResult = await zarr.get(xArr);
-        const yResult = await zarr.get(yArr);
-        xCoords = Array.from(xResult.data);
-        yCoords = Array.from(yResult.data);
-
-        // Convert click coordinates to Web Mercator
-        const { x, y } = lonLatToWebMercator(lng, lat);
-        xIdx = findNearestIndex(xCoords, x);
-        yIdx = findNearestIndex(yCoords, y);
-
-        console.log(`[Timeseries] ${config.name}: (${lng.toFixed(2)}, ${lat.toFixed(2)}) -> pixel (${xIdx}, ${yIdx})`);
-      } else {
-        // Single-year uses Web Mercator x/y coordinates
-        const xArr = await zarr.open(root.resolve('x'), { kind: 'array' });
-        const yArr = await zarr.open(root.resolve('y'), { kind: 'array' });
-        const xResult = await zarr.get(xArr);
-        const yResult = await zarr.get(yArr);
-        xCoords = Array.from(xResult.data);
-        yCoords = Array.from(yResult.data);
-
-        const { x, y } = lonLatToWebMercator(lng, lat);
-        xIdx = findNearestIndex(xCoords, x);
-        yIdx = findNearestIndex(yCoords, y);
-
-        console.log(`[Timeseries] ${config.name}: (${lng.toFixed(2)}, ${lat.toFixed(2)}) -> pixel (${xIdx}, ${yIdx})`);
+      console.log(`[Timeseries] ${config.name}: (${lng.toFixed(2)}, ${lat.toFixed(2)}) -> pixel (${xIdx}, ${yIdx})`);
+
+      // Repeat clicks within the same pixel reuse the cached series
+      const cacheKey = `${storeUrl}/${config.variable}|${isMultiYear ? selectedYear : ''}|${yIdx}|${xIdx}`;
+      const cached = timeseriesCache.get(cacheKey);
+      if (cached !== undefined) {
+        setTimeseries(cached);
+        return;
       }
 
+      const store = new zarr.FetchStore(storeUrl);
+      const root = zarr.root(store);
+      const arr = await zarr.open(root.resolve(config.variable), { kind: 'array' });
+
       // Load timeseries data
       let timeseriesData = [];
       const fillValue = (isMultiYear || selectedDataset === 'radiation_budget') ? NaN : -9999;
@@ -1857,9 +2002,7 @@ export function ZarrMap({ onPolarView, onGlobeView }) {
       if (isMultiYear) {
         // Multi-year: load data for selected year, all months
         // Array shape: [year, month, lat, lon]
-        const yearArr = await zarr.open(root.resolve('year'), { kind: 'array' });
-        const yearResult = await zarr.get(yearArr);
-        const years = Array.from(yearResult.data).map(v => Number(v));
+        const years = await loadCoordinate(storeUrl, 'year');
         const yearIndex = years.indexOf(selectedYear);
 
         if (yearIndex === -1) {
@@ -1899,11 +2042,9 @@ export function ZarrMap({ onPolarView, onGlobeView }) {
 
       // Check if we have any valid data
       const hasValidData = timeseriesData.some(d => d.value !== null);
-      if (hasValidData) {
-        setTimeseries(timeseriesData);
-      } else {
-        setTimeseries(null);
-      }
+      const series = hasValidData ? timeseriesData : null;
+      timeseriesCache.set(cacheKey, series);
+      setTimeseries(series);
     } catch (err) {
       console.error('[Timeseries] Error:', err);
       setTimeseries(null);
@@ -2266,34 +2407,16 @@ export function ZarrMap({ onPolarView, onGlobeView }) {
                 {/* Dataset cards */}
                 <div style={{ display: 'grid', gridTemplateColumns: 'repeat(5, 1fr)', gap: 8, marginBottom: 12 }}>
                   {WELCOME_CONTENT.datasets.map((ds) => {
-                    const status = datasetLoadStatus[ds.id] || { status: 'pending', loaded: 0, total: 0 };
+                    const status = datasetLoadStatus[ds.id] || PENDING_LOAD_STATUS;
                     const isComplete = status.status === 'complete' || status.status === 'ready';
                     const isLoading = status.status === 'loading';
+                    const cardStyle = isComplete
+                      ? DATASET_CARD_STYLES.complete
+                      : isLoading ? DATASET_CARD_STYLES.loading : DATASET_CARD_STYLES.pending;
 
                     return (
-                      <div
-                        key={ds.id}
-                        style={{
-                          background: isComplete
-                            ? 'rgba(79, 209, 197, 0.15)'
-                            : isLoading
-                              ? 'rgba(79, 209, 197, 0.08)'
-                              : 'rgba(255, 255, 255, 0.03)',
-                          borderRadius: 6,
-                          padding: '8px 4px',
-                          textAlign: 'center',
-                          border: isComplete
-                            ? '1px solid rgba(79, 209, 197, 0.4)'
-                            : '1px solid rgba(255, 255, 255, 0.1)',
-                          transition: 'all 0.3s ease',
-                        }}
-                      >
-                        <div style={{
-                          fontSize: 20,
-                          marginBottom: 4,
-                          opacity: isComplete ? 1 : isLoading ? 0.8 : 0.4,
-                          filter: isLoading ? 'none' : 'none',
-                        }}>
+                      <div key={ds.id} style={cardStyle.card}>
+                        <div style={cardStyle.icon}>
                           {ds.icon}
                         </div>
                         <Text size="xs" c={isComplete ? 'cyan' : 'dimmed'} fw={500} style={{ fontSize: 10 }}>
@@ -2696,58 +2819,7 @@ export function ZarrMap({ onPolarView, onGlobeView }) {
 
             <Divider color="dark.5" />
 
-            {/* Basemap Section */}
-            <Box>
-              <Text size="xs" fw={600} c="cyan" mb={4}>Basemap</Text>
-              <Group gap={4}>
-                <Text size="xs" c="dimmed">Provider:</Text>
-                <Text size="xs" c="white">{TECH_STACK.basemap.provider}</Text>
-              </Group>
-              <Group gap={4}>
-                <Text size="xs" c="dimmed">Style:</Text>
-                <Text size="xs" c="white">{TECH_STACK.basemap.style}</Text>
-              </Group>
-              <Text size="xs" c="dimmed" mt={2}>{TECH_STACK.basemap.attribution}</Text>
-            </Box>
-
-            <Divider color="dark.5" />
-
-            {/* Technology Stack Section */}
-            <Box>
-              <Text size="xs" fw={600} c="cyan" mb={4}>Browser Technologies</Text>
-              <Group gap={4}>
-                <Text size="xs" c="dimmed">Visualization:</Text>
-                <Text size="xs" c="white">{TECH_STACK.browser.visualization}</Text>
-              </Group>
-              <Group gap={4}>
-                <Text size="xs" c="dimmed">Zarr Loader:</Text>
-                <Text size="xs" c="white">{TECH_STACK.browser.zarrLoader}</Text>
-              </Group>
-              <Group gap={4}>
-                <Text size="xs" c="dimmed">UI Framework:</Text>
-                <Text size="xs" c="white">{TECH_STACK.browser.ui}</Text>
-              </Group>
-              <Group gap={4}>
-                <Text size="xs" c="dimmed">Colormap:</Text>
-                <Text size="xs" c="white">{TECH_STACK.browser.colorMapping}</Text>
-              </Group>
-            </Box>
-
-            <Box>
-              <Text size="xs" fw={600} c="cyan" mb={4}>Backend Technologies</Text>
-              <Group gap={4}>
-                <Text size="xs" c="dimmed">Framework:</Text>
-                <Text size="xs" c="white">{TECH_STACK.backend.framework}</Text>
-              </Group>
-              <Group gap={4}>
-                <Text size="xs" c="dimmed">Data Serving:</Text>
-                <Text size="xs" c="white">{TECH_STACK.backend.dataServing}</Text>
-              </Group>
-              <Group gap={4}>
-                <Text size="xs" c="dimmed">Processing:</Text>
-                <Text size="xs" c="white">{TECH_STACK.backend.processing}</Text>
-              </Group>
-            </Box>
+            {TECH_STACK_SECTIONS}
 
             {/* Current Zarr URL */}
             <Box>
@@ -2775,12 +2847,16 @@ export function ZarrMap({ onPolarView, onGlobeView }) {
       </Transition>
 
       {/* Settings Panel */}
-      <SettingsPanel
-        isOpen={settingsOpen && !isFullScreen}
-        onClose={() => setSettingsOpen(false)}
-        currentPalette={colourPalette}
-        onPaletteChange={setColourPalette}
-      />
+      {settingsLoaded && (
+        <Suspense fallback={null}>
+          <SettingsPanel
+            isOpen={settingsOpen && !isFullScreen}
+            onClose={() => setSettingsOpen(false)}
+            currentPalette={colourPalette}
+            onPaletteChange={setColourPalette}
+          />
+        </Suspense>
+      )}
 
       {/* Control Panel - Top Left (hidden in full-screen mode) */}
       <Transition mounted={!isFullScreen} transition="slide-right" duration={300}>
@@ -2867,10 +2943,7 @@ export function ZarrMap({ onPolarView, onGlobeView }) {
                 }
               }
             }}
-            data={Object.entries(DATASETS).map(([key, cfg]) => ({
-              value: key,
-              label: (key === 'sea_ice' || key === 'sea_ice_with_quality') ? `${cfg.name} (Polar View)` : cfg.name,
-            }))}
+            data={DATASET_OPTIONS}
             styles={{
               input: { background: 'rgba(255,255,255,0.05)' },
               dropdown: { zIndex: 10000 }
@@ -2884,7 +2957,7 @@ export function ZarrMap({ onPolarView, onGlobeView }) {
             value={colormapName}
             onChange={setColormapName}
             aria-label="Select colour palette for data visualisation"
-            data={Object.keys(COLORMAPS).map(c => ({ value: c, label: c.charAt(0).toUpperCase() + c.slice(1) }))}
+            data={COLORMAP_OPTIONS}
             styles={{
               input: { background: 'rgba(255,255,255,0.05)' },
               dropdown: { zIndex: 10000 }
@@ -2974,7 +3047,10 @@ export function ZarrMap({ onPolarView, onGlobeView }) {
                   variant={settingsOpen ? 'filled' : 'light'}
                   color="cyan"
                   size="sm"
-                  onClick={() => setSettingsOpen(!settingsOpen)}
+                  onClick={() => {
+                    setSettingsOpen(!settingsOpen);
+                    setSettingsLoaded(true);
+                  }}
                   aria-label="Open settings panel"
                 >
                   <Text size="xs" fw={600}>⚙</Text>
@@ -3049,12 +3125,7 @@ export function ZarrMap({ onPolarView, onGlobeView }) {
                 min={0}
                 max={(datasetConfig.yearRange.end - datasetConfig.yearRange.start + 1) * 12 - 1}
                 step={1}
-                marks={[
-                  { value: 0, label: '1950' },
-                  { value: 30 * 12, label: '1980' },
-                  { value: 50 * 12, label: '2000' },
-                  { value: 70 * 12, label: '2020' },
-                ]}
+                marks={TIMELINE_MARKS}
                 color="cyan"
                 size="sm"
                 aria-label="Time period selector: use arrow keys to change month and year"
@@ -3070,11 +3141,7 @@ export function ZarrMap({ onPolarView, onGlobeView }) {
                 min={0}
                 max={11}
                 step={1}
-                marks={[
-                  { value: 0, label: 'Jan' },
-                  { value: 6, label: 'Jul' },
-                  { value: 11, label: 'Dec' },
-                ]}
+                marks={MONTH_MARKS}
                 color="cyan"
                 size="sm"
                 aria-label="Month selector: use arrow keys to change month"
@@ -3141,11 +3208,7 @@ export function ZarrMap({ onPolarView, onGlobeView }) {
             <div style={{
               width: 16,
               height: 100,
-              background: `linear-gradient(to bottom, ${
-                [...(COLORMAPS[colormapName] || COLORMAPS.viridis)].reverse()
-                  .map((c, i, arr) => `rgb(${c[0]},${c[1]},${c[2]}) ${i/(arr.length-1)*100}%`)
-                  .join(', ')
-              })`,
+              background: LEGEND_GRADIENTS[colormapName] || LEGEND_GRADIENTS.viridis,
               borderRadius: 4,
               boxShadow: '0 2px 8px rgba(0,0,0,0.3)',
               margin: '4px 0',
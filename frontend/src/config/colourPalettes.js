@@ -49,13 +49,40 @@ export function getPalette(key) {
   return palettes[key] || palettes.viridis;
 }
 
+// The palette list is static, so the options are built once and shared
+const PALETTE_OPTIONS = Object.entries(palettes).map(([key, palette]) => ({
+  value: key,
+  label: palette.name + (palette.colourBlindSafe ? ' (colour-blind safe)' : ''),
+  description: palette.description,
+}));
+
 // Get list of available palettes
 export function getPaletteOptions() {
-  return Object.entries(palettes).map(([key, palette]) => ({
-    value: key,
-    label: palette.name + (palette.colourBlindSafe ? ' (colour-blind safe)' : ''),
-    description: palette.description,
-  }));
+  return PALETTE_OPTIONS;
+}
+
+// CSS gradient for a vertical legend bar, last colour (vmax) at the top.
+// Walks the stops from the end rather than copying and reversing the array.
+export function verticalGradient(colors) {
+  const last = colors.length - 1;
+  const stops = new Array(colors.length);
+  for (let i = 0; i <= last; i++) {
+    const c = colors[last - i];
+    stops[i] = `rgb(${c[0]},${c[1]},${c[2]}) ${i / last * 100}%`;
+  }
+  return `linear-gradient(to bottom, ${stops.join(', ')})`;
+}
+
+// Pack [r, g, b] colours into 32-bit RGBA pixels (little-endian, as
+// ImageData is laid out on every platform we target) so a colormap lookup
+// becomes a single Uint32Array store instead of four byte writes.
+export function packColors(colors, alpha = 255) {
+  const packed = new Uint32Array(colors.length);
+  for (let i = 0; i < colors.length; i++) {
+    const [r, g, b] = colors[i];
+    packed[i] = ((alpha << 24) | (b << 16) | (g << 8) | r) >>> 0;
+  }
+  return packed;
 }
 
 export default palettes;
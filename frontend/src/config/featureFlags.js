@@ -18,12 +18,12 @@ function loadFlags() {
   try {
     const stored = localStorage.getItem(STORAGE_KEY);
     if (stored) {
-      return { ...defaults, ...JSON.parse(stored) };
+      return Object.freeze({ ...defaults, ...JSON.parse(stored) });
     }
   } catch (e) {
     console.warn('[FeatureFlags] Failed to load from localStorage:', e);
   }
-  return { ...defaults };
+  return Object.freeze({ ...defaults });
 }
 
 // Save to localStorage
@@ -35,26 +35,27 @@ function saveFlags(flags) {
   }
 }
 
-// Initial load
+// Initial load. The flags object is frozen and replaced on every update, so
+// readers can share it instead of copying it on each call.
 export let featureFlags = loadFlags();
 
 // Update a single flag
 export function setFeatureFlag(key, value) {
-  featureFlags = { ...featureFlags, [key]: value };
+  featureFlags = Object.freeze({ ...featureFlags, [key]: value });
   saveFlags(featureFlags);
   return featureFlags;
 }
 
 // Reset to defaults
 export function resetFeatureFlags() {
-  featureFlags = { ...defaults };
+  featureFlags = Object.freeze({ ...defaults });
   saveFlags(featureFlags);
   return featureFlags;
 }
 
 // Get current flags
 export function getFeatureFlags() {
-  return { ...featureFlags };
+  return featureFlags;
 }
 
 export default featureFlags;
@@ -0,0 +1,175 @@
+/**
+ * Shared configuration for the unified Leaflet and OpenLayers maps:
+ * dataset catalogue, colormaps, month labels and the colormap kernel.
+ * Both views import these, so the tables and the packed colormaps derived
+ * from them are built once for the app rather than once per view.
+ */
+
+import { packColors, verticalGradient } from './colourPalettes';
+
+// ============================================================================
+// DATASET CONFIGURATIONS
+// ============================================================================
+
+export const DATASETS = {
+  soil_moisture_multiyear: {
+    name: 'Soil Moisture ERA5',
+    path: '/zarr/soil_moisture_multiyear',
+    variable: 'soil_moisture',
+    projection: 'EPSG:3857',
+    isMultiYear: true,
+    yearRange: { start: 1988, end: 2023 },
+    maxLevel: 4,
+    colormap: 'soil',
+    vmin: 0.05,
+    vmax: 0.5,
+    unit: 'm³/m³',
+    description: 'ERA5 Volumetric Soil Water Layer 1',
+  },
+  radiation_budget: {
+    name: 'Solar Radiation ERA5',
+    path: '/zarr/radiation_multiyear',
+    variable: 'solar_radiation',
+    projection: 'EPSG:3857',
+    isMultiYear: true,
+    yearRange: { start: 1988, end: 2023 },
+    maxLevel: 3,
+    colormap: 'radiation',
+    vmin: 0,
+    vmax: 25000000,
+    unit: 'J/m²',
+    description: 'Surface Solar Radiation Downwards',
+  },
+  fire_burned_area: {
+    name: 'Fire Burned Area',
+    path: '/zarr/fire_multiyear',
+    variable: 'burned_area',
+    projection: 'EPSG:3857',
+    isMultiYear: true,
+    yearRange: { start: 1988, end: 2023 },
+    maxLevel: 4,
+    colormap: 'fire',
+    vmin: 0,
+    vmax: 100,
+    unit: '%',
+    description: 'MODIS Burned Area',
+  },
+  satellite_radiation: {
+    name: 'Solar Radiation Satellite',
+    path: '/zarr/satellite_radiation',
+    variable: 'solar_radiation',
+    projection: 'EPSG:3857',
+    isMultiYear: true,
+    yearRange: { start: 2001, end: 2024 },
+    maxLevel: 2,
+    colormap: 'radiation',
+    vmin: 0,
+    vmax: 350,
+    unit: 'W/m²',
+    description: 'Surface Incoming Shortwave Radiation',
+  },
+  sea_ice: {
+    name: 'Sea Ice (Polar View)',
+    path: '/zarr/sea_ice_polar_multiyear',
+    variable: 'ice_concentration',
+    projection: 'EPSG:3413',
+    isMultiYear: true,
+    yearRange: { start: 1988, end: 2023 },
+    maxLevel: 3,
+    colormap: 'ice',
+    vmin: 0,
+    vmax: 100,
+    unit: '%',
+    description: 'Sea Ice Concentration',
+    // Polar-specific bounds
+    extent: [-3850000, -5350000, 3750000, 5850000],
+  },
+};
+
+// Dataset picker options, built once rather than on every render
+export const DATASET_OPTIONS = Object.entries(DATASETS).map(([key, cfg]) => ({
+  value: key,
+  label: cfg.name,
+}));
+
+// Year slider end marks per dataset, derived once from the catalogue
+export const YEAR_MARKS = Object.fromEntries(Object.entries(DATASETS).map(([key, cfg]) => [key, cfg.yearRange ? [
+  { value: cfg.yearRange.start, label: String(cfg.yearRange.start) },
+  { value: cfg.yearRange.end, label: String(cfg.yearRange.end) },
+] : []]));
+
+// ============================================================================
+// COLORMAPS
+// ============================================================================
+
+export const COLORMAPS = {
+  soil: [
+    [139, 90, 43], [160, 120, 70], [180, 150, 100], [160, 180, 120],
+    [120, 180, 140], [80, 170, 160], [40, 150, 170], [20, 120, 180],
+    [10, 80, 160], [5, 40, 130]
+  ],
+  radiation: [
+    [20, 20, 60], [40, 40, 100], [60, 60, 140], [100, 80, 160],
+    [140, 100, 160], [180, 120, 140], [220, 140, 100], [250, 180, 60],
+    [255, 220, 40], [255, 255, 200]
+  ],
+  fire: [
+    [80, 30, 10], [140, 45, 5], [180, 60, 0], [210, 80, 0],
+    [235, 110, 0], [250, 140, 10], [255, 170, 30], [255, 200, 60],
+    [255, 230, 100], [255, 255, 180]
+  ],
+  ice: [
+    [10, 20, 40], [20, 40, 80], [40, 80, 140], [60, 120, 180],
+    [100, 160, 210], [140, 190, 230], [180, 215, 245], [210, 235, 255],
+    [240, 250, 255], [255, 255, 255]
+  ],
+};
+
+// Vertical legend gradients (vmax at the top), built once per colormap
+export const LEGEND_GRADIENTS = Object.fromEntries(
+  Object.entries(COLORMAPS).map(([name, colors]) => [name, verticalGradient(colors)])
+);
+
+// Colormaps as packed RGBA pixels at the overlay alpha
+export const PACKED_COLORMAPS = Object.fromEntries(
+  Object.entries(COLORMAPS).map(([name, colors]) => [name, packColors(colors, 200)])
+);
+
+// ============================================================================
+// UTILITY FUNCTIONS
+// ============================================================================
+
+export const MONTHS = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'];
+
+// Month slider marks, shared across renders
+export const MONTH_MARKS = [
+  { value: 0, label: 'Jan' },
+  { value: 6, label: 'Jul' },
+  { value: 11, label: 'Dec' },
+];
+
+export function applyColormap(data, width, height, colormap, vmin, vmax) {
+  const colors = PACKED_COLORMAPS[colormap] || PACKED_COLORMAPS.soil;
+  const lastColor = colors.length - 1;
+  // Normalise and scale to a colour index in one multiply-add
+  const scale = lastColor / (vmax - vmin);
+  const cutoff = vmin * 0.1;
+  const rgba = new Uint8ClampedArray(width * height * 4);
+  // One 32-bit store per pixel; the buffer starts zeroed, so masked
+  // pixels are already transparent and can simply be skipped
+  const pixels = new Uint32Array(rgba.buffer);
+
+  for (let i = 0; i < width * height; i++) {
+    const value = data[i];
+
+    // Fails for NaN as well as values at or below the cutoff
+    if (!(value > cutoff)) {
+      continue;
+    }
+
+    const pos = (value - vmin) * scale;
+    pixels[i] = colors[pos <= 0 ? 0 : pos >= lastColor ? lastColor : Math.floor(pos)];
+  }
+
+  return rgba;
+}
@@ -13,10 +13,21 @@ import * as zarr from 'zarrita';
 
 const API_URL = import.meta.env.VITE_API_URL || 'http://localhost:8000';
 
-// LRU Cache implementation
+// Bytes held by a cached value: typed arrays (raw slices) or objects
+// wrapping one as `data`; anything else is counted only against maxSize
+function sizeOf(value) {
+  if (ArrayBuffer.isView(value)) return value.byteLength;
+  if (value && ArrayBuffer.isView(value.data)) return value.data.byteLength;
+  return 0;
+}
+
+// LRU Cache implementation, bounded by entry count and optionally by bytes,
+// since slice sizes grow 4x per pyramid level
 class LRUCache {
-  constructor(maxSize = 50) {
+  constructor(maxSize = 50, maxBytes = Infinity) {
     this.maxSize = maxSize;
+    this.maxBytes = maxBytes;
+    this.bytes = 0;
     this.cache = new Map();
   }
 
@@ -33,14 +44,18 @@ class LRUCache {
   set(key, value) {
     // Delete if exists to move to end
     if (this.cache.has(key)) {
+      this.bytes -= sizeOf(this.cache.get(key));
       this.cache.delete(key);
     }
-    // Evict oldest if at capacity
-    else if (this.cache.size >= this.maxSize) {
+    this.cache.set(key, value);
+    this.bytes += sizeOf(value);
+
+    // Evict oldest while over either limit, always keeping the new entry
+    while (this.cache.size > 1 && (this.cache.size > this.maxSize || this.bytes > this.maxBytes)) {
       const oldestKey = this.cache.keys().next().value;
+      this.bytes -= sizeOf(this.cache.get(oldestKey));
       this.cache.delete(oldestKey);
     }
-    this.cache.set(key, value);
   }
 
   has(key) {
@@ -49,6 +64,7 @@ class LRUCache {
 
   clear() {
     this.cache.clear();
+    this.bytes = 0;
   }
 
   get size() {
@@ -57,13 +73,171 @@ class LRUCache {
 }
 
 // Global caches
-export const dataCache = new LRUCache(100); // Raw data cache
-export const imageCache = new LRUCache(50); // Rendered image cache
+export const dataCache = new LRUCache(100, 256 * 1024 * 1024); // Raw data cache, at most 256 MiB
+export const imageCache = new LRUCache(50); // Rendered image cache (encoded frames)
 export const metadataCache = new LRUCache(20); // Store metadata cache
+export const timeseriesCache = new LRUCache(200); // Per-pixel click timeseries
 
 // Request deduplication
 const pendingRequests = new Map();
 
+// Dataset keys resolved once per config object instead of re-splitting the path
+const datasetKeys = new WeakMap();
+
+function getDatasetKey(config) {
+  let key = datasetKeys.get(config);
+  if (key === undefined) {
+    key = config.id || config.path.split('/').pop();
+    datasetKeys.set(config, key);
+  }
+  return key;
+}
+
+/**
+ * Cache key for a data slice - must stay in sync with ZarrMap.jsx
+ */
+function getSliceCacheKey(config, level, timeIndex, year = null) {
+  const datasetKey = getDatasetKey(config);
+  return config.isMultiYear && year !== null
+    ? `${datasetKey}-${level}-${year}-${timeIndex}-data`
+    : `${datasetKey}-${level}-${timeIndex}-data`;
+}
+
+// Coordinate arrays (year, x, y) never change for a given store
+const coordinatePromises = new Map();
+
+/**
+ * Load a 1-D coordinate array from a Zarr store, fetching it only once
+ * per store. Concurrent callers share the same in-flight request.
+ */
+export function loadCoordinate(storeUrl, name) {
+  const key = `${storeUrl}/${name}`;
+  let promise = coordinatePromises.get(key);
+  if (!promise) {
+    promise = (async () => {
+      const root = zarr.root(new zarr.FetchStore(storeUrl));
+      const arr = await zarr.open(root.resolve(name), { kind: 'array' });
+      const result = await zarr.get(arr);
+      // Convert in one pass (BigInt years included) without an interim array
+      return Array.from(result.data, Number);
+    })();
+    // Don't cache failures
+    promise.catch(() => coordinatePromises.delete(key));
+    coordinatePromises.set(key, promise);
+  }
+  return promise;
+}
+
+/**
+ * Index of the coordinate nearest to value in a monotonic 1-D grid.
+ * The grids are (near-)regular, so the spacing gives a constant-time first
+ * guess, refined by walking downhill to the true nearest; ties resolve to
+ * the lower index, matching a linear scan.
+ */
+export function findNearestIndex(coords, value) {
+  const last = coords.length - 1;
+  if (last <= 0) return 0;
+  const step = (coords[last] - coords[0]) / last;
+  let i = Math.round((value - coords[0]) / step);
+  i = i > 0 ? (i < last ? i : last) : 0;
+
+  let diff = Math.abs(coords[i] - value);
+  while (i > 0 && Math.abs(coords[i - 1] - value) <= diff) {
+    diff = Math.abs(coords[--i] - value);
+  }
+  while (i < last && Math.abs(coords[i + 1] - value) < diff) {
+    diff = Math.abs(coords[++i] - value);
+  }
+  return i;
+}
+
+/**
+ * Encode a canvas as an image blob (PNG by default).
+ * PNG is lossless in every browser, so colormap bins and alpha edges stay exact.
+ * quality is passed through to toBlob for formats that use it.
+ */
+export function canvasToBlob(canvas, type = 'image/png', quality) {
+  return new Promise((resolve, reject) => {
+    canvas.toBlob((blob) => {
+      if (blob) {
+        resolve(blob);
+      } else {
+        reject(new Error('Canvas encoding failed'));
+      }
+    }, type, quality);
+  });
+}
+
+// Probe pixels: neighbouring saturated colours and partial alpha, which
+// lossy WebP (chroma subsampling) cannot reproduce exactly
+const WEBP_PROBE_PIXELS = [
+  255, 0, 0, 255, 0, 0, 255, 255, 0, 255, 0, 128, 255, 255, 255, 0,
+];
+
+let losslessWebPSupport = null;
+
+/**
+ * Resolves to true if canvas.toBlob('image/webp', 1) round-trips pixels
+ * exactly in this browser. Chromium encodes lossless WebP at quality 1;
+ * other browsers encode lossy WebP or fall back to PNG.
+ */
+export function supportsLosslessWebP() {
+  if (losslessWebPSupport === null) {
+    losslessWebPSupport = (async () => {
+      try {
+        const canvas = document.createElement('canvas');
+        canvas.width = 2;
+        canvas.height = 2;
+        const ctx = canvas.getContext('2d');
+        ctx.putImageData(new ImageData(new Uint8ClampedArray(WEBP_PROBE_PIXELS), 2, 2), 0, 0);
+        const expected = ctx.getImageData(0, 0, 2, 2).data;
+
+        const blob = await canvasToBlob(canvas, 'image/webp', 1);
+        if (blob.type !== 'image/webp') return false;
+        const bitmap = await createImageBitmap(blob);
+        ctx.clearRect(0, 0, 2, 2);
+        ctx.drawImage(bitmap, 0, 0);
+        bitmap.close();
+        const decoded = ctx.getImageData(0, 0, 2, 2).data;
+        return decoded.every((v, i) => v === expected[i]);
+      } catch {
+        return false;
+      }
+    })();
+  }
+  return losslessWebPSupport;
+}
+
+/**
+ * Encode a canvas for an in-memory frame cache: lossless WebP where the
+ * browser guarantees it (smaller blobs to hold), otherwise PNG. WebP is
+ * slower to encode, so this is only for frames that are cached and reused.
+ */
+export async function canvasToCachedFrameBlob(canvas) {
+  return (await supportsLosslessWebP())
+    ? canvasToBlob(canvas, 'image/webp', 1)
+    : canvasToBlob(canvas);
+}
+
+/**
+ * Encode a canvas as a PNG blob and return an object URL for it.
+ * Avoids the base64 round-trip (and ~33% size overhead) of toDataURL.
+ */
+export async function canvasToObjectURL(canvas, type = 'image/png') {
+  return URL.createObjectURL(await canvasToBlob(canvas, type));
+}
+
+/**
+ * Track object URLs for displayed frames, revoking all but the most recent
+ * `keep` (the current frame and the one still fading out).
+ */
+export function retainObjectURL(urls, url, keep = 2) {
+  urls.push(url);
+  while (urls.length > keep) {
+    URL.revokeObjectURL(urls.shift());
+  }
+}
+
 /**
  * Deduplicated data fetch - prevents duplicate network requests
  */
@@ -101,17 +275,13 @@ export async function fetchDataDeduplicated(cacheKey, fetchFn) {
  */
 export function preloadAdjacentTimeSlices(config, currentTime, level, options = {}) {
   const { lookahead = 2, lookbehind = 1, year = null } = options;
-  const datasetKey = config.id || config.path.split('/').pop();
-  const isMultiYear = config.isMultiYear && year !== null;
 
   const preloadTasks = [];
 
   // Preload next slices (higher priority)
   for (let i = 1; i <= lookahead; i++) {
     const nextTime = (currentTime + i) % 12;
-    const cacheKey = isMultiYear
-      ? `${datasetKey}-${level}-${year}-${nextTime}-data`
-      : `${datasetKey}-${level}-${nextTime}-data`;
+    const cacheKey = getSliceCacheKey(config, level, nextTime, year);
 
     if (!dataCache.has(cacheKey)) {
       preloadTasks.push({
@@ -125,9 +295,7 @@ export function preloadAdjacentTimeSlices(config, currentTime, level, options =
   // Preload previous slices (lower priority)
   for (let i = 1; i <= lookbehind; i++) {
     const prevTime = (currentTime - i + 12) % 12;
-    const cacheKey = isMultiYear
-      ? `${datasetKey}-${level}-${year}-${prevTime}-data`
-      : `${datasetKey}-${level}-${prevTime}-data`;
+    const cacheKey = getSliceCacheKey(config, level, prevTime, year);
 
     if (!dataCache.has(cacheKey)) {
       preloadTasks.push({
@@ -178,13 +346,9 @@ export function preloadAdjacentTimeSlices(config, currentTime, level, options =
  * Supports both single-year and multi-year datasets
  */
 export async function loadZarrSlice(config, level, timeIndex, year = null) {
-  // Use consistent cache key format with ZarrMap.jsx
-  const datasetKey = config.id || config.path.split('/').pop();
+  const datasetKey = getDatasetKey(config);
   const isMultiYear = config.isMultiYear && year !== null;
-
-  const cacheKey = isMultiYear
-    ? `${datasetKey}-${level}-${year}-${timeIndex}-data`
-    : `${datasetKey}-${level}-${timeIndex}-data`;
+  const cacheKey = getSliceCacheKey(config, level, timeIndex, year);
 
   return fetchDataDeduplicated(cacheKey, async () => {
     const storeUrl = `${API_URL}${config.path}/${level}`;
@@ -279,7 +443,7 @@ export async function preloadAllLevels(config, timeIndex, maxLevel) {
   const tasks = [];
 
   for (let level = 0; level <= maxLevel; level++) {
-    const cacheKey = `${config.path}-${level}-${timeIndex}`;
+    const cacheKey = getSliceCacheKey(config, level, timeIndex);
     if (!dataCache.has(cacheKey)) {
       tasks.push({ level, cacheKey });
     }
@@ -357,6 +521,7 @@ export function getCacheStats() {
     dataCache: dataCache.size,
     imageCache: imageCache.size,
     metadataCache: metadataCache.size,
+    timeseriesCache: timeseriesCache.size,
     pendingRequests: pendingRequests.size,
   };
 }
@@ -368,6 +533,7 @@ export function clearAllCaches() {
   dataCache.clear();
   imageCache.clear();
   metadataCache.clear();
+  timeseriesCache.clear();
   console.log('[CACHE] All caches cleared');
 }
 
@@ -377,9 +543,8 @@ export function clearAllCaches() {
 export function estimateMemoryUsage() {
   let totalBytes = 0;
 
-  // Data cache (estimate based on typical slice sizes)
-  // Each slice is roughly height * width * 4 bytes
-  totalBytes += dataCache.size * 1024 * 1024; // ~1MB per cached slice
+  // Data cache (tracked exactly from the cached arrays)
+  totalBytes += dataCache.bytes;
 
   // Image cache (base64 strings are roughly 1.33x raw size)
   totalBytes += imageCache.size * 1024 * 1024 * 1.33;
@@ -0,0 +1,353 @@
+"""
+Shared data access for the ECV Explorer MCP servers.
+
+Dataset configuration, coordinate transforms and Zarr point extraction used
+by both the stdio server (ecv_mcp_server.py) and the remote SSE server
+(ecv_mcp_server_remote.py).
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+import json
+import math
+import os
+
+import httpx
+import numpy as np
+
+# Base URL for the Zarr data store
+BASE_URL = os.environ.get("ECV_DATA_URL", "https://ecmwf.regexflow.com/zarr")
+
+# Dataset configurations
+DATASETS = {
+    "soil_moisture": {
+        "id": "soil_moisture_multiyear",
+        "name": "Soil Moisture ERA5 (75 Years)",
+        "path": "/soil_moisture_multiyear",
+        "variable": "soil_moisture",
+        "unit": "m³/m³",
+        "description": "ERA5-Land Reanalysis — Volumetric Soil Water Layer 1 — 1950-2024",
+        "year_range": {"start": 1950, "end": 2024},
+        "projection": "EPSG:3857",
+        "source": {
+            "name": "Copernicus Climate Data Store",
+            "provider": "ECMWF",
+            "dataset": "ERA5-Land monthly averaged data",
+        },
+        "resolution": "0.1° × 0.1° (~9km)",
+        "spatial_coverage": "Global land areas",
+    },
+    "solar_radiation_era5": {
+        "id": "radiation_budget",
+        "name": "Solar Radiation ERA5 (75 Years)",
+        "path": "/radiation_multiyear",
+        "variable": "solar_radiation",
+        "unit": "J/m²",
+        "description": "ERA5 Reanalysis — Surface Solar Radiation Downwards — 1950-2024",
+        "year_range": {"start": 1950, "end": 2024},
+        "projection": "EPSG:4326",
+        "source": {
+            "name": "Copernicus Climate Data Store",
+            "provider": "ECMWF",
+            "dataset": "ERA5 monthly averaged reanalysis",
+        },
+        "resolution": "0.25° × 0.25° (~28km)",
+        "spatial_coverage": "Global",
+    },
+    "fire_burned_area": {
+        "id": "fire_burned_area",
+        "name": "Fire Burned Area Satellite (5 Years)",
+        "path": "/fire_multiyear",
+        "variable": "burned_area",
+        "unit": "m²",
+        "description": "Satellite-Derived — C3S Fire Burned Area — 2019-2023",
+        "year_range": {"start": 2019, "end": 2023},
+        "projection": "EPSG:4326",
+        "source": {
+            "name": "Copernicus Climate Data Store",
+            "provider": "C3S / OLCI",
+            "dataset": "Fire burned area from 2001 to present",
+        },
+        "resolution": "0.25° × 0.25° (~25km)",
+        "spatial_coverage": "Global land areas",
+    },
+    "sea_ice": {
+        "id": "sea_ice",
+        "name": "Sea Ice Satellite (36 Years)",
+        "path": "/sea_ice_polar_multiyear",
+        "variable": "ice_concentration",
+        "unit": "%",
+        "description": "Satellite-Derived — Arctic Sea Ice Concentration — 1988-2023",
+        "year_range": {"start": 1988, "end": 2023},
+        "projection": "EPSG:3413",
+        "source": {
+            "name": "Copernicus Climate Data Store",
+            "provider": "EUMETSAT OSI SAF",
+            "dataset": "Sea ice concentration from 1979 to present",
+        },
+        "resolution": "25km (EASE2 Grid)",
+        "spatial_coverage": "Northern Hemisphere (Arctic)",
+    },
+    "sea_ice_with_quality": {
+        "id": "sea_ice_with_quality",
+        "name": "Sea Ice with Uncertainty (1 Year)",
+        "path": "/sea_ice_with_quality",
+        "variable": "ice_concentration",
+        "unit": "%",
+        "description": "Satellite-Derived — Arctic Sea Ice Concentration with Quality/Uncertainty Data — 2023",
+        "year_range": {"start": 2023, "end": 2023},
+        "projection": "EPSG:3413",
+        "source": {
+            "name": "Copernicus Climate Data Store",
+            "provider": "EUMETSAT OSI SAF",
+            "dataset": "Sea ice concentration with uncertainty estimates",
+        },
+        "resolution": "25km (EASE2 Grid)",
+        "spatial_coverage": "Northern Hemisphere (Arctic)",
+    },
+    "solar_radiation_satellite": {
+        "id": "satellite_radiation",
+        "name": "Solar Radiation Satellite (24 Years)",
+        "path": "/satellite_radiation",
+        "variable": "solar_radiation",
+        "unit": "W/m²",
+        "description": "Satellite-Derived — NASA CERES EBAF Incoming Shortwave — 2001-2024",
+        "year_range": {"start": 2001, "end": 2024},
+        "projection": "EPSG:4326",
+        "source": {
+            "name": "Copernicus Climate Data Store",
+            "provider": "NASA/CERES",
+            "dataset": "NASA CERES EBAF v4.2.1",
+        },
+        "resolution": "1.0° × 1.0° (~100km)",
+        "spatial_coverage": "Global",
+    },
+}
+
+# Highest available pyramid level for each dataset
+PYRAMID_LEVELS = {
+    "soil_moisture": 4,
+    "solar_radiation_era5": 3,
+    "fire_burned_area": 4,
+    "sea_ice": 3,
+    "sea_ice_with_quality": 3,
+    "solar_radiation_satellite": 2,
+}
+
+# Serialised timeseries kept in memory, keyed by (dataset, lon, lat, year)
+TIMESERIES_CACHE_SIZE = 1024
+
+MONTH_NAMES = ["Jan", "Feb", "Mar", "Apr", "May", "Jun",
+               "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
+
+# Dataset list quoted in lookup errors, and the constant month error payload
+AVAILABLE_DATASETS = ", ".join(DATASETS)
+MONTH_ERROR_JSON = json.dumps({"error": "Month must be between 1 and 12"})
+
+
+def lon_lat_to_web_mercator(lon: float, lat: float) -> tuple[float, float]:
+    """Convert longitude/latitude to Web Mercator (EPSG:3857) coordinates."""
+    lat = max(-85.051, min(85.051, lat))
+    x = lon * 20037508.34 / 180.0
+    y = math.log(math.tan((90 + lat) * math.pi / 360.0)) / (math.pi / 180.0)
+    y = y * 20037508.34 / 180.0
+    return x, y
+
+
+def lon_lat_to_polar_stereographic(lon: float, lat: float) -> tuple[float, float]:
+    """Convert longitude/latitude to Polar Stereographic North (EPSG:3413) coordinates."""
+    lat_ts = 70.0
+    lon_0 = -45.0
+    a = 6378137.0
+    e = 0.0818191908426
+
+    lat_rad = math.radians(lat)
+    lon_rad = math.radians(lon)
+    lon_0_rad = math.radians(lon_0)
+    lat_ts_rad = math.radians(lat_ts)
+
+    t = math.tan(math.pi / 4 - lat_rad / 2) / pow((1 - e * math.sin(lat_rad)) / (1 + e * math.sin(lat_rad)), e / 2)
+    t_c = math.tan(math.pi / 4 - lat_ts_rad / 2) / pow((1 - e * math.sin(lat_ts_rad)) / (1 + e * math.sin(lat_ts_rad)), e / 2)
+    m_c = math.cos(lat_ts_rad) / math.sqrt(1 - e * e * math.sin(lat_ts_rad) ** 2)
+
+    rho = a * m_c * t / t_c
+
+    x = rho * math.sin(lon_rad - lon_0_rad)
+    y = -rho * math.cos(lon_rad - lon_0_rad)
+
+    return x, y
+
+
+def nearest_index(coords: np.ndarray, value: float) -> int:
+    """Index of the entry of a monotonic 1-D axis nearest to value.
+
+    Binary search rather than a full np.argmin scan; ties resolve to the
+    lower index, as argmin does.
+    """
+    last = len(coords) - 1
+    if last < 1:
+        return 0
+    descending = coords[0] > coords[-1]
+    axis = coords[::-1] if descending else coords
+    i = min(max(int(np.searchsorted(axis, value)), 1), last)
+    left, right = value - axis[i - 1], axis[i] - value
+    if descending:
+        return last - (i - 1 if left < right else i)
+    return i - 1 if left <= right else i
+
+
+# Shared pool for concurrent chunk downloads
+CHUNK_FETCH_POOL = ThreadPoolExecutor(max_workers=12)
+
+# Branding for tool responses
+BRANDING = {
+    "source": "RegexFlow ECV Explorer",
+    "url": "https://ecmwf.regexflow.com",
+    "attribution": "Data provided by RegexFlow ECV Explorer — ecmwf.regexflow.com"
+}
+
+
+@lru_cache(maxsize=None)
+def store_layout(dataset: str) -> tuple:
+    """Return (url, coords, chunks, dtype) for a dataset's pyramid level.
+
+    The coordinate arrays and variable metadata never change while the
+    server runs, so they are fetched once per dataset instead of on every
+    lookup. Failures raise LookupError so they are not cached.
+    """
+    import blosc
+
+    ds = DATASETS[dataset]
+    level = PYRAMID_LEVELS.get(dataset, 3)
+    url = f"{BASE_URL}{ds['path']}/{level}"
+
+    with httpx.Client(timeout=60.0) as client:
+        # Load coordinate arrays
+        coords = {}
+        for coord_name in ['x', 'y', 'year']:
+            zarray_resp = client.get(f"{url}/{coord_name}/.zarray")
+            if zarray_resp.status_code == 200:
+                meta = json.loads(zarray_resp.content)
+                data_resp = client.get(f"{url}/{coord_name}/0")
+                if data_resp.status_code == 200:
+                    try:
+                        decompressed = blosc.decompress(data_resp.content)
+                        coords[coord_name] = np.frombuffer(decompressed, dtype=np.dtype(meta['dtype']))
+                    except Exception:
+                        coords[coord_name] = np.frombuffer(data_resp.content, dtype=np.dtype(meta['dtype']))
+
+        if 'x' not in coords or 'y' not in coords:
+            raise LookupError("Could not load coordinate arrays")
+
+        # Load variable metadata
+        variable = ds["variable"]
+        zarray_resp = client.get(f"{url}/{variable}/.zarray")
+        if zarray_resp.status_code != 200:
+            raise LookupError(f"Could not load variable {variable}")
+
+    var_meta = json.loads(zarray_resp.content)
+    return url, coords, var_meta["chunks"], np.dtype(var_meta["dtype"])
+
+
+def fetch_point_values(dataset: str, longitude: float, latitude: float, year: int,
+                       month_indices) -> dict | list:
+    """Fetch values for the given months at the pixel nearest to a location.
+
+    Only the chunks for the requested months are downloaded, so single-value
+    lookups do not pay for a full year.
+
+    Returns:
+        A list of values (None where missing) aligned with month_indices,
+        or a dict with an "error" key.
+
+    Raises:
+        httpx.HTTPError: If a chunk request fails or returns an error status
+            other than 404, so that transient failures are never mistaken
+            for (and cached as) missing data.
+    """
+    if dataset not in DATASETS:
+        return {"error": f"Unknown dataset '{dataset}'"}
+
+    ds = DATASETS[dataset]
+    year_range = ds["year_range"]
+
+    if year < year_range["start"] or year > year_range["end"]:
+        return {
+            "error": f"Year {year} out of range [{year_range['start']}-{year_range['end']}]"
+        }
+
+    # Convert coordinates based on dataset projection
+    if ds["projection"] == "EPSG:3413":
+        x, y = lon_lat_to_polar_stereographic(longitude, latitude)
+    elif ds["projection"] == "EPSG:4326":
+        # Data is in lat/lon, no transformation needed
+        x, y = longitude, latitude
+    else:
+        x, y = lon_lat_to_web_mercator(longitude, latitude)
+
+    import blosc
+
+    try:
+        url, coords, chunks, dtype = store_layout(dataset)
+    except LookupError as e:
+        return {"error": str(e)}
+
+    # Find nearest pixel
+    x_idx = nearest_index(coords['x'], x)
+    y_idx = nearest_index(coords['y'], y)
+
+    # Find year index
+    if 'year' in coords:
+        year_matches = np.where(coords['year'] == year)[0]
+        if len(year_matches) == 0:
+            return {"error": f"Year {year} not found in data"}
+        year_idx = int(year_matches[0])
+    else:
+        year_idx = year - year_range["start"]
+
+    variable = ds["variable"]
+
+    with httpx.Client(timeout=60.0) as client:
+        chunk_y = y_idx // chunks[2]
+        chunk_x = x_idx // chunks[3]
+        local_y = y_idx % chunks[2]
+        local_x = x_idx % chunks[3]
+
+        def read_month(month_idx):
+            chunk_key = f"{year_idx}.{month_idx}.{chunk_y}.{chunk_x}"
+            chunk_resp = client.get(f"{url}/{variable}/{chunk_key}")
+
+            # A missing chunk is all fill value; any other failure propagates
+            if chunk_resp.status_code == 404:
+                return None
+            chunk_resp.raise_for_status()
+            try:
+                decompressed = blosc.decompress(chunk_resp.content)
+                chunk_data = np.frombuffer(decompressed, dtype=dtype).reshape(chunks)
+            except Exception:
+                chunk_data = np.frombuffer(chunk_resp.content, dtype=dtype).reshape(chunks)
+
+            value = float(chunk_data[0, 0, local_y, local_x])
+            if np.isnan(value) or value < -1e30:
+                return None
+            return value
+
+        # Month chunks are independent requests, so fetch them concurrently
+        # rather than paying one round trip per month in sequence.
+        values = list(CHUNK_FETCH_POOL.map(read_month, month_indices))
+
+    return values
+
+
+def build_timeseries(dataset: str, values: list) -> list:
+    """Wrap per-month values in the timeseries entries returned by the tools."""
+    unit = DATASETS[dataset]["unit"]
+    return [
+        {
+            "month": MONTH_NAMES[month_idx],
+            "month_index": month_idx,
+            "value": value,
+            "unit": unit
+        }
+        for month_idx, value in enumerate(values)
+    ]
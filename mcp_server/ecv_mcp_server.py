@@ -13,14 +13,23 @@ Tools provided:
 """
 
 import json
-import math
-import os
+from functools import lru_cache
 import sys
 
-import httpx
-import numpy as np
 from mcp.server.fastmcp import FastMCP
 
+from ecv_common import (
+    AVAILABLE_DATASETS,
+    BASE_URL,
+    BRANDING,
+    DATASETS,
+    MONTH_ERROR_JSON,
+    MONTH_NAMES,
+    TIMESERIES_CACHE_SIZE,
+    build_timeseries,
+    fetch_point_values,
+)
+
 # Log to stderr for debugging (shows in Claude Desktop logs)
 def log(msg):
     print(msg, file=sys.stderr)
@@ -30,141 +39,28 @@ log("ECV MCP Server starting...")
 # Create the MCP server
 mcp = FastMCP("ecv-explorer")
 
-# Base URL for the Zarr data store
-BASE_URL = os.environ.get("ECV_DATA_URL", "https://ecmwf.regexflow.com/zarr")
 log(f"Using data URL: {BASE_URL}")
 
-# Dataset configurations
-DATASETS = {
-    "soil_moisture": {
-        "id": "soil_moisture_multiyear",
-        "name": "Soil Moisture ERA5 (75 Years)",
-        "path": "/soil_moisture_multiyear",
-        "variable": "soil_moisture",
-        "unit": "m³/m³",
-        "description": "ERA5-Land Reanalysis — Volumetric Soil Water Layer 1 — 1950-2024",
-        "year_range": {"start": 1950, "end": 2024},
-        "projection": "EPSG:3857",
-        "source": {
-            "name": "Copernicus Climate Data Store",
-            "provider": "ECMWF",
-            "dataset": "ERA5-Land monthly averaged data",
-        },
-        "resolution": "0.1° × 0.1° (~9km)",
-        "spatial_coverage": "Global land areas",
-    },
-    "solar_radiation_era5": {
-        "id": "radiation_budget",
-        "name": "Solar Radiation ERA5 (75 Years)",
-        "path": "/radiation_multiyear",
-        "variable": "solar_radiation",
-        "unit": "J/m²",
-        "description": "ERA5 Reanalysis — Surface Solar Radiation Downwards — 1950-2024",
-        "year_range": {"start": 1950, "end": 2024},
-        "projection": "EPSG:4326",
-        "source": {
-            "name": "Copernicus Climate Data Store",
-            "provider": "ECMWF",
-            "dataset": "ERA5 monthly averaged reanalysis",
-        },
-        "resolution": "0.25° × 0.25° (~28km)",
-        "spatial_coverage": "Global",
-    },
-    "fire_burned_area": {
-        "id": "fire_burned_area",
-        "name": "Fire Burned Area Satellite (5 Years)",
-        "path": "/fire_multiyear",
-        "variable": "burned_area",
-        "unit": "m²",
-        "description": "Satellite-Derived — C3S Fire Burned Area — 2019-2023",
-        "year_range": {"start": 2019, "end": 2023},
-        "projection": "EPSG:4326",
-        "source": {
-            "name": "Copernicus Climate Data Store",
-            "provider": "C3S / OLCI",
-            "dataset": "Fire burned area from 2001 to present",
-        },
-        "resolution": "0.25° × 0.25° (~25km)",
-        "spatial_coverage": "Global land areas",
-    },
-    "sea_ice": {
-        "id": "sea_ice",
-        "name": "Sea Ice Satellite (36 Years)",
-        "path": "/sea_ice_polar_multiyear",
-        "variable": "ice_concentration",
-        "unit": "%",
-        "description": "Satellite-Derived — Arctic Sea Ice Concentration — 1988-2023",
-        "year_range": {"start": 1988, "end": 2023},
-        "projection": "EPSG:3413",
-        "source": {
-            "name": "Copernicus Climate Data Store",
-            "provider": "EUMETSAT OSI SAF",
-            "dataset": "Sea ice concentration from 1979 to present",
-        },
-        "resolution": "25km (EASE2 Grid)",
-        "spatial_coverage": "Northern Hemisphere (Arctic)",
-    },
-    "solar_radiation_satellite": {
-        "id": "satellite_radiation",
-        "name": "Solar Radiation Satellite (24 Years)",
-        "path": "/satellite_radiation",
-        "variable": "solar_radiation",
-        "unit": "W/m²",
-        "description": "Satellite-Derived — NASA CERES EBAF Incoming Shortwave — 2001-2024",
-        "year_range": {"start": 2001, "end": 2024},
-        "projection": "EPSG:4326",
-        "source": {
-            "name": "Copernicus Climate Data Store",
-            "provider": "NASA/CERES",
-            "dataset": "NASA CERES EBAF v4.2.1",
-        },
-        "resolution": "1.0° × 1.0° (~100km)",
-        "spatial_coverage": "Global",
-    },
-}
-
-MONTH_NAMES = ["Jan", "Feb", "Mar", "Apr", "May", "Jun",
-               "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
-
-
-def lon_lat_to_web_mercator(lon: float, lat: float) -> tuple[float, float]:
-    """Convert longitude/latitude to Web Mercator (EPSG:3857) coordinates."""
-    lat = max(-85.051, min(85.051, lat))
-    x = lon * 20037508.34 / 180.0
-    y = math.log(math.tan((90 + lat) * math.pi / 360.0)) / (math.pi / 180.0)
-    y = y * 20037508.34 / 180.0
-    return x, y
-
-
-def lon_lat_to_polar_stereographic(lon: float, lat: float) -> tuple[float, float]:
-    """Convert longitude/latitude to Polar Stereographic North (EPSG:3413) coordinates."""
-    lat_ts = 70.0
-    lon_0 = -45.0
-    a = 6378137.0
-    e = 0.0818191908426
 
-    lat_rad = math.radians(lat)
-    lon_rad = math.radians(lon)
-    lon_0_rad = math.radians(lon_0)
-    lat_ts_rad = math.radians(lat_ts)
-
-    t = math.tan(math.pi / 4 - lat_rad / 2) / pow((1 - e * math.sin(lat_rad)) / (1 + e * math.sin(lat_rad)), e / 2)
-    t_c = math.tan(math.pi / 4 - lat_ts_rad / 2) / pow((1 - e * math.sin(lat_ts_rad)) / (1 + e * math.sin(lat_ts_rad)), e / 2)
-    m_c = math.cos(lat_ts_rad) / math.sqrt(1 - e * e * math.sin(lat_ts_rad) ** 2)
-
-    rho = a * m_c * t / t_c
-
-    x = rho * math.sin(lon_rad - lon_0_rad)
-    y = -rho * math.cos(lon_rad - lon_0_rad)
-
-    return x, y
-
-
-# Branding for tool responses
-BRANDING = {
-    "source": "RegexFlow ECV Explorer",
-    "url": "https://ecmwf.regexflow.com",
-    "attribution": "Data provided by RegexFlow ECV Explorer — ecmwf.regexflow.com"
+# The catalogue is static, so serialise the list/info payloads once at startup
+DATASET_LIST_JSON = json.dumps({
+    "datasets": [
+        {
+            "id": key,
+            "name": dataset["name"],
+            "description": dataset["description"],
+            "years": f"{dataset['year_range']['start']}-{dataset['year_range']['end']}",
+            "unit": dataset["unit"],
+            "provider": dataset["source"]["provider"]
+        }
+        for key, dataset in DATASETS.items()
+    ],
+    "source": BRANDING["attribution"]
+}, indent=2)
+
+DATASET_INFO_JSON = {
+    key: json.dumps({**dataset, "source_attribution": BRANDING["attribution"]}, indent=2)
+    for key, dataset in DATASETS.items()
 }
 
 
@@ -175,20 +71,7 @@ def list_datasets() -> str:
     Returns dataset names, descriptions, temporal coverage, and data sources.
     """
     log("list_datasets called")
-    result = {
-        "datasets": [],
-        "source": BRANDING["attribution"]
-    }
-    for key, dataset in DATASETS.items():
-        result["datasets"].append({
-            "id": key,
-            "name": dataset["name"],
-            "description": dataset["description"],
-            "years": f"{dataset['year_range']['start']}-{dataset['year_range']['end']}",
-            "unit": dataset["unit"],
-            "provider": dataset["source"]["provider"]
-        })
-    return json.dumps(result, indent=2)
+    return DATASET_LIST_JSON
 
 
 @mcp.tool()
@@ -197,7 +80,7 @@ def get_dataset_info(dataset: str) -> str:
 
     Args:
         dataset: Dataset identifier. One of: soil_moisture, solar_radiation_era5,
-                 fire_burned_area, sea_ice, solar_radiation_satellite
+                 fire_burned_area, sea_ice, sea_ice_with_quality, solar_radiation_satellite
 
     Returns:
         Detailed metadata including temporal range, spatial resolution,
@@ -205,8 +88,33 @@ def get_dataset_info(dataset: str) -> str:
     """
     log(f"get_dataset_info called for {dataset}")
     if dataset not in DATASETS:
-        return json.dumps({"error": f"Unknown dataset '{dataset}'. Available: {', '.join(DATASETS.keys())}"})
-    result = {**DATASETS[dataset], "source_attribution": BRANDING["attribution"]}
+        return json.dumps({"error": f"Unknown dataset '{dataset}'. Available: {AVAILABLE_DATASETS}"})
+    return DATASET_INFO_JSON[dataset]
+
+
+@lru_cache(maxsize=TIMESERIES_CACHE_SIZE)
+def timeseries_json(dataset: str, longitude: float, latitude: float, year: int) -> str:
+    """Build the serialised get_timeseries payload for a (rounded) location.
+
+    Results are memoised so repeated queries for the same point skip the
+    remote chunk reads and JSON encoding. Lookup errors are raised rather
+    than returned so they are never cached.
+    """
+    values = fetch_point_values(dataset, longitude, latitude, year, range(12))
+    if isinstance(values, dict):
+        raise LookupError(values["error"])
+
+    ds = DATASETS[dataset]
+    timeseries = build_timeseries(dataset, values)
+
+    result = {
+        "dataset": ds["name"],
+        "location": {"longitude": longitude, "latitude": latitude},
+        "year": year,
+        "unit": ds["unit"],
+        "timeseries": timeseries,
+        "source": BRANDING["attribution"]
+    }
     return json.dumps(result, indent=2)
 
 
@@ -225,120 +133,10 @@ def get_timeseries(dataset: str, longitude: float, latitude: float, year: int) -
     """
     log(f"get_timeseries called: {dataset}, lon={longitude}, lat={latitude}, year={year}")
 
-    if dataset not in DATASETS:
-        return json.dumps({"error": f"Unknown dataset '{dataset}'"})
-
-    ds = DATASETS[dataset]
-    year_range = ds["year_range"]
-
-    if year < year_range["start"] or year > year_range["end"]:
-        return json.dumps({
-            "error": f"Year {year} out of range [{year_range['start']}-{year_range['end']}]"
-        })
-
-    # Convert coordinates based on dataset projection
-    if ds["projection"] == "EPSG:3413":
-        x, y = lon_lat_to_polar_stereographic(longitude, latitude)
-    elif ds["projection"] == "EPSG:4326":
-        # Data is in lat/lon, no transformation needed
-        x, y = longitude, latitude
-    else:
-        x, y = lon_lat_to_web_mercator(longitude, latitude)
-
     try:
-        # Fetch data from remote Zarr store
-        import blosc
-
-        # Use highest resolution level for accuracy
-        level = 4 if "soil" in dataset or "radiation" in dataset else 3
-        url = f"{BASE_URL}{ds['path']}/{level}"
-
-        with httpx.Client(timeout=60.0) as client:
-            # Load coordinate arrays
-            coords = {}
-            for coord_name in ['x', 'y', 'year']:
-                zarray_resp = client.get(f"{url}/{coord_name}/.zarray")
-                if zarray_resp.status_code == 200:
-                    meta = json.loads(zarray_resp.content)
-                    data_resp = client.get(f"{url}/{coord_name}/0")
-                    if data_resp.status_code == 200:
-                        try:
-                            decompressed = blosc.decompress(data_resp.content)
-                            coords[coord_name] = np.frombuffer(decompressed, dtype=np.dtype(meta['dtype']))
-                        except Exception:
-                            coords[coord_name] = np.frombuffer(data_resp.content, dtype=np.dtype(meta['dtype']))
-
-            if 'x' not in coords or 'y' not in coords:
-                return json.dumps({"error": "Could not load coordinate arrays"})
-
-            # Find nearest pixel
-            x_idx = int(np.argmin(np.abs(coords['x'] - x)))
-            y_idx = int(np.argmin(np.abs(coords['y'] - y)))
-
-            # Find year index
-            if 'year' in coords:
-                year_matches = np.where(coords['year'] == year)[0]
-                if len(year_matches) == 0:
-                    return json.dumps({"error": f"Year {year} not found in data"})
-                year_idx = int(year_matches[0])
-            else:
-                year_idx = year - year_range["start"]
-
-            # Load variable metadata
-            variable = ds["variable"]
-            zarray_resp = client.get(f"{url}/{variable}/.zarray")
-            if zarray_resp.status_code != 200:
-                return json.dumps({"error": f"Could not load variable {variable}"})
-
-            var_meta = json.loads(zarray_resp.content)
-            chunks = var_meta["chunks"]
-            dtype = np.dtype(var_meta["dtype"])
-
-            # Extract 12 months of data
-            timeseries = []
-            for month_idx in range(12):
-                try:
-                    chunk_y = y_idx // chunks[2]
-                    chunk_x = x_idx // chunks[3]
-                    chunk_key = f"{year_idx}.{month_idx}.{chunk_y}.{chunk_x}"
-                    chunk_resp = client.get(f"{url}/{variable}/{chunk_key}")
-
-                    if chunk_resp.status_code == 200:
-                        try:
-                            decompressed = blosc.decompress(chunk_resp.content)
-                            chunk_data = np.frombuffer(decompressed, dtype=dtype).reshape(chunks)
-                        except Exception:
-                            chunk_data = np.frombuffer(chunk_resp.content, dtype=dtype).reshape(chunks)
-
-                        local_y = y_idx % chunks[2]
-                        local_x = x_idx % chunks[3]
-                        value = float(chunk_data[0, 0, local_y, local_x])
-
-                        if np.isnan(value) or value < -1e30:
-                            value = None
-                    else:
-                        value = None
-                except Exception as e:
-                    log(f"Error loading month {month_idx}: {e}")
-                    value = None
-
-                timeseries.append({
-                    "month": MONTH_NAMES[month_idx],
-                    "month_index": month_idx,
-                    "value": value,
-                    "unit": ds["unit"]
-                })
-
-        result = {
-            "dataset": ds["name"],
-            "location": {"longitude": longitude, "latitude": latitude},
-            "year": year,
-            "unit": ds["unit"],
-            "timeseries": timeseries,
-            "source": BRANDING["attribution"]
-        }
-        return json.dumps(result, indent=2)
-
+        return timeseries_json(dataset, round(longitude, 4), round(latitude, 4), year)
+    except LookupError as e:
+        return json.dumps({"error": str(e)})
     except Exception as e:
         log(f"Error in get_timeseries: {e}")
         return json.dumps({"error": str(e)})
@@ -361,24 +159,24 @@ def get_value(dataset: str, longitude: float, latitude: float, year: int, month:
     log(f"get_value called: {dataset}, lon={longitude}, lat={latitude}, year={year}, month={month}")
 
     if month < 1 or month > 12:
-        return json.dumps({"error": "Month must be between 1 and 12"})
+        return MONTH_ERROR_JSON
 
-    # Get full timeseries and extract the month
-    timeseries_json = get_timeseries(dataset, longitude, latitude, year)
-    timeseries_data = json.loads(timeseries_json)
-
-    if "error" in timeseries_data:
-        return timeseries_json
-
-    month_data = timeseries_data["timeseries"][month - 1]
+    try:
+        values = fetch_point_values(dataset, longitude, latitude, year, [month - 1])
+    except Exception as e:
+        log(f"Error in get_value: {e}")
+        return json.dumps({"error": str(e)})
+    if isinstance(values, dict):
+        return json.dumps(values)
 
+    ds = DATASETS[dataset]
     result = {
-        "dataset": timeseries_data["dataset"],
-        "location": timeseries_data["location"],
+        "dataset": ds["name"],
+        "location": {"longitude": longitude, "latitude": latitude},
         "year": year,
         "month": MONTH_NAMES[month - 1],
-        "value": month_data["value"],
-        "unit": timeseries_data["unit"],
+        "value": values[0],
+        "unit": ds["unit"],
         "source": BRANDING["attribution"]
     }
     return json.dumps(result, indent=2)
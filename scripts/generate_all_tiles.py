@@ -19,8 +19,9 @@ import time
 import logging
 import warnings
 from pathlib import Path
-from multiprocessing import Pool, cpu_count
-from io import BytesIO
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing import Pool, cpu_count, get_context
 
 import numpy as np
 import xarray as xr
@@ -37,8 +38,12 @@ DATA_DIR = BASE_DIR / "data"
 ZOOM_LEVELS = list(range(0, 8))  # 0-7
 TIME_COUNT = 12  # 12 months
 DPI = 256
+# zlib level for tile PNGs; level 1 encodes far faster than optimize=True
+# (max compression) at the cost of somewhat larger files
+PNG_COMPRESS_LEVEL = 1
 COLORMAP = "RdYlBu_r"
 NUM_WORKERS = max(1, cpu_count() - 1)
+READ_THREADS = 4  # Concurrent time-step reads when computing colour ranges
 
 # Dataset configurations
 DATASETS = {
@@ -136,13 +141,199 @@ def load_dataset(config):
     else:
         lons = None
 
-    # Adjust longitude to -180 to 180 if needed
-    if lons is not None and lons.max() > 180:
-        lons = np.where(lons > 180, lons - 360, lons)
-
     return data, lons, lats, config['colormap'], config.get('unit', '')
 
 
+def select_time(config, data_array, time_idx):
+    """Get the 2D field for one output time step."""
+    time_dim = config.get('time_dim', 'time')
+    if time_dim in data_array.dims:
+        if time_idx < data_array.shape[0]:
+            return data_array.isel({time_dim: time_idx}).values
+        # Repeat last available time step
+        return data_array.isel({time_dim: -1}).values
+
+    # Single time step, use for all
+    values = data_array.values
+    if values.ndim == 3:
+        values = values[0]  # Take first if there's a singleton dim
+    return values
+
+
+def wrap_longitudes(values, lons):
+    """Reorder a 0-360 longitude grid to -180..180.
+
+    Rolling the columns (rather than only relabelling the coordinates) keeps
+    the axis monotonic, so the per-tile cropping can slice it.
+    """
+    if lons is None or lons.ndim != 1 or lons.max() <= 180:
+        return values, lons
+    split_idx = int(np.searchsorted(lons, 180, side='right'))
+    lons = np.roll(lons, -split_idx)
+    lons[lons > 180] -= 360
+    return np.roll(values, -split_idx, axis=-1), lons
+
+
+@lru_cache(maxsize=2)
+def load_time_step(dataset_name, time_idx):
+    """Materialised (values, lons, lats, cmap) for one dataset time step.
+
+    Every zoom level of a time step renders from the same field, so a worker
+    handling several of them reads and decodes it once. Callers must not
+    modify the returned arrays.
+    """
+    config = DATASETS[dataset_name]
+    data_array, lons, lats, cmap, unit = load_dataset(config)
+    if data_array is None:
+        return None
+    values, lons = wrap_longitudes(select_time(config, data_array, time_idx), lons)
+    # float32 is ample for rendering and halves the bytes every zoom level's
+    # fill, block-mean and mesh steps stream through
+    values = np.ascontiguousarray(values, dtype=np.float32)
+    return values, lons, lats, cmap
+
+
+def compute_color_range(values):
+    """2nd-98th percentile colour range of a field, or None if it has no valid data."""
+    valid = values[~np.isnan(values)]
+    if len(valid) == 0:
+        return None
+    # In-place selection (O(n)) on the masked copy rather than the full
+    # sort np.percentile does
+    k2, k98 = int(0.02 * (valid.size - 1)), int(0.98 * (valid.size - 1))
+    valid.partition([k2, k98])
+    return float(valid[k2]), float(valid[k98])
+
+
+def compute_color_ranges(dataset_names):
+    """Colour range per (dataset, time) - shared by every zoom level of that time step."""
+    color_ranges = {}
+    for dataset_name in dataset_names:
+        config = DATASETS[dataset_name]
+        data_array = load_dataset(config)[0]
+        if data_array is None:
+            for time_idx in range(TIME_COUNT):
+                color_ranges[(dataset_name, time_idx)] = None
+            continue
+
+        def range_for(time_idx):
+            return compute_color_range(select_time(config, data_array, time_idx))
+
+        # Chunk decompression and the percentile partition release the GIL,
+        # so the time steps can be read concurrently
+        with ThreadPoolExecutor(max_workers=READ_THREADS) as pool:
+            for time_idx, color_range in enumerate(pool.map(range_for, range(TIME_COUNT))):
+                color_ranges[(dataset_name, time_idx)] = color_range
+    return color_ranges
+
+
+@lru_cache(maxsize=None)
+def get_colormap(name):
+    """Resolve a matplotlib colormap once per process.
+
+    Passing the name to pcolormesh looks it up and copies it from the
+    registry on every tile; reusing one instance also keeps its lookup
+    table, which is built on first use.
+    """
+    import matplotlib
+    return matplotlib.colormaps[name]
+
+
+def feature_style(zoom):
+    """Natural Earth scale and (coastline, border) line widths for a zoom level."""
+    if zoom >= 5:
+        return '10m', 0.5, 0.3
+    elif zoom >= 3:
+        return '50m', 0.4, 0.25
+    return '110m', 0.3, 0.2
+
+
+def preload_natural_earth():
+    """Parse the Natural Earth shapefiles into cartopy's per-process cache."""
+    import cartopy.feature as cfeature
+
+    for scale in sorted({feature_style(zoom)[0] for zoom in ZOOM_LEVELS}):
+        for feature in (cfeature.OCEAN, cfeature.COASTLINE, cfeature.BORDERS):
+            tuple(feature.with_scale(scale).geometries())
+
+
+def create_worker_pool():
+    """Worker pool whose processes start with Natural Earth already loaded.
+
+    On Linux the workers are forked after loading the geometries once in the
+    parent, so they inherit them instead of each re-reading the (large, at
+    10m) shapefiles. Elsewhere the default start method is spawn (fork is
+    unsafe on macOS and missing on Windows), so each worker loads them in
+    its initializer and the parent skips the work.
+    """
+    if sys.platform.startswith('linux'):
+        preload_natural_earth()
+        return get_context('fork').Pool(processes=NUM_WORKERS)
+    return Pool(processes=NUM_WORKERS, initializer=preload_natural_earth)
+
+
+def reduce_for_zoom(values, lons, lats, zoom):
+    """Block-average the grid down to ~2 cells per output pixel at this zoom.
+
+    Low zoom tiles cover most of the globe in 256 px, so plotting the full
+    grid spends most of the pcolormesh work on cells that land in the same
+    pixel. Averaging (rather than striding) keeps every cell's contribution.
+    NaN cells are left out of their block's mean, and a block with no valid
+    cells stays NaN, so missing data does not bleed into coastal blocks.
+    """
+    target_cells = 2 * 256 * 2 ** zoom
+    factor = len(lons) // target_cells
+    if factor <= 1 or lons.ndim != 1 or lats.ndim != 1:
+        return values, lons, lats
+
+    ny = (values.shape[0] // factor) * factor
+    nx = (values.shape[1] // factor) * factor
+    blocks = values[:ny, :nx].reshape(ny // factor, factor, nx // factor, factor)
+    counts = np.count_nonzero(~np.isnan(blocks), axis=(1, 3))
+    sums = np.nansum(blocks, axis=(1, 3))
+    values = np.divide(sums, counts, out=np.full_like(sums, np.nan), where=counts > 0)
+
+    # Use block-centre coordinates rather than averaging them
+    return values, lons[:nx][factor // 2::factor], lats[:ny][factor // 2::factor]
+
+
+def is_monotonic(coords):
+    """True if a 1-D coordinate axis is strictly increasing or decreasing."""
+    steps = np.diff(coords)
+    return bool(np.all(steps > 0) or np.all(steps < 0))
+
+
+def covered_range(coords, lo, hi):
+    """Index range [start, stop) of a monotonic axis with lo <= coord <= hi."""
+    if coords[0] <= coords[-1]:
+        return (int(np.searchsorted(coords, lo, side='left')),
+                int(np.searchsorted(coords, hi, side='right')))
+    n = len(coords)
+    ascending = coords[::-1]
+    return (n - int(np.searchsorted(ascending, hi, side='right')),
+            n - int(np.searchsorted(ascending, lo, side='left')))
+
+
+def crop_to_extent(values, lons, lats, lon_min, lon_max, lat_min, lat_max, pad=2):
+    """Slice the grid to the cells covering an extent, plus a small margin.
+
+    pcolormesh otherwise builds the mesh for the whole globe on every tile
+    and leaves cartopy to clip it. Only applies to monotonic 1-D axes, where
+    the covered cells form one contiguous block.
+    """
+    if lons.ndim != 1 or lats.ndim != 1 or not (is_monotonic(lons) and is_monotonic(lats)):
+        return values, lons, lats
+
+    x0, x1 = covered_range(lons, lon_min, lon_max)
+    y0, y1 = covered_range(lats, lat_min, lat_max)
+    if x0 >= x1 or y0 >= y1:
+        return values, lons, lats
+
+    x0, x1 = max(x0 - pad, 0), x1 + pad
+    y0, y1 = max(y0 - pad, 0), y1 + pad
+    return values[y0:y1, x0:x1], lons[x0:x1], lats[y0:y1]
+
+
 def process_zoom_level(args):
     """Process all tiles for one dataset/time/zoom combination."""
     import matplotlib
@@ -151,52 +342,42 @@ def process_zoom_level(args):
     import cartopy.crs as ccrs
     import cartopy.feature as cfeature
 
-    dataset_name, time_idx, zoom = args
-
-    config = DATASETS[dataset_name]
-    data_array, lons, lats, cmap, unit = load_dataset(config)
+    dataset_name, time_idx, zoom, color_range = args
 
-    if data_array is None:
-        return (dataset_name, time_idx, zoom, 0, 0, "Dataset not available")
+    if color_range is None:
+        return (dataset_name, time_idx, zoom, 0, 0, "No valid data")
 
-    # Get data for this time step
-    time_dim = config.get('time_dim', 'time')
-    if time_dim in data_array.dims:
-        if time_idx < data_array.shape[0]:
-            values = data_array.isel({time_dim: time_idx}).values
-        else:
-            # Repeat last available time step
-            values = data_array.isel({time_dim: -1}).values
-    else:
-        # Single time step, use for all
-        values = data_array.values
-        if values.ndim == 3:
-            values = values[0]  # Take first if there's a singleton dim
+    time_step = load_time_step(dataset_name, time_idx)
 
-    # Calculate color range
-    valid = values[~np.isnan(values)]
-    if len(valid) == 0:
-        return (dataset_name, time_idx, zoom, 0, 0, "No valid data")
+    if time_step is None:
+        return (dataset_name, time_idx, zoom, 0, 0, "Dataset not available")
 
-    vmin = float(np.percentile(valid, 2))
-    vmax = float(np.percentile(valid, 98))
+    values, lons, lats, cmap = time_step
+    vmin, vmax = color_range
 
-    # Fill NaN with vmin (ocean will cover it)
+    # Reduce before filling, so only the remaining gaps get vmin (ocean will
+    # cover them) rather than it being averaged into partly missing blocks
+    values, lons, lats = reduce_for_zoom(values, lons, lats, zoom)
     values = np.where(np.isnan(values), vmin, values)
 
-    # Feature resolution based on zoom
-    if zoom >= 5:
-        scale = '10m'
-        lw_coast = 0.5
-        lw_border = 0.3
-    elif zoom >= 3:
-        scale = '50m'
-        lw_coast = 0.4
-        lw_border = 0.25
-    else:
-        scale = '110m'
-        lw_coast = 0.3
-        lw_border = 0.2
+    scale, lw_coast, lw_border = feature_style(zoom)
+
+    # Buffer for seam elimination
+    buffer_pct = 0.02
+    buffer_pixels = int(DPI * buffer_pct * 2)
+    fig_size = (DPI + buffer_pixels) / DPI
+
+    # One figure for the whole zoom level: size, map features and styling
+    # are the same for every tile, so only the extent and data mesh change
+    fig = plt.figure(figsize=(fig_size, fig_size), dpi=DPI)
+    ax = fig.add_subplot(1, 1, 1, projection=ccrs.Mercator())
+    ax.add_feature(cfeature.OCEAN.with_scale(scale), facecolor='#1a1a2e', zorder=5)
+    ax.add_feature(cfeature.COASTLINE.with_scale(scale), linewidth=lw_coast, edgecolor='#444', zorder=6)
+    ax.add_feature(cfeature.BORDERS.with_scale(scale), linewidth=lw_border, edgecolor='#555', zorder=7)
+    ax.set_frame_on(False)
+    ax.patch.set_visible(False)
+    ax.set_position([0, 0, 1, 1])
+    fig.set_facecolor('#1a1a2e')
 
     n = 2 ** zoom
     completed = 0
@@ -229,8 +410,6 @@ def process_zoom_level(args):
                 skipped += 1
                 continue
 
-            # Buffer for seam elimination
-            buffer_pct = 0.02
             lat_range = lat_max - lat_min
             lon_range = lon_max - lon_min
             ext_lat_min = max(-84.9, lat_min - lat_range * buffer_pct)
@@ -238,57 +417,47 @@ def process_zoom_level(args):
             ext_lon_min = max(-179.99, lon_min - lon_range * buffer_pct)
             ext_lon_max = min(179.99, lon_max + lon_range * buffer_pct)
 
+            mesh = None
             try:
-                # Create figure with buffer
-                buffer_pixels = int(DPI * buffer_pct * 2)
-                fig_size = (DPI + buffer_pixels) / DPI
-
-                fig = plt.figure(figsize=(fig_size, fig_size), dpi=DPI)
-                ax = fig.add_subplot(1, 1, 1, projection=ccrs.Mercator())
                 ax.set_extent([ext_lon_min, ext_lon_max, ext_lat_min, ext_lat_max], crs=ccrs.PlateCarree())
 
                 # Plot data
-                ax.pcolormesh(
-                    lons, lats, values,
+                tile_values, tile_lons, tile_lats = crop_to_extent(
+                    values, lons, lats, ext_lon_min, ext_lon_max, ext_lat_min, ext_lat_max
+                )
+                mesh = ax.pcolormesh(
+                    tile_lons, tile_lats, tile_values,
                     transform=ccrs.PlateCarree(),
-                    cmap=cmap,
+                    cmap=get_colormap(cmap),
                     vmin=vmin, vmax=vmax,
                     shading='gouraud',
                     rasterized=True,
                     zorder=1
                 )
 
-                # Add features
-                ax.add_feature(cfeature.OCEAN.with_scale(scale), facecolor='#1a1a2e', zorder=5)
-                ax.add_feature(cfeature.COASTLINE.with_scale(scale), linewidth=lw_coast, edgecolor='#444', zorder=6)
-                ax.add_feature(cfeature.BORDERS.with_scale(scale), linewidth=lw_border, edgecolor='#555', zorder=7)
-
-                ax.set_frame_on(False)
-                ax.patch.set_visible(False)
-                ax.set_position([0, 0, 1, 1])
-
-                # Save to buffer and crop
-                buf = BytesIO()
-                fig.savefig(buf, dpi=DPI, pad_inches=0, transparent=False, facecolor='#1a1a2e', format='png')
-                plt.close(fig)
-                buf.seek(0)
-
-                # Crop center 256x256
-                img = Image.open(buf)
-                w, h = img.size
+                # Render straight to the Agg RGBA buffer and crop the centre
+                # 256x256, rather than round-tripping through an encoded PNG
+                fig.canvas.draw()
+                rgba = np.asarray(fig.canvas.buffer_rgba())
+                h, w = rgba.shape[:2]
                 left = (w - 256) // 2
                 top = (h - 256) // 2
-                img_cropped = img.crop((left, top, left + 256, top + 256))
+                img_cropped = Image.fromarray(rgba[top:top + 256, left:left + 256].copy())
 
                 # Save tile
                 tile_path.parent.mkdir(parents=True, exist_ok=True)
-                img_cropped.save(tile_path, optimize=True)
+                img_cropped.save(tile_path, compress_level=PNG_COMPRESS_LEVEL)
                 completed += 1
 
             except Exception as e:
-                plt.close('all')
                 skipped += 1
 
+            finally:
+                # Clear this tile's data so the figure is ready for the next
+                if mesh is not None:
+                    mesh.remove()
+
+    plt.close(fig)
     return (dataset_name, time_idx, zoom, completed, skipped, None)
 
 
@@ -313,12 +482,18 @@ def main():
         logger.error("No datasets available!")
         return 1
 
+    # Colour ranges depend only on dataset/time, so compute them once here
+    # rather than in every zoom-level worker
+    logger.info("Computing colour ranges...")
+    color_ranges = compute_color_ranges(available_datasets)
+
     # Build work units
     work_units = []
     for dataset_name in available_datasets:
         for time_idx in range(TIME_COUNT):
+            color_range = color_ranges[(dataset_name, time_idx)]
             for zoom in ZOOM_LEVELS:
-                work_units.append((dataset_name, time_idx, zoom))
+                work_units.append((dataset_name, time_idx, zoom, color_range))
 
     total_units = len(work_units)
     logger.info(f"Work units: {total_units}")
@@ -331,12 +506,16 @@ def main():
 
     TILES_DIR.mkdir(parents=True, exist_ok=True)
 
+    logger.info("Loading Natural Earth features...")
     grand_completed = 0
     grand_skipped = 0
     start = time.time()
 
-    with Pool(processes=NUM_WORKERS) as pool:
-        for i, result in enumerate(pool.imap_unordered(process_zoom_level, work_units)):
+    with create_worker_pool() as pool:
+        # Hand each worker all zoom levels of a time step together so its
+        # load_time_step cache is hit for every zoom after the first
+        results = pool.imap_unordered(process_zoom_level, work_units, chunksize=len(ZOOM_LEVELS))
+        for i, result in enumerate(results):
             dataset_name, time_idx, zoom, completed, skipped, error = result
             grand_completed += completed
             grand_skipped += skipped
@@ -15,13 +15,13 @@ import math
 import time
 import logging
 from pathlib import Path
+from functools import lru_cache
 from multiprocessing import Pool, cpu_count
 import warnings
 
 import numpy as np
 import xarray as xr
 from PIL import Image
-from io import BytesIO
 
 warnings.filterwarnings('ignore')
 
@@ -36,6 +36,8 @@ OUTPUT_TIME_INDICES = list(range(0, 12))
 VARIABLES = ["2m_temperature", "skin_temperature"]
 COLORMAP = "RdYlBu_r"
 DPI = 256
+# Fast zlib level: quicker to encode than the default 6, slightly larger tiles
+PNG_COMPRESS_LEVEL = 1
 
 NUM_WORKERS = max(1, cpu_count() - 1)
 
@@ -59,6 +61,18 @@ def tile_bounds(z, x, y):
     return lon_min, lon_max, lat_min, lat_max
 
 
+@lru_cache(maxsize=None)
+def get_colormap(name):
+    """Resolve a matplotlib colormap once per process.
+
+    Passing the name to pcolormesh looks it up and copies it from the
+    registry on every tile; reusing one instance also keeps its lookup
+    table, which is built on first use.
+    """
+    import matplotlib
+    return matplotlib.colormaps[name]
+
+
 def process_zoom_level(args):
     """Process all tiles for one zoom level of one timestep. Each worker loads data independently."""
     import matplotlib
@@ -75,12 +89,19 @@ def process_zoom_level(args):
     lons = ds.lon.values
     lats = ds.lat.values
 
-    valid = data[~np.isnan(data)]
-    vmin = float(np.percentile(valid, 2))
-    vmax = float(np.percentile(valid, 98))
+    # One NaN pass shared by the stats and the fill, which writes into the
+    # freshly loaded array
+    nan_mask = np.isnan(data)
+    valid = data[~nan_mask]
+    # In-place selection (O(n)) on the masked copy rather than the full
+    # sort np.percentile does
+    k2, k98 = int(0.02 * (valid.size - 1)), int(0.98 * (valid.size - 1))
+    valid.partition([k2, k98])
+    vmin, vmax = float(valid[k2]), float(valid[k98])
 
     # Fill NaN once
-    values = np.where(np.isnan(data), vmin, data)
+    data[nan_mask] = vmin
+    values = data
 
     # Feature resolution based on zoom
     if zoom >= 5:
@@ -93,6 +114,22 @@ def process_zoom_level(args):
         scale = '110m'
         lw = 0.3
 
+    # Add buffer to eliminate tile seams - render beyond bounds, then figure clips to exact tile
+    buffer_pct = 0.02  # 2% buffer
+    buffer_pixels = int(DPI * buffer_pct * 2)
+    fig_size = (DPI + buffer_pixels) / DPI
+
+    # One figure for the whole zoom level: size, map features and styling
+    # are the same for every tile, so only the extent and data mesh change
+    fig = plt.figure(figsize=(fig_size, fig_size), dpi=DPI)
+    ax = fig.add_subplot(1, 1, 1, projection=ccrs.Mercator())
+    ax.add_feature(cfeature.OCEAN.with_scale(scale), facecolor='#1a1a2e', zorder=5)
+    ax.add_feature(cfeature.COASTLINE.with_scale(scale), linewidth=lw, edgecolor='#444', zorder=6)
+    ax.set_frame_on(False)
+    ax.patch.set_visible(False)
+    ax.set_position([0, 0, 1, 1])
+    fig.set_facecolor('#1a1a2e')
+
     n = 2 ** zoom
     completed = 0
     skipped = 0
@@ -120,8 +157,6 @@ def process_zoom_level(args):
                 skipped += 1
                 continue
 
-            # Add buffer to eliminate tile seams - render beyond bounds, then figure clips to exact tile
-            buffer_pct = 0.02  # 2% buffer
             lat_range = lat_max - lat_min
             lon_range = lon_max - lon_min
             ext_lat_min = max(-84.9, lat_min - lat_range * buffer_pct)
@@ -129,53 +164,44 @@ def process_zoom_level(args):
             ext_lon_min = max(-179.99, lon_min - lon_range * buffer_pct)
             ext_lon_max = min(179.99, lon_max + lon_range * buffer_pct)
 
+            mesh = None
             try:
-                # Create figure with extra size to accommodate buffer, then crop
-                buffer_pixels = int(DPI * buffer_pct * 2)
-                fig_size = (DPI + buffer_pixels) / DPI
-                fig = plt.figure(figsize=(fig_size, fig_size), dpi=DPI)
-                ax = fig.add_subplot(1, 1, 1, projection=ccrs.Mercator())
                 ax.set_extent([ext_lon_min, ext_lon_max, ext_lat_min, ext_lat_max], crs=ccrs.PlateCarree())
 
-                ax.pcolormesh(
+                mesh = ax.pcolormesh(
                     lons, lats, values,
                     transform=ccrs.PlateCarree(),
-                    cmap=COLORMAP,
+                    cmap=get_colormap(COLORMAP),
                     vmin=vmin, vmax=vmax,
                     shading='gouraud',
                     rasterized=True,
                     zorder=1
                 )
 
-                ax.add_feature(cfeature.OCEAN.with_scale(scale), facecolor='#1a1a2e', zorder=5)
-                ax.add_feature(cfeature.COASTLINE.with_scale(scale), linewidth=lw, edgecolor='#444', zorder=6)
-
-                ax.set_frame_on(False)
-                ax.patch.set_visible(False)
-                ax.set_position([0, 0, 1, 1])
-
                 tile_path.parent.mkdir(parents=True, exist_ok=True)
 
-                # Save to temp, then crop to exact 256x256
-                buf = BytesIO()
-                fig.savefig(buf, dpi=DPI, pad_inches=0, transparent=False, facecolor='#1a1a2e', format='png')
-                plt.close(fig)
-                buf.seek(0)
-
-                img = Image.open(buf)
-                w, h = img.size
+                # Render straight to the Agg RGBA buffer, then crop to exact
+                # 256x256 without round-tripping through an encoded PNG
+                fig.canvas.draw()
+                rgba = np.asarray(fig.canvas.buffer_rgba())
+                h, w = rgba.shape[:2]
                 # Crop center 256x256
                 left = (w - 256) // 2
                 top = (h - 256) // 2
-                img_cropped = img.crop((left, top, left + 256, top + 256))
-                img_cropped.save(tile_path)
+                img_cropped = Image.fromarray(rgba[top:top + 256, left:left + 256].copy())
+                img_cropped.save(tile_path, compress_level=PNG_COMPRESS_LEVEL)
 
                 completed += 1
 
             except Exception as e:
-                plt.close('all')
                 skipped += 1
 
+            finally:
+                # Clear this tile's data so the figure is ready for the next
+                if mesh is not None:
+                    mesh.remove()
+
+    plt.close(fig)
     return (variable, out_idx, zoom, completed, skipped)
 
 
@@ -75,18 +75,25 @@ def process_radiation_budget(raw_dir: Path, processed_dir: Path):
         # Create approximate outgoing radiation (for demo purposes)
         # In reality these should come from different data products
         incoming = ds["incoming_shortwave_radiation"]
+        incoming_values = incoming.values
 
         # Outgoing longwave: roughly 240 W/m² globally, varies with temperature
+        # (offset and clip in place so each field allocates one full grid)
+        outgoing_lw = incoming_values * 0.7
+        outgoing_lw += 50
+        np.clip(outgoing_lw, 150, 350, out=outgoing_lw)
         ds["outgoing_longwave_radiation"] = xr.DataArray(
-            data=np.clip(incoming.values * 0.7 + 50, 150, 350).astype(np.float32),
+            data=outgoing_lw.astype(np.float32, copy=False),
             dims=incoming.dims,
             coords=incoming.coords,
             attrs={"units": "W/m²", "long_name": "Outgoing Longwave Radiation (derived)"},
         )
 
         # Outgoing shortwave: reflected solar, roughly 100 W/m² global average
+        outgoing_sw = incoming_values * 0.3
+        np.clip(outgoing_sw, 0, 400, out=outgoing_sw)
         ds["outgoing_shortwave_radiation"] = xr.DataArray(
-            data=np.clip(incoming.values * 0.3, 0, 400).astype(np.float32),
+            data=outgoing_sw.astype(np.float32, copy=False),
             dims=incoming.dims,
             coords=incoming.coords,
             attrs={"units": "W/m²", "long_name": "Outgoing Shortwave Radiation (derived)"},
@@ -104,6 +111,11 @@ def process_radiation_budget(raw_dir: Path, processed_dir: Path):
     if coord_rename:
         ds = ds.rename(coord_rename)
 
+    # Store longitudes as -180..180 so readers never need to shift them
+    if float(ds.lon.max()) > 180:
+        print("  Wrapping longitudes from 0-360 to -180..180...")
+        ds = ds.assign_coords(lon=((ds.lon + 180) % 360) - 180).sortby("lon")
+
     # Chunking for efficient access
     chunks = {"time": 1, "lat": 180, "lon": 360}
     print(f"  Chunking: {chunks}")
@@ -65,14 +65,16 @@ def create_land_mask(lats, lons):
     height, width = len(lats), len(lons)
     mask = np.ones((height, width), dtype=bool)  # Start with all land
 
-    # Create meshgrid for efficient masking
-    lon_grid, lat_grid = np.meshgrid(lons, lats)
+    # Broadcast a lat column against a lon row instead of materialising two
+    # full meshgrid arrays; each condition below expands only as it's combined
+    lon_grid = np.asarray(lons)[np.newaxis, :]
+    lat_grid = np.asarray(lats)[:, np.newaxis]
 
     # Antarctica - mostly ocean/ice
-    mask[lat_grid < -60] = False
+    mask &= ~(lat_grid < -60)
 
     # Arctic Ocean (rough approximation)
-    mask[lat_grid > 85] = False
+    mask &= ~(lat_grid > 85)
 
     # Atlantic Ocean (rough west/east bounds)
     atlantic_mask = (
@@ -81,18 +83,18 @@ def create_land_mask(lats, lons):
         ~((lat_grid > 35) & (lat_grid < 45) & (lon_grid > -10))  # Not Mediterranean entrance
     )
     # Only mask where there's significant ocean
-    mask[atlantic_mask & (lat_grid < 0) & (lon_grid < -30)] = False  # South Atlantic
-    mask[atlantic_mask & (lat_grid > 45) & (lon_grid < -10)] = False  # North Atlantic
+    mask &= ~(atlantic_mask & (lat_grid < 0) & (lon_grid < -30))  # South Atlantic
+    mask &= ~(atlantic_mask & (lat_grid > 45) & (lon_grid < -10))  # North Atlantic
 
     # Pacific Ocean
     pacific_west = (lon_grid > 100) | (lon_grid < -100)
     pacific_mask = pacific_west & (lat_grid > -60) & (lat_grid < 60)
     # Be more conservative - only mask obvious ocean areas
-    mask[pacific_mask & (np.abs(lon_grid) > 150)] = False
+    mask &= ~(pacific_mask & (np.abs(lon_grid) > 150))
 
     # Indian Ocean
     indian_mask = (lon_grid > 40) & (lon_grid < 100) & (lat_grid < 0) & (lat_grid > -60)
-    mask[indian_mask & (lat_grid < -10)] = False
+    mask &= ~(indian_mask & (lat_grid < -10))
 
     return mask
 
@@ -157,11 +159,9 @@ def load_all_years():
     land_mask = create_land_mask(lats, lons)
     print(f"  Land pixels: {land_mask.sum()} / {land_mask.size} ({100*land_mask.sum()/land_mask.size:.1f}%)")
 
-    # Apply mask - set ocean pixels to 0
+    # Apply mask - set ocean pixels to 0 (one indexed write across all years/months)
     print("Applying land mask...")
-    for y_idx in range(combined.shape[0]):
-        for m_idx in range(combined.shape[1]):
-            combined[y_idx, m_idx][~land_mask] = 0
+    combined[..., ~land_mask] = 0
 
     print(f"Combined shape: {combined.shape}")
     print(f"Years: {min(years_loaded)} - {max(years_loaded)}")
@@ -180,24 +180,10 @@ def create_pyramid_level(data, target_y, target_x):
     zoom_y = target_y / current_y
     zoom_x = target_x / current_x
 
-    n_years, n_months = data.shape[:2]
-    result = np.zeros((n_years, n_months, target_y, target_x), dtype=np.float32)
-
-    total_slices = n_years * n_months
-    done = 0
-    for y_idx in range(n_years):
-        for m_idx in range(n_months):
-            slice_data = data[y_idx, m_idx]
-            if np.isnan(slice_data).all():
-                result[y_idx, m_idx] = np.nan
-            else:
-                # Use order=0 (nearest neighbor) to avoid spreading values into ocean
-                result[y_idx, m_idx] = zoom(slice_data, (zoom_y, zoom_x), order=0)
-            done += 1
-            if done % 20 == 0:
-                print(f"    Progress: {done}/{total_slices} slices")
-
-    return result
+    # Use order=0 (nearest neighbor) to avoid spreading values into ocean.
+    # It only copies samples, so one zoom over every year/month (unit factors
+    # on those axes) matches zooming each slice, all-NaN months included.
+    return zoom(data, (1, 1, zoom_y, zoom_x), order=0).astype(np.float32, copy=False)
 
 
 def create_zarr_pyramid(data, years_list, lats, lons):
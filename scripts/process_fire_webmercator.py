@@ -20,7 +20,6 @@ import glob
 import shutil
 import zipfile
 import tempfile
-from scipy.interpolate import RegularGridInterpolator
 
 # Constants - MUST match soil_moisture projection exactly
 WEB_MERCATOR_BOUNDS = 20037508.342789244  # meters
@@ -56,18 +55,33 @@ def lon_to_webmercator_x(lon):
     return lon * 6378137.0 * np.pi / 180.0
 
 
-def reproject_to_webmercator(data_latlon, src_lats, src_lons, target_size):
-    """
-    Reproject data from lat/lon to Web Mercator using interpolation.
-
-    Args:
-        data_latlon: 2D array in lat/lon coordinates
-        src_lats: Source latitude values (typically 89.875 to -89.875)
-        src_lons: Source longitude values (typically -179.875 to 179.875)
-        target_size: Output size (square)
+def nearest_indices(grid, points):
+    """Nearest-neighbour index into a monotonic 1D grid, or -1 outside it.
 
-    Returns:
-        Reprojected data array
+    Ties go to the lower latitude/longitude, matching RegularGridInterpolator's
+    'nearest' on the ascending grid. A descending grid is searched through a
+    reversed view and the indices mapped back, so callers can gather from the
+    data in its stored row order.
+    """
+    descending = grid[0] > grid[-1]
+    if descending:
+        grid = grid[::-1]
+    i = np.clip(np.searchsorted(grid, points) - 1, 0, len(grid) - 2)
+    frac = (points - grid[i]) / (grid[i + 1] - grid[i])
+    idx = np.where(frac <= 0.5, i, i + 1)
+    if descending:
+        idx = len(grid) - 1 - idx
+    idx[(points < grid[0]) | (points > grid[-1])] = -1
+    return idx
+
+
+def webmercator_sample_indices(src_lats, src_lons, target_size):
+    """Source row/column sampled by each Web Mercator output row/column.
+
+    Web Mercator rows depend only on latitude and columns only on longitude,
+    so nearest-neighbour sampling (to preserve discrete fire values) reduces
+    to one index per row and per column. These depend only on the grids, not
+    the month, so callers compute them once per pyramid level.
     """
     # Target Web Mercator coordinates (same as soil_moisture)
     target_x = np.linspace(-WEB_MERCATOR_BOUNDS, WEB_MERCATOR_BOUNDS, target_size)
@@ -77,33 +91,30 @@ def reproject_to_webmercator(data_latlon, src_lats, src_lons, target_size):
     target_lons = target_x * 180.0 / (6378137.0 * np.pi)
     target_lats = webmercator_y_to_lat(target_y)
 
-    # Ensure source lats are in ascending order for interpolator
-    if src_lats[0] > src_lats[-1]:
-        src_lats_asc = src_lats[::-1]
-        data_flipped = data_latlon[::-1, :]
-    else:
-        src_lats_asc = src_lats
-        data_flipped = data_latlon
+    return nearest_indices(src_lats, target_lats), nearest_indices(src_lons, target_lons)
 
-    # Handle NaN values - replace with 0 for fire data (no fire)
-    data_clean = np.nan_to_num(data_flipped, nan=0.0)
 
-    # Create interpolator
-    interp = RegularGridInterpolator(
-        (src_lats_asc, src_lons),
-        data_clean,
-        method='nearest',  # Nearest neighbor to preserve discrete fire values
-        bounds_error=False,
-        fill_value=0.0
-    )
+def reproject_to_webmercator(data_latlon, rows, cols):
+    """
+    Reproject data from lat/lon to Web Mercator by nearest-neighbour sampling.
+
+    Args:
+        data_latlon: 2D array in lat/lon coordinates
+        rows, cols: Source indices from webmercator_sample_indices for the
+            data's grid and the target size
 
-    # Sample at target locations
-    target_lon_grid, target_lat_grid = np.meshgrid(target_lons, target_lats)
-    target_points = np.column_stack([target_lat_grid.ravel(), target_lon_grid.ravel()])
+    Returns:
+        Reprojected data array
+    """
+    result = data_latlon[np.ix_(rows, cols)]
 
-    result = interp(target_points).reshape(target_size, target_size)
+    # Handle NaN values - replace with 0 for fire data (no fire), as is
+    # anything sampled outside the source grid
+    np.nan_to_num(result, copy=False, nan=0.0)
+    result[rows < 0, :] = 0.0
+    result[:, cols < 0] = 0.0
 
-    return result.astype(np.float32)
+    return result.astype(np.float32, copy=False)
 
 
 def extract_and_load_fire_data():
@@ -255,7 +266,8 @@ def create_pyramid():
             dimension_separator='.', zarr_format=2
         )
 
-        # Process each month
+        # Process each month; every month shares the same sample indices
+        rows, cols = webmercator_sample_indices(src_lats, src_lons, target_size)
         for yi, year in enumerate(years):
             for month in range(1, 13):
                 key = (year, month)
@@ -263,7 +275,7 @@ def create_pyramid():
                     src_data = data_dict[key]
 
                     # Reproject to Web Mercator
-                    reproj = reproject_to_webmercator(src_data, src_lats, src_lons, target_size)
+                    reproj = reproject_to_webmercator(src_data, rows, cols)
                     data_arr[yi, month-1, :, :] = reproj
                 else:
                     # No data - fill with NaN
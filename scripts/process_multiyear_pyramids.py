@@ -69,7 +69,7 @@ def process_soil_moisture_multiyear():
     years = []
     for f in files:
         try:
-            year = int(f.stem.split("_")[-1])
+            year = int(f.stem.rpartition("_")[2])
             years.append((year, f))
         except ValueError:
             continue
@@ -117,7 +117,9 @@ def process_soil_moisture_multiyear():
             # Store each month as a DataArray with proper coordinates for reprojection
             year_months = []
             for month_idx in range(12):
-                month_data = data.isel(time=month_idx).values
+                # float32 up front: the pyramid is stored at that precision,
+                # so this halves the held months and the reprojection passes
+                month_data = np.asarray(data.isel(time=month_idx).values, dtype=np.float32)
 
                 # Create DataArray with coordinates for rioxarray
                 da = xr.DataArray(
@@ -172,7 +174,7 @@ def process_soil_moisture_multiyear():
             level_data.append(np.stack(year_reprojected, axis=0))
 
         # Stack all years: [year, month, y, x]
-        data_array = np.stack(level_data, axis=0).astype(np.float32)
+        data_array = np.stack(level_data, axis=0).astype(np.float32, copy=False)
         logger.info(f"  Data shape: {data_array.shape}")
 
         # Create Web Mercator coordinates (in meters)
@@ -315,7 +317,7 @@ def process_sea_ice_multiyear():
 
                 # Create DataArray with coordinates
                 da = xr.DataArray(
-                    data.values,
+                    np.asarray(data.values, dtype=np.float32),
                     dims=['y', 'x'],
                     coords={'y': yc, 'x': xc}
                 )
@@ -359,7 +361,7 @@ def process_sea_ice_multiyear():
             level_data.append(np.stack(year_reprojected, axis=0))
 
         # Stack all years
-        data_array = np.stack(level_data, axis=0).astype(np.float32)
+        data_array = np.stack(level_data, axis=0).astype(np.float32, copy=False)
         logger.info(f"  Data shape: {data_array.shape}")
 
         # Create coordinates
@@ -47,7 +47,7 @@ def load_and_merge_2023():
     for f in files:
         ds = xr.open_dataset(f, engine='scipy')
         # Extract month from filename
-        month = int(f.stem.split('_')[-1])
+        month = int(f.stem.rpartition('_')[2])
         ds = ds.assign_coords(time=[month])
         datasets.append(ds)
 
@@ -85,11 +85,35 @@ def load_all_data():
     return combined, years_loaded
 
 
+def linear_sample_positions(n_in, n_out):
+    """Left source index and weight per output sample along one axis.
+
+    Uses the same mapping as scipy.ndimage.zoom (output i samples input
+    i * (n_in - 1) / (n_out - 1)), so endpoints line up with the source.
+    """
+    pos = np.arange(n_out) * ((n_in - 1) / (n_out - 1))
+    left = np.minimum(pos.astype(np.intp), n_in - 2)
+    return left, (pos - left).astype(np.float32)
+
+
+def resample_bilinear(data, out_height, out_width):
+    """Bilinearly resample the last two (lat, lon) axes of an array.
+
+    Equivalent to an order=1 zoom of each 2-D slice, but done for every
+    year/month at once. Only the spatial axes are interpolated, so a NaN
+    month never leaks into its neighbours; within a slice NaNs spread to
+    adjacent samples just as they do with zoom.
+    """
+    rows, row_w = linear_sample_positions(data.shape[-2], out_height)
+    cols, col_w = linear_sample_positions(data.shape[-1], out_width)
+    row_w = row_w[:, None]
+    by_row = data[..., rows, :] * (1 - row_w) + data[..., rows + 1, :] * row_w
+    return by_row[..., cols] * (1 - col_w) + by_row[..., cols + 1] * col_w
+
+
 def create_pyramid_level(data, years, level, target_size):
     """Create a single pyramid level."""
-    from scipy.ndimage import zoom
-
-    n_years, n_months, src_lat, src_lon = data.shape
+    src_lat, src_lon = data.shape[-2:]
 
     # Calculate zoom factors (target is square)
     # CERES is 180x360, so we need to handle aspect ratio
@@ -102,12 +126,8 @@ def create_pyramid_level(data, years, level, target_size):
     level_dir = OUTPUT_DIR / str(level)
     level_dir.mkdir(parents=True, exist_ok=True)
 
-    # Resample each year/month
-    resampled = np.zeros((n_years, n_months, target_size, target_size * 2), dtype=np.float32)
-
-    for y in range(n_years):
-        for m in range(n_months):
-            resampled[y, m] = zoom(data[y, m], (lat_factor, lon_factor), order=1)
+    # Resample all years/months together, interpolating the spatial axes only
+    resampled = resample_bilinear(data, target_size, target_size * 2).astype(np.float32, copy=False)
 
     print(f"  Resampled shape: {resampled.shape}")
     print(f"  Value range: {np.nanmin(resampled):.1f} to {np.nanmax(resampled):.1f} W/m²")
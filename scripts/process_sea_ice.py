@@ -31,6 +31,24 @@ PYRAMID_LEVELS = {
 XMIN, YMIN, XMAX, YMAX = -20037508.34, -20037508.34, 20037508.34, 20037508.34
 
 
+def nearest_index(coords, values):
+    """Index of the nearest entry of a monotonic 1-D axis for each value.
+
+    Matches np.argmin(np.abs(coords - v)) per value, including picking the
+    lower index on ties.
+    """
+    ascending = coords[0] <= coords[-1]
+    axis = coords if ascending else coords[::-1]
+    idx = np.clip(np.searchsorted(axis, values), 1, len(axis) - 1)
+    left_dist = values - axis[idx - 1]
+    right_dist = axis[idx] - values
+    if ascending:
+        idx -= left_dist <= right_dist
+        return idx
+    idx -= left_dist < right_dist
+    return len(axis) - 1 - idx
+
+
 def process_sea_ice():
     print("="*60)
     print("PROCESSING SEA ICE CONCENTRATION DATA")
@@ -68,33 +86,16 @@ def process_sea_ice():
         rp_data = np.full((size, size), np.nan, dtype=np.float32)
 
         # Map source data to target grid
-        # For each source pixel, find nearest target pixel
-        valid_count = 0
-        for i in range(data_array.shape[0]):
-            for j in range(data_array.shape[1]):
-                src_lat = lat[i, j]
-                src_lon = lon[i, j]
-                val = data_array[i, j]
-
-                # Skip invalid
-                if np.isnan(src_lat) or np.isnan(src_lon) or np.isnan(val):
-                    continue
-                if val <= 0:
-                    continue
-
-                # Skip if outside Web Mercator lat limits
-                if src_lat > 85 or src_lat < -85:
-                    continue
-
-                # Find nearest target pixel
-                lon_idx = np.argmin(np.abs(lon_target - src_lon))
-                lat_idx = np.argmin(np.abs(lat_target - src_lat))
-
-                if 0 <= lat_idx < size and 0 <= lon_idx < size:
-                    # Use max value if multiple source pixels map to same target
-                    if np.isnan(rp_data[lat_idx, lon_idx]) or val > rp_data[lat_idx, lon_idx]:
-                        rp_data[lat_idx, lon_idx] = val
-                        valid_count += 1
+        # Each source pixel goes to its nearest target pixel, located by
+        # binary search on the (monotonic) target axes in one vectorised pass
+        valid = (~np.isnan(lat) & ~np.isnan(lon) & (data_array > 0)
+                 & (lat <= 85) & (lat >= -85))
+        lon_idx = nearest_index(lon_target, lon[valid])
+        lat_idx = nearest_index(lat_target, lat[valid])
+
+        # Use max value if multiple source pixels map to same target
+        np.fmax.at(rp_data, (lat_idx, lon_idx), data_array[valid])
+        valid_count = int(valid.sum())
 
         print(f"    Mapped {valid_count} pixels")
 
@@ -35,6 +35,9 @@ PYRAMID_LEVELS = {
 POLAR_CRS = "EPSG:3413"
 XMIN, YMIN, XMAX, YMAX = -3850000, -5350000, 3750000, 5850000
 
+# Fill value for status_flag once stored as uint8 (not a valid flag combination)
+STATUS_FLAG_FILL = 255
+
 
 def load_sea_ice_with_quality(nc_file):
     """Load sea ice data including quality/uncertainty variables."""
@@ -147,7 +150,13 @@ def process_with_quality():
         # Build dataset with all variables
         data_vars = {}
         for var_name, time_data in processed.items():
-            data_vars[var_name] = (['time', 'y', 'x'], time_data.astype(np.float32))
+            if var_name == 'status_flag':
+                # Flags are small categorical bytes: store as uint8 (a quarter
+                # of float32) with STATUS_FLAG_FILL marking cells off the grid
+                time_data = np.where(np.isnan(time_data), STATUS_FLAG_FILL, time_data).astype(np.uint8)
+            else:
+                time_data = time_data.astype(np.float32)
+            data_vars[var_name] = (['time', 'y', 'x'], time_data)
 
         result = xr.Dataset(data_vars)
 
@@ -175,7 +184,7 @@ def process_with_quality():
             result['status_flag'].attrs = {
                 'long_name': 'Status Flag',
                 'flag_meanings': 'land lake open_water_filtered land_spill_over high_t2m spatial_interp temporal_interp max_ice_climo',
-                '_FillValue': np.nan,
+                '_FillValue': STATUS_FLAG_FILL,
             }
 
         result.attrs['crs'] = POLAR_CRS
@@ -45,15 +45,34 @@ def lon_to_webmercator_x(lon):
     return lon * 6378137.0 * np.pi / 180.0
 
 
-def reproject_slice_to_webmercator(data_latlon, src_lats, src_lons, target_size):
-    """
-    Reproject a 2D array from lat/lon to Web Mercator.
+def nearest_indices(grid, points):
+    """Nearest-neighbour index into a monotonic 1D grid, or -1 outside it.
 
-    Web Mercator can't represent latitudes beyond ~85.06 degrees,
-    so we clip and interpolate.
+    Ties go to the lower latitude/longitude, matching RegularGridInterpolator's
+    'nearest' on the ascending grid. A descending grid is searched through a
+    reversed view and the indices mapped back, so callers can gather from the
+    data in its stored row order.
+    """
+    descending = grid[0] > grid[-1]
+    if descending:
+        grid = grid[::-1]
+    i = np.clip(np.searchsorted(grid, points) - 1, 0, len(grid) - 2)
+    frac = (points - grid[i]) / (grid[i + 1] - grid[i])
+    idx = np.where(frac <= 0.5, i, i + 1)
+    if descending:
+        idx = len(grid) - 1 - idx
+    idx[(points < grid[0]) | (points > grid[-1])] = -1
+    return idx
+
+
+def webmercator_sample_indices(src_lats, src_lons, target_size):
+    """Source row/column behind each Web Mercator output row/column.
+
+    Web Mercator can't represent latitudes beyond ~85.06 degrees, so the
+    target grid is clipped to 85. Rows depend only on latitude and columns
+    only on longitude, so the nearest-neighbour lookup (to preserve fire
+    locations) is separable and the same for every slice of a level.
     """
-    from scipy.interpolate import RegularGridInterpolator
-
     # Target Web Mercator coordinates
     # Use slightly smaller bounds to avoid edge issues (equivalent to ~85 degrees)
     max_y = lat_to_webmercator_y(85.0)
@@ -64,36 +83,22 @@ def reproject_slice_to_webmercator(data_latlon, src_lats, src_lons, target_size)
     target_lons = target_x * 180.0 / (6378137.0 * np.pi)
     target_lats = np.degrees(2 * np.arctan(np.exp(target_y / 6378137.0)) - np.pi/2)
 
-    # Create interpolator from source lat/lon grid
-    # Note: source lats go from 89.875 to -89.875 (north to south)
-    # scipy expects ascending order, so we flip
-    if src_lats[0] > src_lats[-1]:
-        src_lats_asc = src_lats[::-1]
-        data_flipped = data_latlon[::-1, :]
-    else:
-        src_lats_asc = src_lats
-        data_flipped = data_latlon
-
-    # Replace NaN with 0 for interpolation (fire data - 0 means no fire)
-    data_clean = np.nan_to_num(data_flipped, nan=0.0)
-
-    # Create interpolator
-    interp = RegularGridInterpolator(
-        (src_lats_asc, src_lons),
-        data_clean,
-        method='nearest',  # Use nearest to preserve fire locations
-        bounds_error=False,
-        fill_value=0.0
-    )
+    return nearest_indices(src_lats, target_lats), nearest_indices(src_lons, target_lons)
 
-    # Create mesh of target coordinates
-    target_lon_grid, target_lat_grid = np.meshgrid(target_lons, target_lats)
-    target_points = np.column_stack([target_lat_grid.ravel(), target_lon_grid.ravel()])
 
-    # Interpolate
-    result = interp(target_points).reshape(target_size, target_size)
+def reproject_slice_to_webmercator(data_latlon, rows, cols):
+    """
+    Reproject a 2D array from lat/lon to Web Mercator, sampling the source
+    rows/columns given by webmercator_sample_indices.
+    """
+    result = data_latlon[np.ix_(rows, cols)]
 
-    return result.astype(np.float32), target_x, target_y
+    # Replace NaN with 0 (fire data - 0 means no fire), likewise off-grid samples
+    np.nan_to_num(result, copy=False, nan=0.0)
+    result[rows < 0, :] = 0.0
+    result[:, cols < 0] = 0.0
+
+    return result.astype(np.float32, copy=False)
 
 
 def read_existing_pyramid_level(level):
@@ -258,18 +263,20 @@ def main():
 
         out_arr, out_x, out_y = create_output_level(level, target_size, years, src_info)
 
+        # Sample indices are shared by every slice of the level
+        rows, cols = webmercator_sample_indices(
+            src_info['y'],  # lat coordinates (89.875 to -89.875)
+            src_info['x'],  # lon coordinates (-179.875 to 179.875)
+            target_size
+        )
+
         for yi, year in enumerate(years):
             for mi in range(12):
                 # Get source slice
                 src_slice = all_data[yi, mi, :, :]
 
                 # Reproject
-                reproj, _, _ = reproject_slice_to_webmercator(
-                    src_slice,
-                    src_info['y'],  # lat coordinates (89.875 to -89.875)
-                    src_info['x'],  # lon coordinates (-179.875 to 179.875)
-                    target_size
-                )
+                reproj = reproject_slice_to_webmercator(src_slice, rows, cols)
 
                 out_arr[yi, mi, :, :] = reproj
 
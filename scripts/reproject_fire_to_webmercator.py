@@ -33,6 +33,19 @@ PYRAMID_LEVELS = {
     4: 2048,  # Finest
 }
 
+def time_index_by_month(times):
+    """Map (year, month) to the first matching time index.
+
+    Years and months are derived once from the datetime64 values instead of
+    string-formatting every timestamp for each year/month lookup.
+    """
+    months = np.asarray(times).astype('datetime64[M]').astype(np.int64)
+    index = {}
+    for i, m in enumerate(months.tolist()):
+        index.setdefault((1970 + m // 12, m % 12 + 1), i)
+    return index
+
+
 def load_fire_data():
     """Load all fire NetCDF files and combine into a single dataset."""
     fire_dir = '/Users/garfieldconnolly/Desktop/ECMWF-POC/data/fire'
@@ -125,7 +138,8 @@ def create_pyramid_level(data, level, size, output_path):
     y_arr[:] = y_vals
 
     # Get unique years
-    years = sorted(set([int(str(t)[:4]) for t in data.time.values]))
+    month_index = time_index_by_month(data.time.values)
+    years = sorted({year for year, _ in month_index})
     n_years = len(years)
 
     # Save year array
@@ -172,12 +186,10 @@ def create_pyramid_level(data, level, size, output_path):
     for yi, year in enumerate(years):
         for month in range(1, 13):
             # Find data for this year/month
-            time_str = f"{year}-{month:02d}"
-            matching = [i for i, t in enumerate(data.time.values)
-                       if str(t)[:7] == time_str]
+            time_idx = month_index.get((year, month))
 
-            if matching:
-                slice_data = data.isel(time=matching[0])
+            if time_idx is not None:
+                slice_data = data.isel(time=time_idx)
 
                 # Reproject this slice
                 reproj = reproject_to_webmercator(slice_data, size)
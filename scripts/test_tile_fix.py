@@ -2,6 +2,7 @@
 """Test tile seam fix by regenerating boundary tiles."""
 
 import math
+from functools import lru_cache
 from pathlib import Path
 import warnings
 import numpy as np
@@ -21,6 +22,7 @@ DATA_PATH = BASE_DIR / "data" / "processed" / "era5_land.zarr"
 
 COLORMAP = "RdYlBu_r"
 DPI = 256
+PNG_COMPRESS_LEVEL = 1  # Same fast zlib level as the tile generators
 
 def tile_bounds(z, x, y):
     n = 2 ** z
@@ -31,6 +33,12 @@ def tile_bounds(z, x, y):
     return lon_min, lon_max, lat_min, lat_max
 
 
+@lru_cache(maxsize=None)
+def get_colormap(name):
+    """Resolve a matplotlib colormap once rather than copying it per tile."""
+    return matplotlib.colormaps[name]
+
+
 def generate_tile(variable, time_idx, zoom, x, y, ds, use_buffer=True):
     """Generate a single tile."""
     data = ds[variable].isel(time=time_idx).values
@@ -68,7 +76,7 @@ def generate_tile(variable, time_idx, zoom, x, y, ds, use_buffer=True):
     ax.pcolormesh(
         lons, lats, values,
         transform=ccrs.PlateCarree(),
-        cmap=COLORMAP,
+        cmap=get_colormap(COLORMAP),
         vmin=vmin, vmax=vmax,
         shading='gouraud',
         rasterized=True,
@@ -85,7 +93,8 @@ def generate_tile(variable, time_idx, zoom, x, y, ds, use_buffer=True):
     suffix = "_buffered" if use_buffer else "_nobuffer"
     tile_path = TILES_DIR / f"{variable}_{time_idx}_z{zoom}_x{x}_y{y}{suffix}.png"
     tile_path.parent.mkdir(parents=True, exist_ok=True)
-    fig.savefig(tile_path, dpi=DPI, pad_inches=0, transparent=False, facecolor='#1a1a2e')
+    fig.savefig(tile_path, dpi=DPI, pad_inches=0, transparent=False, facecolor='#1a1a2e',
+                pil_kwargs={'compress_level': PNG_COMPRESS_LEVEL})
     plt.close(fig)
 
     print(f"Generated: {tile_path.name}")
@@ -7,11 +7,103 @@ Serves files at /zarr/ prefix for frontend compatibility.
 import http.server
 import socketserver
 from pathlib import Path
+from collections import OrderedDict
+from functools import lru_cache
+import gzip
+import hashlib
 import json
+import mmap
+import os
 
 PORT = 8000
 DIRECTORY = Path(__file__).parent.parent / "data" / "pyramids"
 
+# Pyramid builds rewrite chunks and metadata at the same paths, so browsers
+# revalidate every file; unchanged ones come back as a 304 via the ETag.
+CACHE_CONTROL = 'no-cache'
+METADATA_FILES = {'.zarray', '.zattrs', '.zgroup', '.zmetadata', 'zarr.json'}
+# Uncompressed chunks above this size are sent raw to keep the gzip cache small
+GZIP_MAX_CHUNK_BYTES = 1 << 20
+# Total compressed bytes kept in memory; least recently used bodies go first
+GZIP_CACHE_MAX_BYTES = 64 << 20
+
+# Root API info never changes, so it is encoded once rather than per request
+ROOT_INFO_BODY = json.dumps({
+    "status": "ok",
+    "message": "Zarr pyramid server",
+    "endpoints": {
+        "zarr": "/zarr/<dataset>/<level>"
+    }
+}).encode()
+
+
+def map_file(f, size):
+    """Memory-map an open file read-only (empty files cannot be mapped)."""
+    if size == 0:
+        return memoryview(b'')
+    return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+@lru_cache(maxsize=16384)
+def file_etag(path, mtime_ns, size):
+    """ETag for a file, keyed on mtime/size so rebuilds invalidate.
+
+    Only the tag is cached; bodies are served from the OS page cache via
+    mmap, so hot chunks cost no Python heap and are shared between processes.
+    """
+    with open(path, 'rb') as f, map_file(f, size) as body:
+        return '"' + hashlib.blake2b(body, digest_size=8).hexdigest() + '"'
+
+
+gzip_cache = OrderedDict()
+gzip_cache_bytes = 0
+
+
+def gzipped_file(path, mtime_ns, size):
+    """Gzip-compressed body of a small file, compressed once per version.
+
+    Used for Zarr metadata, which is JSON and shrinks several-fold, and for
+    chunks of arrays stored without a compressor (e.g. coordinate arrays).
+    Chunks that already carry a Zarr codec are sent as-is. Bodies are kept
+    in an LRU bounded by total bytes rather than entry count, as raw chunks
+    can be up to GZIP_MAX_CHUNK_BYTES each.
+    """
+    global gzip_cache_bytes
+    key = (path, mtime_ns, size)
+    body = gzip_cache.get(key)
+    if body is not None:
+        gzip_cache.move_to_end(key)
+        return body
+
+    with open(path, 'rb') as f:
+        body = gzip.compress(f.read(), mtime=0)
+    gzip_cache[key] = body
+    gzip_cache_bytes += len(body)
+    while gzip_cache_bytes > GZIP_CACHE_MAX_BYTES and len(gzip_cache) > 1:
+        _, evicted = gzip_cache.popitem(last=False)
+        gzip_cache_bytes -= len(evicted)
+    return body
+
+
+@lru_cache(maxsize=4096)
+def array_is_uncompressed(zarray_path, mtime_ns):
+    """Whether a Zarr v2 array writes its chunks raw (no compressor or filters)."""
+    with open(zarray_path) as f:
+        meta = json.load(f)
+    return meta.get('compressor') is None and not meta.get('filters')
+
+
+def is_raw_chunk(path, size):
+    """Whether a file is a small chunk of an uncompressed Zarr v2 array."""
+    if size > GZIP_MAX_CHUNK_BYTES:
+        return False
+    zarray_path = os.path.join(os.path.dirname(path), '.zarray')
+    try:
+        mtime_ns = os.stat(zarray_path).st_mtime_ns
+    except OSError:
+        return False
+    return array_is_uncompressed(zarray_path, mtime_ns)
+
 
 class CORSRequestHandler(http.server.SimpleHTTPRequestHandler):
     def __init__(self, *args, **kwargs):
@@ -41,17 +133,54 @@ class CORSRequestHandler(http.server.SimpleHTTPRequestHandler):
             # Return API info JSON
             self.send_response(200)
             self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(ROOT_INFO_BODY)))
             self.end_headers()
-            info = {
-                "status": "ok",
-                "message": "Zarr pyramid server",
-                "endpoints": {
-                    "zarr": "/zarr/<dataset>/<level>"
-                }
-            }
-            self.wfile.write(json.dumps(info).encode())
+            self.wfile.write(ROOT_INFO_BODY)
+            return
+
+        path = self.translate_path(self.path.partition('?')[0])
+        if not os.path.isfile(path):
+            super().do_GET()
             return
-        super().do_GET()
+
+        st = os.stat(path)
+        etag = file_etag(path, st.st_mtime_ns, st.st_size)
+        is_metadata = os.path.basename(path) in METADATA_FILES
+
+        compressible = is_metadata or is_raw_chunk(path, st.st_size)
+
+        gzip_body = None
+        if compressible and 'gzip' in self.headers.get('Accept-Encoding', ''):
+            gzip_body = gzipped_file(path, st.st_mtime_ns, st.st_size)
+            # Distinct tag per representation
+            etag = etag[:-1] + '-gzip"'
+
+        if self.headers.get('If-None-Match') == etag:
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.send_header('Cache-Control', CACHE_CONTROL)
+            if compressible:
+                self.send_header('Vary', 'Accept-Encoding')
+            self.end_headers()
+            return
+
+        self.send_response(200)
+        self.send_header('Content-Type', self.guess_type(path))
+        self.send_header('ETag', etag)
+        self.send_header('Cache-Control', CACHE_CONTROL)
+        if compressible:
+            self.send_header('Vary', 'Accept-Encoding')
+        if gzip_body is not None:
+            self.send_header('Content-Encoding', 'gzip')
+            self.send_header('Content-Length', str(len(gzip_body)))
+            self.end_headers()
+            self.wfile.write(gzip_body)
+            return
+
+        self.send_header('Content-Length', str(st.st_size))
+        self.end_headers()
+        with open(path, 'rb') as f, map_file(f, st.st_size) as body:
+            self.wfile.write(body)
 
 
 if __name__ == "__main__":